@@ -0,0 +1,94 @@
+import argparse
+import json
+from importlib import metadata
+import platform
+import random
+import re
+import statistics
+import sys
+from datetime import datetime, timezone
+from time import perf_counter
+
+from .cases import CASES
+
+
+def run_case(name, rounds, scale):
+    spec = CASES[name]
+    number = max(1, int(spec['number'] * scale))
+    timings = []
+    for round_number in range(rounds):
+        random.seed(round_number)
+        function, arguments = spec['prepare'](number)
+        started = perf_counter()
+        for args in arguments:
+            function(*args)
+        timings.append((perf_counter() - started) / number)
+    return dict(name=name, params=spec['params'], number=number, rounds=rounds, min=min(timings),
+                median=statistics.median(timings), mean=statistics.mean(timings),
+                stdev=statistics.stdev(timings) if rounds > 1 else 0.0)
+
+
+def package_version():
+    try:
+        return metadata.version('seawar_skeleton')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def compare(results, baseline, threshold):
+    previous = {bench['name']: bench for bench in baseline['benchmarks']}
+    regressions = []
+    for bench in results['benchmarks']:
+        if bench['name'] in previous:
+            ratio = bench['min'] / previous[bench['name']]['min']
+            bench['ratio'] = ratio
+            if ratio > threshold:
+                regressions.append(bench['name'])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-o', '--output', help='write JSON results to this file')
+    parser.add_argument('-k', '--filter', default='', help='regular expression selecting case names')
+    parser.add_argument('-r', '--rounds', type=int, default=5)
+    parser.add_argument('-s', '--scale', type=float, default=1.0, help='multiplier for iterations per round')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=1.2, help='slowdown ratio reported as regression')
+    parser.add_argument('--list', action='store_true')
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if re.search(args.filter, name)]
+    if args.list:
+        print('\n'.join(names))
+        return 0
+
+    results = dict(
+        meta=dict(python=platform.python_version(), implementation=platform.python_implementation(),
+                  machine=platform.machine(), platform=platform.platform(),
+                  version=package_version(),
+                  date=datetime.now(timezone.utc).isoformat(timespec='seconds')),
+        benchmarks=[])
+    for name in names:
+        bench = run_case(name, args.rounds, args.scale)
+        results['benchmarks'].append(bench)
+        print(f'{name:<32}{bench["min"] * 1e6:>14.2f} us  (median {bench["median"] * 1e6:.2f} us)',
+              file=sys.stderr)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(results, json.load(baseline), args.threshold)
+        for name in regressions:
+            print(f'REGRESSION {name}', file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+import random
+from timeit import repeat
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.seaplayground import SeaField, SeaPlayground
+
+
+def placed(field_class, size):
+    random.seed(size)
+    field = field_class(size, size)
+    SeaPlayground.put_ships_random(field, [4, 3, 3, 2, 2, 2, 1, 1, 1, 1] * (size // 10) ** 2)
+    return field
+
+
+CASES = {
+    'put_ships_random': lambda field_class, size: lambda: placed(field_class, size),
+    'is_cell_suitable': lambda field_class, size: (
+        lambda field=placed(field_class, size): [field.is_cell_suitable(x, y, 3) for x, y in field.cells]),
+    'get_suitable_cells': lambda field_class, size: (
+        lambda: [field_class(size, size).suitable_cells(length) for length in (1, 2, 3, 4)]),
+    'find_ship_by_cells': lambda field_class, size: (
+        lambda field=placed(field_class, size): [field.find_ship_by_cells(x, y) for x, y in field.cells]),
+    'set_border': lambda field_class, size: (
+        lambda field=field_class(size, size): [field.set_border(x, y, 3) for x, y in field.cells]),
+}
+
+
+def main(sizes=(10, 30), number=5):
+    print(f'{"case":<20}{"size":>6}{"SeaField ms":>14}{"BitSeaField ms":>16}')
+    for name, case in CASES.items():
+        for size in sizes:
+            timings = [min(repeat(case(field_class, size), number=number, repeat=3)) / number * 1000
+                       for field_class in (SeaField, BitSeaField)]
+            print(f'{name:<20}{size:>6}{timings[0]:>14.3f}{timings[1]:>16.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+import subprocess
+import sys
+from functools import partial
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.journal import ChangeJournal
+from seawar_skeleton.seaplayground import STANDARD_SHIP_FLEET, SIGNALS, Cell, Matrix, SeaField, SeaPlayground, \
+    ComputerPlayer
+from seawar_skeleton.simulation import play_game
+
+
+CASES = {}
+
+
+def case(name, number=100, **params):
+    def register(prepare):
+        CASES[name] = dict(prepare=prepare, number=number, params=params)
+        return prepare
+    return register
+
+
+def placed_field(max_x=10, max_y=10, fleet=None):
+    field = SeaField(max_x, max_y)
+    SeaPlayground.put_ships_random(field, fleet)
+    return field
+
+
+def played_computer(shots):
+    enemy_field, comp = placed_field(), ComputerPlayer()
+    for _ in range(shots):
+        SeaPlayground.make_shoot_by_computer(comp, enemy_field)
+    return comp
+
+
+for size, number in ((10, 1000), (100, 100), (1000, 5)):
+    case(f'matrix_init_{size}', number, max_x=size, max_y=size)(
+        lambda number, size=size: (Matrix, [(size, size)] * number))
+
+for size in (10, 100):
+    case(f'seafield_init_{size}', 200, max_x=size, max_y=size)(
+        lambda number, size=size: (SeaField, [(size, size)] * number))
+
+
+@case('put_ships_random_standard', 100, fleet='standard')
+def _(number):
+    return SeaPlayground.put_ships_random, [(SeaField(),) for _ in range(number)]
+
+
+@case('put_ships_random_standard_bitboard', 100, fleet='standard')
+def _(number):
+    return SeaPlayground.put_ships_random, [(BitSeaField(),) for _ in range(number)]
+
+
+@case('put_ships_random_large', 3, max_x=100, max_y=100, fleet='standard*20')
+def _(number):
+    return SeaPlayground.put_ships_random, [(SeaField(100, 100), STANDARD_SHIP_FLEET * 20) for _ in range(number)]
+
+
+@case('get_suitable_cells_fresh', 100, lengths='1-4')
+def _(number):
+    return (lambda field: [SeaPlayground.get_suitable_cells(field, length) for length in (1, 2, 3, 4)],
+            [(SeaField(),) for _ in range(number)])
+
+
+@case('get_suitable_cells_placed', 100, lengths='1-4')
+def _(number):
+    return (lambda field: [SeaPlayground.get_suitable_cells(field, length) for length in (1, 2, 3, 4)],
+            [(placed_field(fleet=[4, 3, 3, 2]),) for _ in range(number)])
+
+
+def shoot_case(kind):
+    def prepare(number):
+        states = []
+        for _ in range(number):
+            field = SeaField()
+            SeaPlayground.put_ship(field, 1, 1, 2)
+            SeaPlayground.put_ship(field, 5, 5, 1)
+            if kind in ('kill', 'win'):
+                field.set(1, 1, Cell.HIT)
+            if kind == 'kill':
+                SeaPlayground.put_ship(field, 8, 8, 1)
+            states.append((field, *dict(hit=(1, 1), miss=(0, 9), kill=(2, 1), win=(2, 1))[kind]))
+            if kind == 'win':
+                field.set(5, 5, Cell.HIT)
+        return SeaPlayground.income_shoot_to, states
+    return prepare
+
+
+for kind in ('hit', 'miss', 'kill', 'win'):
+    case(f'income_shoot_to_{kind}', 1000, signal=kind)(shoot_case(kind))
+
+
+@case('shoot_many_board', 100, shots=100)
+def _(number):
+    coords = [(x, y) for y in range(10) for x in range(10)]
+    xs, ys = [x for x, _ in coords], [y for _, y in coords]
+    return SeaPlayground.shoot_many, [(placed_field(), xs, ys) for _ in range(number)]
+
+
+@case('income_shoot_to_board', 100, shots=100)
+def _(number):
+    coords = [(x, y) for y in range(10) for x in range(10)]
+    return (lambda field: [SeaPlayground.income_shoot_to(field, x, y) for x, y in coords],
+            [(placed_field(),) for _ in range(number)])
+
+
+@case('handle_shoot_answer', 1000)
+def _(number):
+    answers = [(SIGNALS.MISS, [(0, 0)]), (SIGNALS.HITTING, [(4, 4)]), (SIGNALS.KILLED, [(7, 1), (7, 2), (7, 3)])]
+    return (lambda comp, answer: comp.handle_shoot_answer(*answer),
+            [(ComputerPlayer(), answers[index % 3]) for index in range(number)])
+
+
+@case('select_target', 500, shots=30)
+def _(number):
+    comp = played_computer(30)
+    return comp.select_target, [()] * number
+
+
+@case('self_play_game', 10)
+def _(number):
+    return play_game, [()] * number
+
+
+@case('cli_startup', 5)
+def _(number):
+    command = [sys.executable, '-m', 'seawar_skeleton.cli', 'play', '--seed', '0']
+    return partial(subprocess.run, check=True, capture_output=True), [(command,)] * number
+
+
+@case('journal_shot_delta', 100, shots=100)
+def _(number):
+    def play(field):
+        journal = ChangeJournal(field)
+        for y in range(10):
+            for x in range(10):
+                version = journal.version
+                SeaPlayground.income_shoot_to(field, x, y)
+                journal.delta(version)
+    return play, [(placed_field(),) for _ in range(number)]
+
+
+@case('seafield_fork_shot', 1000)
+def _(number):
+    field = placed_field()
+    return (lambda: SeaPlayground.income_shoot_to(field.fork(), 4, 4)), [()] * number
+
+
+@case('seafield_checkpoint_rollback', 1000, shots=5)
+def _(number):
+    field = placed_field()
+
+    def explore():
+        field.checkpoint()
+        for coord_x in range(5):
+            SeaPlayground.income_shoot_to(field, coord_x, 4)
+        field.rollback()
+    return explore, [()] * number
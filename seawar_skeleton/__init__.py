@@ -1,2 +1,38 @@
-from .seaplayground import STANDARD_SHIP_FLEET, SIGNALS, IncorrectShipPosition, NoSpaceLeft, IncorrectCoordinate, \
-    Cell, Matrix, SeaField, SeaPlayground, ComputerPlayer
+from importlib import import_module
+
+
+_EXPORTS = {
+    'seaplayground': ('STANDARD_SHIP_FLEET', 'SIGNALS', 'IncorrectShipPosition', 'NoSpaceLeft', 'IncorrectCoordinate',
+                      'Cell', 'Matrix', 'SeaField', 'SeaPlayground', 'RandomTargeting', 'Player', 'ComputerPlayer'),
+    'bitboard': ('BitMatrix', 'BitSeaField'),
+    'sparse': ('SparseSeaField',),
+    'geometry': ('Geometry',),
+    'targeting': ('DensityTargeting', 'MonteCarloTargeting', 'SparseTargeting'),
+    'simulation': ('ShotStats', 'simulate'),
+    'tournament': ('Tournament',),
+    'enumeration': ('LayoutSpace', 'count_layouts', 'occupancy_probabilities', 'enumerate_layouts'),
+    'sampler': ('LayoutSampler',),
+    'bulk': ('put_ships_random_bulk',),
+    'snapshot': ('BoardArchive',),
+    'replay': ('ReplayWriter', 'read_games'),
+    'journal': ('ChangeJournal', 'apply_delta'),
+    'server': ('GameServer', 'GameClient'),
+    'instrumentation': ('Profiler',),
+}
+# need numpy; reachable as attributes but kept out of star imports
+_OPTIONAL = ('put_ships_random_bulk',)
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [name for name in _MODULES if name not in _OPTIONAL]
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'.{_MODULES[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,178 @@
+from random import randrange
+
+from .seaplayground import DEFAULT_MAX_X, DEFAULT_MAX_Y, Cell, Matrix, SeaField
+
+
+def iter_bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitMatrix(Matrix):
+    VALUES = (Cell.BORDER, Cell.SHIP, Cell.HIT, Cell.MISSED, Cell.PROBABLY_SHIP)
+
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, data=None):
+        self.max_x = max_x
+        self.max_y = max_y
+        self._masks = dict.fromkeys(self.VALUES, 0)
+        self._board = (1 << (max_x * max_y)) - 1
+        self._first_column = sum(1 << (row * max_x) for row in range(max_y))
+        self._last_column = self._first_column << (max_x - 1)
+        if data is not None:
+            for index in range(max_x * max_y):
+                if data[index] != Cell.EMPTY:
+                    self._masks[data[index]] |= 1 << index
+
+    def __sizeof__(self):
+        return (object.__sizeof__(self) + self.__dict__.__sizeof__() + self._masks.__sizeof__() +
+                sum(mask.__sizeof__() for mask in self._masks.values()))
+
+    def _copy_data(self):
+        self._masks = dict(self._masks)
+
+    def clear(self):
+        self._masks = dict.fromkeys(self.VALUES, 0)
+
+    def get(self, coord_x, coord_y):
+        return self.get_at(coord_y * self.max_x + coord_x)
+
+    def get_at(self, index):
+        for value, mask in self._masks.items():
+            if mask >> index & 1:
+                return value
+        return Cell.EMPTY
+
+    def set_at(self, index, value):
+        if value != Cell.EMPTY and value not in self._masks:
+            raise ValueError(f'{value} can not be stored in {self!r}')
+        bit = 1 << index
+        for key, mask in self._masks.items():
+            if mask & bit:
+                self._masks[key] = mask ^ bit
+        if value != Cell.EMPTY:
+            self._masks[value] |= bit
+
+    def filled(self):
+        return sorted((index, value) for value, mask in self._masks.items() for index in iter_bits(mask))
+
+    def mask(self, *values):
+        out = 0
+        for value in values:
+            out |= self._masks[value]
+        return out
+
+    def cells_of(self, mask):
+        return [self.coord(index) for index in iter_bits(mask)]
+
+    def _shift(self, mask, shift_x, shift_y):
+        if shift_x > 0:
+            mask = (mask & ~self._last_column) << 1
+        elif shift_x < 0:
+            mask = (mask & ~self._first_column) >> 1
+        if shift_y > 0:
+            mask <<= self.max_x
+        elif shift_y < 0:
+            mask >>= self.max_x
+        return mask & self._board
+
+    def _dilate(self, mask):
+        row = mask | self._shift(mask, 1, 0) | self._shift(mask, -1, 0)
+        return row | self._shift(row, 0, 1) | self._shift(row, 0, -1)
+
+
+class BitSeaField(SeaField, BitMatrix):
+    OCCUPIED_VALUES = (Cell.BORDER, Cell.SHIP, Cell.HIT, Cell.MISSED)
+
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, data=None):
+        super().__init__(max_x, max_y, data)
+        self._patterns = {}
+
+    def has_any_alive_ship(self):
+        return self._masks[Cell.SHIP] != 0
+
+    def ship_mask(self, coord_x, coord_y, length, is_vertical=False):
+        if not (self.is_coord_correct(coord_x, coord_y) and
+                self.is_coord_correct(coord_x + (length - 1) * (not is_vertical),
+                                      coord_y + (length - 1) * is_vertical)):
+            return None
+        return self._ship_pattern(length, is_vertical) << self.index(coord_x, coord_y)
+
+    def _ship_pattern(self, length, is_vertical):
+        key = (length, is_vertical)
+        if key not in self._patterns:
+            step = self.max_x if is_vertical else 1
+            self._patterns[key] = sum(1 << (step * position) for position in range(length))
+        return self._patterns[key]
+
+    def is_cell_suitable(self, coord_x, coord_y, length, is_vertical=False):
+        ship = self.ship_mask(coord_x, coord_y, length, is_vertical)
+        return ship is not None and not ship & self.mask(*self.OCCUPIED_VALUES)
+
+    def suitable_mask(self, length, is_vertical=False):
+        limit = self.max_y if is_vertical else self.max_x
+        if not 0 < length <= limit:
+            return 0
+        free = self._board & ~self.mask(*self.OCCUPIED_VALUES)
+        step = self.max_x if is_vertical else 1
+        starts = free
+        for position in range(1, length):
+            starts &= free >> (step * position)
+        if is_vertical:
+            return starts & ((1 << ((self.max_y - length + 1) * self.max_x)) - 1)
+        columns = self._first_column * ((1 << (self.max_x - length + 1)) - 1)
+        return starts & columns
+
+    def suitable_cells(self, length):
+        vertical, horizontal = self.suitable_mask(length, True), self.suitable_mask(length, False)
+        return [(*self.coord(index), is_vertical) for index in iter_bits(vertical | horizontal)
+                for is_vertical, mask in ((True, vertical), (False, horizontal)) if mask >> index & 1]
+
+    def random_suitable_cell(self, length, rng=None):
+        vertical, horizontal = self.suitable_mask(length, True), self.suitable_mask(length, False)
+        count_vertical, count_horizontal = bin(vertical).count('1'), bin(horizontal).count('1')
+        if not count_vertical + count_horizontal:
+            return None
+        position = (rng.randrange if rng else randrange)(count_vertical + count_horizontal)
+        mask, is_vertical = (vertical, True) if position < count_vertical else (horizontal, False)
+        position = position if is_vertical else position - count_vertical
+        for index in iter_bits(mask):
+            if not position:
+                return (*self.coord(index), is_vertical)
+            position -= 1
+
+    def find_ship_by_cells(self, coord_x, coord_y):
+        ships = self.mask(Cell.SHIP, Cell.HIT)
+        found = bit = 1 << self.index(coord_x, coord_y) if self.is_coord_correct(coord_x, coord_y) else 0
+        if not ships & bit:
+            return set()
+        for shift_x, shift_y in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            current = bit
+            while current:
+                current = self._shift(current, shift_x, shift_y) & ships
+                found |= current
+        return set(self.cells_of(found))
+
+    def _find_border_cells(self, coord_x, coord_y, length, is_vertical=False):
+        ship = self.ship_mask(coord_x, coord_y, length, is_vertical)
+        if ship is None:
+            return super()._find_border_cells(coord_x, coord_y, length, is_vertical)
+        return self.cells_of(self._dilate(ship) & ~ship)
+
+    def _find_cell_corners(self, coord_x, coord_y):
+        if not self.is_coord_correct(coord_x, coord_y):
+            return super()._find_cell_corners(coord_x, coord_y)
+        return self.cells_of(self._neighbours(coord_x, coord_y, ((-1, -1), (1, -1), (-1, 1), (1, 1))))
+
+    def _find_cell_ribs(self, coord_x, coord_y):
+        if not self.is_coord_correct(coord_x, coord_y):
+            return super()._find_cell_ribs(coord_x, coord_y)
+        return self.cells_of(self._neighbours(coord_x, coord_y, ((-1, 0), (1, 0), (0, -1), (0, 1))))
+
+    def _neighbours(self, coord_x, coord_y, shifts):
+        bit = 1 << self.index(coord_x, coord_y)
+        out = 0
+        for shift_x, shift_y in shifts:
+            out |= self._shift(bit, shift_x, shift_y)
+        return out
@@ -0,0 +1,99 @@
+from random import Random
+
+import numpy as np
+
+from .randomness import GeneratorRandom
+from .seaplayground import STANDARD_SHIP_FLEET, DEFAULT_MAX_X, DEFAULT_MAX_Y, Cell, NoSpaceLeft
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+STREAM_BLOCK = 256
+
+
+def as_generator(rng):
+    if isinstance(rng, GeneratorRandom):
+        return rng.generator
+    if isinstance(rng, Random):
+        return np.random.default_rng(rng.getrandbits(128))
+    if rng is None or isinstance(rng, (int, np.random.Generator)):
+        return np.random.default_rng(rng)
+    raise TypeError(f'{rng!r} is not a random.Random, numpy Generator or int seed')
+
+
+def put_ships_random_bulk(count, fleet=None, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, rng=None, strict=True,
+                          chunk_size=DEFAULT_CHUNK_SIZE):
+    fleet = fleet if fleet else STANDARD_SHIP_FLEET
+    # every STREAM_BLOCK boards draw from their own stream, so chunk_size only trades memory for speed
+    chunk_size = -(-max(chunk_size, 1) // STREAM_BLOCK) * STREAM_BLOCK
+    streams = as_generator(rng).spawn(-(-count // STREAM_BLOCK))
+    boards = np.zeros((count, max_y, max_x), dtype=np.int8)
+    failed = np.zeros(count, dtype=bool)
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        boards[start:stop], failed[start:stop] = _generate(
+            stop - start, fleet, max_x, max_y, streams[start // STREAM_BLOCK:-(-stop // STREAM_BLOCK)])
+    if strict and failed.any():
+        raise NoSpaceLeft(f'{int(failed.sum())} of {count} boards')
+    return boards, failed
+
+
+def _generate(count, fleet, max_x, max_y, streams):
+    boards = np.zeros((count, max_y, max_x), dtype=np.int8)
+    blocked = np.zeros((count, max_y, max_x), dtype=bool)
+    failed = np.zeros(count, dtype=bool)
+    for length in fleet:
+        horizontal = _free_windows(blocked, length, axis=2)
+        vertical = _free_windows(blocked, length, axis=1)
+        candidates = np.concatenate([horizontal.reshape(count, -1), vertical.reshape(count, -1)], axis=1)
+        totals = candidates.sum(axis=1)
+        failed |= totals == 0
+        active = np.flatnonzero(~failed)
+        if not active.size:
+            break
+        sizes = np.bincount(active // STREAM_BLOCK, minlength=len(streams))
+        draws = np.concatenate([stream.random(size) for stream, size in zip(streams, sizes)])
+        picks = (draws * totals[active]).astype(np.int64)
+        chosen = (np.cumsum(candidates[active], axis=1) > picks[:, None]).argmax(axis=1)
+
+        ships = np.zeros_like(blocked)
+        is_horizontal = chosen < horizontal[0].size
+        _mark_ships(ships, active[is_horizontal], chosen[is_horizontal], horizontal.shape[1:], length, axis=2)
+        _mark_ships(ships, active[~is_horizontal], chosen[~is_horizontal] - horizontal[0].size,
+                    vertical.shape[1:], length, axis=1)
+        boards[ships] = Cell.SHIP
+        blocked |= _dilate(ships)
+    boards[blocked & (boards == Cell.EMPTY)] = Cell.BORDER
+    return boards, failed
+
+
+def _free_windows(blocked, length, axis):
+    size = blocked.shape[axis]
+    if length > size:
+        shape = list(blocked.shape)
+        shape[axis] = 0
+        return np.zeros(shape, dtype=bool)
+    padding = [(0, 0)] * blocked.ndim
+    padding[axis] = (1, 0)
+    sums = np.pad(np.cumsum(blocked, axis=axis, dtype=np.int32), padding)
+    upper = np.take(sums, range(length, size + 1), axis=axis)
+    lower = np.take(sums, range(0, size - length + 1), axis=axis)
+    return upper == lower
+
+
+def _mark_ships(ships, boards, positions, shape, length, axis):
+    coord_y, coord_x = np.unravel_index(positions, shape)
+    for step in range(length):
+        if axis == 2:
+            ships[boards, coord_y, coord_x + step] = True
+        else:
+            ships[boards, coord_y + step, coord_x] = True
+
+
+def _dilate(mask):
+    padded = np.pad(mask, ((0, 0), (1, 1), (1, 1)))
+    max_y, max_x = mask.shape[1:]
+    out = np.zeros_like(mask)
+    for shift_y in range(3):
+        for shift_x in range(3):
+            out |= padded[:, shift_y:shift_y + max_y, shift_x:shift_x + max_x]
+    return out
@@ -0,0 +1,92 @@
+import argparse
+import sys
+from importlib import import_module
+
+
+STARTUP_BUDGET = 0.025
+STARTUP_ROUNDS = 10
+STRATEGIES = {
+    'random': None,
+    'density': ('seawar_skeleton.targeting', 'DensityTargeting'),
+    'montecarlo': ('seawar_skeleton.targeting', 'MonteCarloTargeting'),
+    'sparse': ('seawar_skeleton.targeting', 'SparseTargeting'),
+}
+
+
+def load_strategy(name):
+    entry = STRATEGIES[name]
+    return getattr(import_module(entry[0]), entry[1]) if entry else None
+
+
+def measure_startup(argv, rounds=STARTUP_ROUNDS):
+    from subprocess import run
+    from time import perf_counter
+
+    def best(command):
+        timings = []
+        for _ in range(rounds):
+            started = perf_counter()
+            run(command, check=True, capture_output=True)
+            timings.append(perf_counter() - started)
+        return min(timings)
+
+    interpreter = best([sys.executable, '-c', 'pass'])
+    return interpreter, best([sys.executable, '-m', 'seawar_skeleton.cli'] + list(argv)) - interpreter
+
+
+def play(args):
+    from .simulation import play_game
+    print(f'shots: {play_game(args.max_x, args.max_y, strategy=load_strategy(args.strategy), rng=args.seed)}')
+    return 0
+
+
+def simulate(args):
+    import json
+    from .simulation import simulate
+    stats = simulate(args.games, args.workers, args.seed, max_x=args.max_x, max_y=args.max_y,
+                     strategy=load_strategy(args.strategy))
+    print(json.dumps(stats.as_dict(), indent=2))
+    return 0
+
+
+def bench(args):
+    if not args.startup:
+        try:
+            from benchmarks.__main__ import main as benchmarks
+        except ImportError:
+            print('seawar bench runs the benchmarks package of a source checkout; only --startup is installed',
+                  file=sys.stderr)
+            return 2
+        return benchmarks(args.arguments)
+    interpreter, startup = measure_startup(['play', '--seed', '0'], args.rounds)
+    print(f'interpreter {interpreter * 1e3:.2f} ms, seawar play +{startup * 1e3:.2f} ms '
+          f'(budget {args.budget * 1e3:.2f} ms)', file=sys.stderr)
+    return 1 if startup > args.budget else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='seawar')
+    commands = parser.add_subparsers(dest='command', required=True)
+    for name, handler in (('play', play), ('simulate', simulate)):
+        command = commands.add_parser(name)
+        command.set_defaults(handler=handler)
+        command.add_argument('--max-x', type=int, default=10)
+        command.add_argument('--max-y', type=int, default=10)
+        command.add_argument('--seed', type=int)
+        command.add_argument('--strategy', choices=STRATEGIES, default='random')
+    commands.choices['simulate'].add_argument('-n', '--games', type=int, default=1000)
+    commands.choices['simulate'].add_argument('-j', '--workers', type=int, help='0 runs in-process')
+    command = commands.add_parser('bench', help='benchmark cases; remaining arguments go to python -m benchmarks')
+    command.set_defaults(handler=bench)
+    command.add_argument('--startup', action='store_true', help='measure CLI cold start against the budget')
+    command.add_argument('--budget', type=float, default=STARTUP_BUDGET, help='seconds above bare interpreter')
+    command.add_argument('--rounds', type=int, default=STARTUP_ROUNDS)
+    args, arguments = parser.parse_known_args(argv)
+    if arguments and args.command != 'bench':
+        parser.error(f'unrecognized arguments: {" ".join(arguments)}')
+    args.arguments = arguments
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,264 @@
+from collections import Counter
+
+from .seaplayground import STANDARD_SHIP_FLEET, DEFAULT_MAX_X, DEFAULT_MAX_Y, Cell, SeaField
+
+
+WATER = 0
+CLOSED = -1
+WATER_VALUES = (Cell.MISSED, Cell.BORDER)
+
+
+class LayoutSpace:
+
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None, observations=None):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.area = max_x * max_y
+        fleet = Counter(fleet if fleet else STANDARD_SHIP_FLEET)
+        self.lengths = tuple(sorted(fleet))
+        self.fleet = tuple(fleet[length] for length in self.lengths)
+        self.longest = self.lengths[-1]
+        self.options = [self._options(observations, index) for index in range(self.area)]
+        self._slots = {length: slot for slot, length in enumerate(self.lengths)}
+        self._radix = {}
+        radix = 1
+        for length, count in zip(self.lengths, self.fleet):
+            self._radix[length] = radix
+            radix *= count + 1
+        self._size = radix
+        self._full = sum(self._radix[length] * count for length, count in zip(self.lengths, self.fleet))
+        self._keep = {}
+        self._transitions = {}
+        self.width = self.area + 1
+        self.total = None
+        self._feasible = None
+
+    def _options(self, observations, index):
+        if observations is None:
+            return (False, True)
+        value = observations.get_at(index)
+        if value in SeaField.SHIP_VALUES:
+            return (True,)
+        return (False,) if value in WATER_VALUES else (False, True)
+
+    def _initial(self):
+        return (WATER,) * (self.max_x + 1)
+
+    def transition(self, coord_x, profile, ship):
+        key = (coord_x, profile, ship)
+        if key not in self._transitions:
+            self._transitions[key] = self._transition(coord_x, profile, ship)
+        return self._transitions[key]
+
+    def _transition(self, coord_x, profile, ship):
+        last = coord_x == self.max_x - 1
+        above, left = profile[1], profile[-1] if coord_x else WATER
+        profile, taken = list(profile), []
+        if ship:
+            if above < 0 or (coord_x and profile[0]) or (not last and profile[2]):
+                return None
+            if above > 0:
+                value, profile[1] = above + 1, CLOSED
+            elif left > 0:
+                value, profile[-1] = -2, CLOSED
+            elif left < CLOSED:
+                value, profile[-1] = left - 1, CLOSED
+            elif left == WATER:
+                value = 1
+            else:
+                return None
+            if abs(value) > self.longest:
+                return None
+        else:
+            value = WATER
+            if above > 0:
+                taken.append(above)
+                profile[1] = CLOSED
+            if left < CLOSED:
+                taken.append(-left)
+                profile[-1] = CLOSED
+        if last and value < CLOSED:
+            taken.append(-value)
+            value = CLOSED
+        profile.append(value)
+        return tuple(profile[1:]), tuple(taken)
+
+    def finish(self, profile):
+        return tuple(value for value in profile[1:] if value > 0)
+
+    def _masks(self, width):
+        if width not in self._keep:
+            slot = (1 << width) - 1
+            self._keep[width] = {length: sum(slot << (key * width) for key in range(self._size)
+                                             if key // self._radix[length] % (count + 1) < count)
+                                 for length, count in zip(self.lengths, self.fleet)}
+        return self._keep[width]
+
+    def _take(self, poly, taken, width):
+        masks = self._masks(width)
+        for length in taken:
+            if length not in masks:
+                return 0
+            poly = (poly & masks[length]) << (self._radix[length] * width)
+        return poly
+
+    def _coefficient(self, poly, width):
+        return (poly >> (self._full * width)) & ((1 << width) - 1)
+
+    def _advance(self, index, layer):
+        coord_x = index % self.max_x
+        out = {}
+        for profile, poly in layer.items():
+            for ship in self.options[index]:
+                following = self.transition(coord_x, profile, ship)
+                if following is None:
+                    continue
+                value = self._take(poly, following[1], self.width) if following[1] else poly
+                if value:
+                    out[following[0]] = out.get(following[0], 0) + value
+        return out
+
+    def _forward(self, checkpoints=None):
+        layer = {self._initial(): 1}
+        for index in range(self.area):
+            if checkpoints is not None and not index % self.max_x:
+                checkpoints.append(layer)
+            layer = self._advance(index, layer)
+        return layer
+
+    def count(self, max_count=None):
+        # max_count only clamps the result: layouts complete in the last DP layer, so there is no running
+        # total to stop on early. Use layouts(max_count) to stop after max_count complete layouts.
+        width = self.width
+        total = sum(self._coefficient(self._take(poly, self.finish(profile), width), width)
+                    for profile, poly in self._forward().items())
+        return total if max_count is None else min(total, max_count)
+
+    def occupancy(self):
+        width = self.width
+        checkpoints = []
+        following = {profile: self._take(1, self.finish(profile), width) for profile in self._forward(checkpoints)}
+        out = [0] * self.area
+        for row in range(self.max_y - 1, -1, -1):
+            layers = [checkpoints[row]]
+            for coord_x in range(self.max_x - 1):
+                layers.append(self._advance(row * self.max_x + coord_x, layers[-1]))
+            for coord_x in range(self.max_x - 1, -1, -1):
+                index = row * self.max_x + coord_x
+                current = {}
+                for profile, poly in layers.pop().items():
+                    for ship in self.options[index]:
+                        transition = self.transition(coord_x, profile, ship)
+                        after = following.get(transition[0]) if transition else None
+                        if not after:
+                            continue
+                        after = self._take(after, transition[1], width)
+                        current[profile] = current.get(profile, 0) + after
+                        if ship:
+                            out[index] += self._coefficient(poly * after, width)
+                following = current
+        self.total = self._coefficient(following.get(self._initial(), 0), width)
+        return out
+
+    def probabilities(self):
+        occupancy = self.occupancy()
+        return [count / self.total if self.total else 0.0 for count in occupancy]
+
+    def _key(self, remaining):
+        return sum(self._radix[length] * count for length, count in zip(self.lengths, remaining))
+
+    def _remove(self, remaining, taken):
+        remaining = list(remaining)
+        for length in taken:
+            slot = self._slots.get(length)
+            if slot is None or not remaining[slot]:
+                return None
+            remaining[slot] -= 1
+        return tuple(remaining)
+
+    def feasible(self):
+        if self._feasible is None:
+            layers = [[self._initial()]]
+            for index in range(self.area - 1):
+                coord_x = index % self.max_x
+                layers.append(list({transition[0] for profile in layers[-1] for ship in self.options[index]
+                                    for transition in (self.transition(coord_x, profile, ship),) if transition}))
+            following = {}
+            for profile in layers[-1]:
+                for ship in self.options[-1]:
+                    transition = self.transition(self.max_x - 1, profile, ship)
+                    if transition:
+                        following[transition[0]] = self._take(1, self.finish(transition[0]), 1)
+            self._feasible = [following]
+            for index in range(self.area - 1, -1, -1):
+                current = {}
+                for profile in layers[index]:
+                    value = 0
+                    for ship in self.options[index]:
+                        transition = self.transition(index % self.max_x, profile, ship)
+                        after = following.get(transition[0]) if transition else None
+                        if after:
+                            value |= self._take(after, transition[1], 1)
+                    if value:
+                        current[profile] = value
+                self._feasible.append(current)
+                following = current
+            self._feasible.reverse()
+        return self._feasible
+
+    def layouts(self, max_count=None):
+        feasible = self.feasible()
+        if not feasible[0].get(self._initial(), 0) >> self._full & 1:
+            return
+        produced = 0
+        path = []
+        stack = [(self._initial(), self.fleet, iter(self.options[0]))]
+        while stack:
+            index = len(stack) - 1
+            profile, remaining, ships = stack[-1]
+            ship = next(ships, None)
+            if ship is None:
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
+            transition = self.transition(index % self.max_x, profile, ship)
+            following = transition and self._remove(remaining, transition[1])
+            if following is None or not feasible[index + 1].get(transition[0], 0) >> self._key(following) & 1:
+                continue
+            if index + 1 < self.area:
+                path.append(ship)
+                stack.append((transition[0], following, iter(self.options[index + 1])))
+                continue
+            yield self._ships([cell for cell, is_ship in enumerate(path + [ship]) if is_ship])
+            produced += 1
+            if max_count is not None and produced >= max_count:
+                return
+
+    def _ships(self, cells):
+        cells = set(cells)
+        ships = []
+        while cells:
+            start = min(cells)
+            step = self.max_x if start + self.max_x in cells else 1
+            ship = [start]
+            while ship[-1] + step in cells and (step != 1 or (ship[-1] + 1) % self.max_x):
+                ship.append(ship[-1] + step)
+            cells.difference_update(ship)
+            ships.append(SeaField.find_ship_vector([self.coord(index) for index in ship]))
+        return sorted(ships)
+
+    def coord(self, index):
+        return index % self.max_x, index // self.max_x
+
+
+def count_layouts(max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None, observations=None, max_count=None):
+    return LayoutSpace(max_x, max_y, fleet, observations).count(max_count)
+
+
+def occupancy_probabilities(field, fleet=None):
+    return LayoutSpace(field.max_x, field.max_y, fleet, field).probabilities()
+
+
+def enumerate_layouts(max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None, observations=None, max_count=None):
+    return LayoutSpace(max_x, max_y, fleet, observations).layouts(max_count)
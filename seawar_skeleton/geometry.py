@@ -0,0 +1,95 @@
+CORNER_SHIFTS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+RIB_SHIFTS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+MAX_INSTANCES = 16
+CACHE_AREA = 1 << 16
+
+
+class Geometry:
+    _instances = {}
+
+    def __init__(self, max_x, max_y):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.area = max_x * max_y
+        self.cached = self.area <= CACHE_AREA
+        self._lines = {}
+        self._rings = {}
+        self._corners = {}
+        self._ribs = {}
+
+    def __repr__(self):
+        return f'<Geometry (max_x={self.max_x}; max_y={self.max_y})>'
+
+    @classmethod
+    def of(cls, max_x, max_y):
+        geometry = cls._instances.pop((max_x, max_y), None)
+        if geometry is None:
+            geometry = cls(max_x, max_y)
+            if len(cls._instances) >= MAX_INSTANCES:
+                del cls._instances[next(iter(cls._instances))]
+        cls._instances[(max_x, max_y)] = geometry
+        return geometry
+
+    def is_coord_correct(self, coord_x, coord_y):
+        return (0 <= coord_x < self.max_x) and (0 <= coord_y < self.max_y)
+
+    def index(self, coord_x, coord_y):
+        return coord_y * self.max_x + coord_x
+
+    def coord(self, index):
+        return index % self.max_x, index // self.max_x
+
+    def line(self, index, length, is_vertical=False):
+        key = (index, length, is_vertical)
+        line = self._lines.get(key, False)
+        if line is False:
+            coord_x, coord_y = self.coord(index)
+            end_x, end_y = (coord_x, coord_y + length - 1) if is_vertical else (coord_x + length - 1, coord_y)
+            step = self.max_x if is_vertical else 1
+            line = (tuple(range(index, index + max(length, 0) * step, step))
+                    if self.is_coord_correct(end_x, end_y) else None)
+            if self.cached:
+                self._lines[key] = line
+        return line
+
+    def ring(self, index, length, is_vertical=False):
+        key = (index, length, is_vertical)
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = tuple(self.index(*cell) for cell in self.border_cells(*self.coord(index), length, is_vertical))
+            if self.cached:
+                self._rings[key] = ring
+        return ring
+
+    def corners(self, index):
+        corners = self._corners.get(index)
+        if corners is None:
+            corners = tuple(self.index(*cell) for cell in self.shifted_cells(*self.coord(index), CORNER_SHIFTS))
+            if self.cached:
+                self._corners[index] = corners
+        return corners
+
+    def ribs(self, index):
+        ribs = self._ribs.get(index)
+        if ribs is None:
+            ribs = tuple(self.index(*cell) for cell in self.shifted_cells(*self.coord(index), RIB_SHIFTS))
+            if self.cached:
+                self._ribs[index] = ribs
+        return ribs
+
+    def rays(self, index):
+        row = index - index % self.max_x
+        return (range(index - 1, row - 1, -1), range(index + 1, row + self.max_x),
+                range(index - self.max_x, -1, -self.max_x), range(index + self.max_x, self.area, self.max_x))
+
+    def border_cells(self, coord_x, coord_y, length, is_vertical=False):
+        v_length, h_length = (length, 1) if is_vertical else (1, length)
+        cells = ([(coord_x - 1, coord_y - 1 + position) for position in range(v_length + 2)] +
+                 [(coord_x + h_length, coord_y - 1 + position) for position in range(v_length + 2)] +
+                 [(coord_x + position, coord_y - 1) for position in range(h_length)] +
+                 [(coord_x + position, coord_y + v_length) for position in range(h_length)])
+        return [cell for cell in cells if self.is_coord_correct(*cell)]
+
+    def shifted_cells(self, coord_x, coord_y, shifts):
+        return [(coord_x + shift_x, coord_y + shift_y) for shift_x, shift_y in shifts
+                if self.is_coord_correct(coord_x + shift_x, coord_y + shift_y)]
@@ -0,0 +1,164 @@
+import threading
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter_ns
+
+from .seaplayground import SeaField, _SeaPlaygroundShips, _SeaPlaygroundShoots, ComputerPlayer
+
+
+DEFAULT_TARGETS = (
+    (SeaField, ('get', 'set', 'get_at', 'set_at', 'set_ship', 'set_border', 'is_cell_suitable', 'find_ship_by_cells',
+                'has_any_alive_ship')),
+    (_SeaPlaygroundShips, ('get_suitable_cells', 'put_ship', 'put_ships_random')),
+    (_SeaPlaygroundShoots, ('income_shoot_to', 'shoot_many', 'handle_shoot_answer')),
+    (ComputerPlayer, ('select_target', 'handle_shoot_answer')),
+)
+# (cls, name) -> (original class attribute, profilers sharing the installed wrapper)
+_PATCHES = {}
+
+
+class Profiler:
+
+    def __init__(self, targets=DEFAULT_TARGETS, prefix='seawar'):
+        self.targets = targets
+        self.prefix = prefix
+        self.enabled = False
+        self._patched = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tables = []
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def reset(self):
+        with self._lock:
+            for table in self._tables:
+                for values in table:
+                    values.clear()
+
+    def _merged(self, column):
+        merged = defaultdict(int)
+        with self._lock:
+            tables = list(self._tables)
+        for table in tables:
+            for key, value in list(table[column].items()):
+                merged[key] += value
+        return merged
+
+    calls = property(lambda self: self._merged(0))
+    total_ns = property(lambda self: self._merged(1))
+    self_ns = property(lambda self: self._merged(2))
+    stacks_ns = property(lambda self: self._merged(3))
+
+    def enable(self):
+        if self.enabled:
+            return
+        for cls, names in self.targets:
+            for name in names:
+                if (cls, name) not in _PATCHES:
+                    own = cls.__dict__.get(name)
+                    _PATCHES[cls, name] = own, []
+                    setattr(cls, name, _instrument(cls, name, own, _PATCHES[cls, name][1]))
+                _PATCHES[cls, name][1].append(self)
+                self._patched.append((cls, name))
+        self.enabled = True
+
+    def disable(self):
+        for cls, name in reversed(self._patched):
+            own, profilers = _PATCHES[cls, name]
+            profilers.remove(self)
+            if profilers:
+                continue
+            del _PATCHES[cls, name]
+            if own is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, own)
+        self._patched = []
+        self.enabled = False
+
+    def _enter(self, label):
+        frames = getattr(self._local, 'frames', None)
+        if frames is None:
+            # per-thread counters keep the wrapped call path lock-free; stats() merges them
+            frames = self._local.frames = []
+            self._local.table = (defaultdict(int), defaultdict(int), defaultdict(int), defaultdict(int))
+            with self._lock:
+                self._tables.append(self._local.table)
+        frame = [f'{frames[-1][0]};{label}' if frames else label, 0, label]
+        frames.append(frame)
+        return frame
+
+    def _exit(self, frame, elapsed):
+        frames = self._local.frames
+        frames.pop()
+        if frames:
+            frames[-1][1] += elapsed
+        calls, total_ns, self_ns, stacks_ns = self._local.table
+        calls[frame[2]] += 1
+        total_ns[frame[2]] += elapsed
+        self_ns[frame[2]] += elapsed - frame[1]
+        stacks_ns[frame[0]] += elapsed - frame[1]
+
+    def stats(self):
+        calls, total_ns, self_ns = self.calls, self.total_ns, self.self_ns
+        return {label: dict(calls=calls[label], total_seconds=total_ns[label] / 1e9,
+                            self_seconds=self_ns[label] / 1e9)
+                for label in sorted(calls) if calls[label]}
+
+    def prometheus(self):
+        lines = []
+        for metric, kind, help_text, values in (
+                ('calls_total', 'counter', 'Calls of instrumented functions.', self.calls),
+                ('seconds_total', 'counter', 'Cumulative wall time including callees.',
+                 {label: value / 1e9 for label, value in self.total_ns.items()}),
+                ('self_seconds_total', 'counter', 'Cumulative wall time excluding instrumented callees.',
+                 {label: value / 1e9 for label, value in self.self_ns.items()})):
+            lines.append(f'# HELP {self.prefix}_{metric} {help_text}')
+            lines.append(f'# TYPE {self.prefix}_{metric} {kind}')
+            lines.extend(f'{self.prefix}_{metric}{{function="{label}"}} {values[label]}' for label in sorted(values))
+        return '\n'.join(lines) + '\n'
+
+    def collapsed(self):
+        return ''.join(f'{stack} {value // 1000}\n' for stack, value in sorted(self.stacks_ns.items())
+                       if value >= 1000)
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as output:
+            output.write(self.collapsed())
+
+
+def _instrument(cls, name, own, profilers):
+    label = f'{cls.__name__.lstrip("_")}.{name}'
+    if isinstance(own, staticmethod):
+        return staticmethod(_timed(label, own.__func__, profilers))
+    if own is None:
+        inherited = getattr(cls, name)
+        return wraps(inherited)(_timed(label, lambda obj, *args, **kwargs:
+                                       getattr(super(cls, obj), name)(*args, **kwargs), profilers))
+    return _timed(label, own, profilers)
+
+
+def _timed(label, function, profilers):
+    @wraps(function)
+    def timed(*args, **kwargs):
+        active = tuple(profilers)
+        frames = [profiler._enter(label) for profiler in active]
+        started = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - started
+            for profiler, frame in zip(active, frames):
+                profiler._exit(frame, elapsed)
+    return timed
+
+
+PROFILER = Profiler()
+enable = PROFILER.enable
+disable = PROFILER.disable
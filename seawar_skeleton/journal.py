@@ -0,0 +1,137 @@
+from array import array
+
+from .seaplayground import Cell, _PackedCells
+
+
+DEFAULT_LIMIT = 4096
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, position):
+    value = shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError('Delta is truncated')
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        position += 1
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class ChangeJournal:
+
+    def __init__(self, field, limit=DEFAULT_LIMIT):
+        if field._journal is not None:
+            raise ValueError('Field already has a change journal, detach it first')
+        self.field = field
+        self.limit = limit
+        self.base = 0
+        self._indexes = array('l')
+        self._old = array('b')
+        self._new = array('b')
+        self._callbacks = []
+        field._journal = self
+
+    def __repr__(self):
+        return f'<ChangeJournal (versions {self.base}..{self.version}; limit={self.limit})>'
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def __iter__(self):
+        return self.changes()
+
+    @property
+    def version(self):
+        return self.base + len(self._indexes)
+
+    def detach(self):
+        if self.field._journal is self:
+            self.field._journal = None
+
+    def subscribe(self, callback):
+        self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self._callbacks.remove(callback)
+
+    def record(self, index, old, new):
+        self._indexes.append(index)
+        self._old.append(old)
+        self._new.append(new)
+        for callback in self._callbacks:
+            callback(index, old, new)
+        if self.limit is not None and len(self._indexes) > self.limit:
+            self.compact(self.version - self.limit // 2)
+
+    def record_clear(self):
+        for index, old in list(self.field.filled()):
+            self.record(index, old, Cell.EMPTY)
+
+    def _offset(self, since):
+        since = self.base if since is None else since
+        if not self.base <= since <= self.version:
+            raise ValueError(f'Version {since} is outside journal versions {self.base}..{self.version}')
+        return since - self.base
+
+    def changes(self, since=None):
+        start = self._offset(since)
+        return zip(self._indexes[start:], self._old[start:], self._new[start:])
+
+    def net_changes(self, since=None):
+        net = {}
+        for index, old, new in self.changes(since):
+            net[index] = (net[index][0] if index in net else old, new)
+        return [(index, old, new) for index, (old, new) in sorted(net.items()) if old != new]
+
+    def delta(self, since=None):
+        since = self.base if since is None else since
+        changes = self.net_changes(since)
+        out = bytearray()
+        for value in (since, self.version, len(changes)):
+            _write_varint(out, value)
+        previous = -1
+        for index, _, new in changes:
+            _write_varint(out, index - previous - 1)
+            out.append(_PackedCells.CODES[new])
+            previous = index
+        return bytes(out)
+
+    def compact(self, before=None):
+        drop = min(max((self.version if before is None else before) - self.base, 0), len(self._indexes))
+        del self._indexes[:drop], self._old[:drop], self._new[:drop]
+        self.base += drop
+        return drop
+
+
+def decode_delta(data):
+    since, position = _read_varint(data, 0)
+    version, position = _read_varint(data, position)
+    count, position = _read_varint(data, position)
+    changes, index = [], -1
+    for _ in range(count):
+        gap, position = _read_varint(data, position)
+        if position >= len(data):
+            raise ValueError('Delta is truncated')
+        index += gap + 1
+        changes.append((index, _PackedCells.VALUES[data[position]]))
+        position += 1
+    return since, version, changes
+
+
+def apply_delta(field, data, expected=None):
+    since, version, changes = decode_delta(data)
+    if expected is not None and since != expected:
+        raise ValueError(f'Delta from version {since} does not apply to a mirror at version {expected}')
+    for index, value in changes:
+        field.set_at(index, value)
+    return version
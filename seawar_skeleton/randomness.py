@@ -0,0 +1,43 @@
+from random import Random
+
+
+class GeneratorRandom(Random):
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.gauss_next = None
+
+    def seed(self, *args, **kwargs):
+        raise NotImplementedError('GeneratorRandom draws from its numpy Generator; seed that instead')
+
+    def getstate(self):
+        return self.generator.bit_generator.state, self.gauss_next
+
+    def setstate(self, state):
+        self.generator.bit_generator.state, self.gauss_next = state
+
+    def random(self):
+        return float(self.generator.random())
+
+    def getrandbits(self, k):
+        return int.from_bytes(self.generator.bytes((k + 7) // 8), 'little') >> (-k % 8)
+
+
+def as_random(rng):
+    if rng is None or isinstance(rng, Random):
+        return rng
+    if isinstance(rng, int):
+        return Random(rng)
+    if hasattr(rng, 'bit_generator'):
+        return GeneratorRandom(rng)
+    raise TypeError(f'{rng!r} is not a random.Random, numpy Generator or int seed')
+
+
+def derive_seed(seed, *key):
+    from hashlib import blake2b
+    digest = blake2b(':'.join(map(str, (seed,) + key)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def derive_rng(seed, *key):
+    return Random(derive_seed(seed, *key))
@@ -0,0 +1,165 @@
+from struct import Struct
+
+from .seaplayground import SIGNALS, Cell, SeaField, SeaPlayground, ComputerPlayer
+
+
+HEADER = Struct('<4sB')
+MAGIC = b'SWRP'
+VERSION = 1
+GAME = Struct('<HHH')
+SHIP = Struct('<HHBB')
+SHOT = Struct('<HHBH')
+CELL = Struct('<HH')
+KEYFRAME = Struct('<I')
+DEFAULT_KEYFRAME_INTERVAL = 16
+HIT_SIGNALS = (SIGNALS.HITTING, SIGNALS.KILLED, SIGNALS.WIN)
+
+
+class GameState:
+
+    def __init__(self, enemy_field, comp, shots=0):
+        self.enemy_field = enemy_field
+        self.comp = comp
+        self.shots = shots
+
+    @classmethod
+    def from_layout(cls, max_x, max_y, ships):
+        enemy_field = SeaField(max_x, max_y)
+        for ship in ships:
+            SeaPlayground.put_ship(enemy_field, *ship)
+        return cls(enemy_field, ComputerPlayer(max_x, max_y))
+
+    @classmethod
+    def from_keyframe(cls, shots, enemy_data, target_data):
+        return cls(SeaField.from_bytes(enemy_data), ComputerPlayer.from_buffer(target_data), shots)
+
+    def apply(self, coord_x, coord_y, signal, cells):
+        self.enemy_field.set(coord_x, coord_y, Cell.HIT if signal in HIT_SIGNALS else Cell.MISSED)
+        self.comp.handle_shoot_answer(signal, cells)
+        self.shots += 1
+
+    def copy(self):
+        target_field = self.comp.target_field
+        return GameState(self.enemy_field.fork(),
+                         ComputerPlayer(target_field.max_x, target_field.max_y, target_field=target_field.fork()),
+                         self.shots)
+
+
+class GameRecord:
+
+    def __init__(self, max_x, max_y, ships):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.ships = ships
+        self.shots = []
+        self.keyframes = {}
+
+    def __repr__(self):
+        return f'<GameRecord ({self.max_x}x{self.max_y}; ships={len(self.ships)}; shots={len(self.shots)})>'
+
+    def state_at(self, shot_number):
+        if not 0 <= shot_number <= len(self.shots):
+            raise IndexError(shot_number)
+        keyframe = max((number for number in self.keyframes if number <= shot_number), default=0)
+        if keyframe:
+            state = GameState.from_keyframe(keyframe, *self.keyframes[keyframe])
+        else:
+            state = GameState.from_layout(self.max_x, self.max_y, self.ships)
+        for shot in self.shots[keyframe:shot_number]:
+            state.apply(*shot)
+        return state
+
+    def states(self, start=0):
+        state = self.state_at(start)
+        yield state.copy()
+        for shot in self.shots[start:]:
+            state.apply(*shot)
+            yield state.copy()
+
+
+class ReplayWriter:
+
+    def __init__(self, stream, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        self.stream = stream
+        self.keyframe_interval = keyframe_interval
+        self._state = None
+        stream.write(HEADER.pack(MAGIC, VERSION))
+
+    @staticmethod
+    def layout(field):
+        if any(value in (Cell.HIT, Cell.MISSED) for value in map(field.get_at, range(field.max_x * field.max_y))):
+            raise ValueError('Replay must begin before the first shot')
+        ships = field.ships()
+        if ships:
+            return ships
+        seen = set()
+        for coord_x, coord_y in field.cells:
+            if (coord_x, coord_y) not in seen and field.get(coord_x, coord_y) == Cell.SHIP:
+                ship = field.find_ship_by_cells(coord_x, coord_y)
+                seen |= ship
+                ships.append(field.find_ship_vector(ship))
+        return ships
+
+    def begin_game(self, field):
+        ships = self.layout(field)
+        self.stream.write(b'G' + GAME.pack(field.max_x, field.max_y, len(ships)))
+        self.stream.write(b''.join(SHIP.pack(*ship) for ship in ships))
+        self._state = GameState.from_layout(field.max_x, field.max_y, ships)
+
+    def record_shot(self, coord_x, coord_y, signal, cells):
+        self.stream.write(b'S' + SHOT.pack(coord_x, coord_y, signal, len(cells)))
+        self.stream.write(b''.join(CELL.pack(*cell) for cell in cells))
+        self._state.apply(coord_x, coord_y, signal, cells)
+        if self.keyframe_interval and not self._state.shots % self.keyframe_interval:
+            self.stream.write(b'K' + KEYFRAME.pack(self._state.shots))
+            self.stream.write(self._state.enemy_field.to_bytes())
+            self.stream.write(self._state.comp.to_bytes())
+
+    def play_shot_by_computer(self, comp, enemy_field):
+        coord_x, coord_y = comp.select_target()
+        answer = SeaPlayground.income_shoot_to(enemy_field, coord_x, coord_y)
+        comp.handle_shoot_answer(**answer)
+        self.record_shot(coord_x, coord_y, **answer)
+        return answer
+
+
+def _read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) < size:
+        raise EOFError('Replay log is truncated')
+    return data
+
+
+def _read(stream, struct):
+    return struct.unpack(_read_exactly(stream, struct.size))
+
+
+def read_games(stream):
+    magic, version = _read(stream, HEADER)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'Unsupported replay log {magic!r} version {version}')
+    game = None
+    while True:
+        kind = stream.read(1)
+        if not kind:
+            break
+        if kind == b'G':
+            if game is not None:
+                yield game
+            max_x, max_y, count = _read(stream, GAME)
+            game = GameRecord(max_x, max_y, [(x, y, length, bool(is_vertical))
+                                             for x, y, length, is_vertical in
+                                             (_read(stream, SHIP) for _ in range(count))])
+        elif game is None:
+            raise ValueError(f'Replay record {kind!r} before the first game')
+        elif kind == b'S':
+            coord_x, coord_y, signal, count = _read(stream, SHOT)
+            game.shots.append((coord_x, coord_y, signal, [_read(stream, CELL) for _ in range(count)]))
+        elif kind == b'K':
+            shots, = _read(stream, KEYFRAME)
+            size = SeaField.snapshot_size(game.max_x, game.max_y)
+            game.keyframes[shots] = _read_exactly(stream, size), _read_exactly(stream, size)
+        else:
+            raise ValueError(f'Unknown replay record {kind!r}')
+    if game is not None:
+        yield game
@@ -0,0 +1,200 @@
+import random
+from time import perf_counter
+
+from .bitboard import iter_bits
+from .enumeration import WATER_VALUES
+from .geometry import MAX_INSTANCES, Geometry
+from .randomness import as_random
+from .seaplayground import STANDARD_SHIP_FLEET, SeaField
+
+
+DEFAULT_BUDGET = 0.005
+DEFAULT_MAX_STEPS = 2000
+CHECK_EVERY = 8
+
+
+def field_masks(field):
+    water = hits = 0
+    for index in range(field.max_x * field.max_y):
+        value = field.get_at(index)
+        if value in SeaField.SHIP_VALUES:
+            hits |= 1 << index
+        elif value in WATER_VALUES:
+            water |= 1 << index
+    return water, hits
+
+
+class LayoutSampler:
+    _tables = {}
+
+    def __init__(self, max_x, max_y, fleet=None, water=0, hits=0, rng=None, max_steps=DEFAULT_MAX_STEPS):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.geometry = Geometry.of(max_x, max_y)
+        self.board = (1 << (max_x * max_y)) - 1
+        self.rng = as_random(rng) or random.Random()
+        self.max_steps = max_steps
+        self.water = water
+        self.hits = hits
+        self._ships, self._starts = self._tables.pop((max_x, max_y), None) or ({}, {})
+        if len(self._tables) >= MAX_INSTANCES:
+            del self._tables[next(iter(self._tables))]
+        self._tables[(max_x, max_y)] = self._ships, self._starts
+        self._steps = 0
+        self.fixed, self.blocked, self.pending, self.remaining = self._fix_killed(
+            sorted(fleet if fleet else STANDARD_SHIP_FLEET, reverse=True))
+
+    @classmethod
+    def from_field(cls, field, fleet=None, rng=None, **kwargs):
+        return cls(field.max_x, field.max_y, fleet, *field_masks(field), rng=rng, **kwargs)
+
+    def ship(self, start, length, is_vertical):
+        key = (start, length, is_vertical)
+        if key not in self._ships:
+            ship = sum(1 << index for index in self.geometry.line(start, length, is_vertical))
+            ring = sum(1 << index for index in self.geometry.ring(start, length, is_vertical))
+            self._ships[key] = ship, ship | ring
+        return self._ships[key]
+
+    def starts(self, length, is_vertical):
+        key = (length, is_vertical)
+        if key not in self._starts:
+            self._starts[key] = sum(1 << start for start in range(self.board.bit_length())
+                                    if self.geometry.line(start, length, is_vertical) is not None)
+        return self._starts[key]
+
+    def fits(self, free, length, is_vertical):
+        step = self.max_x if is_vertical else 1
+        starts = free
+        for position in range(1, length):
+            starts &= free >> (step * position)
+        return starts & self.starts(length, is_vertical)
+
+    def _fix_killed(self, remaining):
+        fixed, blocked, pending = [], self.water, 0
+        unvisited = self.hits
+        while unvisited:
+            start = (unvisited & -unvisited).bit_length() - 1
+            is_vertical = bool(unvisited >> (start + self.max_x) & 1)
+            step = self.max_x if is_vertical else 1
+            length = 1
+            while (self.hits >> (start + length * step) & 1 and
+                   (is_vertical or (start + length) % self.max_x)):
+                length += 1
+            ship, halo = self.ship(start, length, is_vertical)
+            unvisited &= ~ship
+            if not (halo & ~ship & ~self.water) and length in remaining:
+                fixed.append((start, length, is_vertical))
+                blocked |= halo
+                remaining.remove(length)
+            else:
+                pending |= ship
+        return fixed, blocked, pending, remaining
+
+    def sample(self):
+        self._steps = 0
+        placed = self._cover(self.blocked, self.pending, self.remaining)
+        return None if placed is None else self.fixed + placed
+
+    def _cover(self, blocked, pending, ships):
+        if not pending:
+            return self._place(blocked, ships)
+        target = (pending & -pending).bit_length() - 1
+        candidates = []
+        for length in set(ships):
+            for is_vertical in ((False,) if length == 1 else (False, True)):
+                step = self.max_x if is_vertical else 1
+                for offset in range(length):
+                    start = target - offset * step
+                    if start < 0 or not self.starts(length, is_vertical) >> start & 1:
+                        continue
+                    ship, halo = self.ship(start, length, is_vertical)
+                    if not (ship & blocked or halo & ~ship & pending):
+                        candidates.append((start, length, is_vertical, ship, halo))
+        self.rng.shuffle(candidates)
+        for start, length, is_vertical, ship, halo in candidates:
+            self._steps += 1
+            if self._steps > self.max_steps:
+                return None
+            rest = ships[:]
+            rest.remove(length)
+            placed = self._cover(blocked | halo, pending & ~ship, rest)
+            if placed is not None:
+                return [(start, length, is_vertical)] + placed
+        return None
+
+    def _place(self, blocked, ships):
+        if not ships:
+            return []
+        length = ships[0]
+        free = self.board & ~blocked
+        horizontal = self.fits(free, length, False)
+        vertical = self.fits(free, length, True) if length > 1 else 0
+        while horizontal or vertical:
+            self._steps += 1
+            if self._steps > self.max_steps:
+                return None
+            count_horizontal = bin(horizontal).count('1')
+            position = self.rng.randrange(count_horizontal + bin(vertical).count('1'))
+            is_vertical = position >= count_horizontal
+            mask = vertical if is_vertical else horizontal
+            for start in iter_bits(mask):
+                if not (position - count_horizontal if is_vertical else position):
+                    break
+                position -= 1
+            if is_vertical:
+                vertical &= ~(1 << start)
+            else:
+                horizontal &= ~(1 << start)
+            placed = self._place(blocked | self.ship(start, length, is_vertical)[1], ships[1:])
+            if placed is not None:
+                return [(start, length, is_vertical)] + placed
+        return None
+
+    def layouts(self, count):
+        for _ in range(count):
+            layout = self.sample()
+            if layout is not None:
+                yield [(*self.geometry.coord(start), length, is_vertical) for start, length, is_vertical in layout]
+
+    def heat_map(self, budget=DEFAULT_BUDGET, max_samples=None, clock=perf_counter):
+        deadline = clock() + budget
+        heat = [0] * self.board.bit_length()
+        samples = drawn = 0
+        while max_samples is None or drawn < max_samples:
+            drawn += 1
+            layout = self.sample()
+            if layout is not None:
+                samples += 1
+                for start, length, is_vertical in layout:
+                    for index in self.geometry.line(start, length, is_vertical):
+                        heat[index] += 1
+            if not drawn % CHECK_EVERY and clock() >= deadline:
+                break
+        return heat, samples
+
+
+def sample_heat(max_x, max_y, fleet, water, hits, seed, budget=DEFAULT_BUDGET, max_samples=None, clock=perf_counter):
+    return LayoutSampler(max_x, max_y, fleet, water, hits, seed).heat_map(budget, max_samples, clock)
+
+
+def posterior_heat(field, fleet=None, budget=DEFAULT_BUDGET, max_samples=None, rng=None, executor=None, workers=1,
+                   clock=perf_counter):
+    rng = as_random(rng) or random.Random()
+    if executor is None:
+        return LayoutSampler.from_field(field, fleet, rng).heat_map(budget, max_samples, clock)
+    from concurrent.futures import wait
+    started = clock()
+    water, hits = field_masks(field)
+    share = None if max_samples is None else -(-max_samples // workers)
+    futures = [executor.submit(sample_heat, field.max_x, field.max_y, fleet, water, hits, rng.getrandbits(64),
+                               budget, share, clock) for _ in range(workers)]
+    done, pending = wait(futures, timeout=max(budget - (clock() - started), 0))
+    for future in pending:
+        future.cancel()
+    heat, samples = [0] * (field.max_x * field.max_y), 0
+    for future in done:
+        partial_heat, partial_samples = future.result()
+        heat = [total + value for total, value in zip(heat, partial_heat)]
+        samples += partial_samples
+    return heat, samples
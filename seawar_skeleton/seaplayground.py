@@ -1,10 +1,23 @@
-from itertools import chain, product, takewhile, starmap
-from random import choice
+from abc import ABC, abstractmethod
+from array import array
+from copy import copy
+from functools import wraps
+from itertools import takewhile, starmap
+from operator import index as as_int, or_
+from random import choice, randrange
+from struct import Struct
+
+from .geometry import CORNER_SHIFTS, RIB_SHIFTS, Geometry
+from .randomness import as_random
 
 
 STANDARD_SHIP_FLEET = [4, 3, 3, 2, 2, 2, 1, 1, 1, 1]
 DEFAULT_MAX_X = 10
 DEFAULT_MAX_Y = 10
+SNAPSHOT_MAGIC = b'SWAR'
+SNAPSHOT_VERSION = 1
+# magic, version, reserved, max_x, max_y, reserved; the alive count is recounted from the cells on load
+SNAPSHOT_HEADER = Struct('<4sBBHHI')
 
 
 class SIGNALS:
@@ -14,13 +27,8 @@ class SIGNALS:
     MISS = 2
 
 
-def filter_correct_coordinates(f):
-    def decor(field, *args, **kwargs):
-        return [cell for cell in f(field, *args, **kwargs) if field.is_coord_correct(*cell)]
-    return decor
-
-
 def check_coordinates(f):
+    @wraps(f)
     def decor(field, coord_x, coord_y, *args, **kwargs):
         if field.is_coord_correct(coord_x, coord_y):
             return f(field, coord_x, coord_y, *args, **kwargs)
@@ -48,38 +56,173 @@ class Cell:
     MISSED = -1
     PROBABLY_SHIP = 5
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, value=EMPTY):
         self.x = x
         self.y = y
-        self.value = Cell.EMPTY
+        self.value = value
 
     def __repr__(self):
         return f'<Cell: ({self.x}; {self.y} = {self.value})>'
 
 
+class _CoordsView:
+
+    def __init__(self, matrix):
+        self._matrix = matrix
+
+    def __len__(self):
+        return self._matrix.max_x * self._matrix.max_y
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._matrix.coord(index)
+
+    def __iter__(self):
+        return ((x, y) for y in range(self._matrix.max_y) for x in range(self._matrix.max_x))
+
+
+class _CellsView(_CoordsView):
+    _VALUES = {value: value for value in (Cell.EMPTY, Cell.BORDER, Cell.SHIP, Cell.HIT, Cell.MISSED,
+                                          Cell.PROBABLY_SHIP)}
+
+    def __getitem__(self, index):
+        value = self._matrix.get_at(index)
+        return Cell(*super().__getitem__(index), self._VALUES.get(value, value))
+
+    def __iter__(self):
+        values = self._VALUES
+        return (Cell(x, y, values.get(value, value))
+                for (x, y), value in zip(super().__iter__(), map(self._matrix.get_at, range(len(self)))))
+
+
+class _IndexedSet:
+
+    def __init__(self, items=()):
+        self._items = list(items)
+        self._positions = {item: position for position, item in enumerate(self._items)}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, position):
+        return self._items[position]
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def add(self, item):
+        if item not in self._positions:
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+
+    def discard(self, item):
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        last = self._items.pop()
+        if position < len(self._items):
+            self._items[position] = last
+            self._positions[last] = position
+
+
+class _PackedCells:
+    VALUES = (Cell.EMPTY, Cell.BORDER, Cell.SHIP, Cell.HIT, Cell.MISSED, Cell.PROBABLY_SHIP)
+    CODES = {value: code for code, value in enumerate(VALUES)}
+    _COUNTS = {}
+
+    def __init__(self, view):
+        self._view = view
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.__dict__.__sizeof__()
+
+    def __copy__(self):
+        return _PackedCells(memoryview(bytearray(self._view)))
+
+    def __getitem__(self, index):
+        return self.VALUES[self._view[index >> 1] >> ((index & 1) << 2) & 0xF]
+
+    def __setitem__(self, index, value):
+        if self._view.readonly:
+            self._view = memoryview(bytearray(self._view))
+        shift = (index & 1) << 2
+        self._view[index >> 1] = self._view[index >> 1] & (0xF0 >> shift) | self.CODES[value] << shift
+
+    def count(self, value):
+        code = self.CODES[value]
+        if code not in self._COUNTS:
+            self._COUNTS[code] = bytes((byte & 0xF == code) + (byte >> 4 == code) for byte in range(256))
+        return sum(bytes(self._view).translate(self._COUNTS[code]))
+
+    @classmethod
+    def pack(cls, values):
+        codes = bytes(map(cls.CODES.__getitem__, values))
+        return bytes(map(or_, codes[0::2], [code << 4 for code in codes[1::2]] + [0]))
+
+
 class Matrix:
 
-    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y):
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, data=None):
         self.max_x = max_x
         self.max_y = max_y
-        self._field = [[Cell(i, j) for i in range(max_x)] for j in range(max_y)]
-        self._cells = list(chain(*self._field))
-        self.cells = [(cell.x, cell.y) for cell in self._cells]
+        self._data = array('b', bytes(max_x * max_y)) if data is None else data
+
+    @property
+    def cells(self):
+        return _CoordsView(self)
+
+    @property
+    def _cells(self):
+        return _CellsView(self)
 
     def __repr__(self):
         return '<Matrix (max_x={}; max_y={})>'.format(self.max_x, self.max_y)
 
     def __str__(self):
         out = repr(self)
-        for row in self._field:
-            out += '\n\t' + ''.join([f'{cell.value:4}' for cell in row])
+        for coord_y in range(self.max_y):
+            out += '\n\t' + ''.join([f'{self.get(coord_x, coord_y):4}' for coord_x in range(self.max_x)])
         return out + '\n'
 
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.__dict__.__sizeof__() + self._data.__sizeof__()
+
+    def _copy_data(self):
+        self._data = copy(self._data)
+
+    def clear(self):
+        if isinstance(self._data, array):
+            memoryview(self._data).cast('B')[:] = bytes(len(self._data))
+        else:
+            self._data = array('b', bytes(self.max_x * self.max_y))
+
+    def index(self, coord_x, coord_y):
+        return coord_y * self.max_x + coord_x
+
+    def coord(self, index):
+        return index % self.max_x, index // self.max_x
+
     def set(self, coord_x, coord_y, value):
-        self._field[coord_y][coord_x].value = value
+        self.set_at(coord_y * self.max_x + coord_x, value)
 
     def get(self, coord_x, coord_y):
-        return self._field[coord_y][coord_x].value
+        return self._data[coord_y * self.max_x + coord_x]
+
+    def set_at(self, index, value):
+        self._data[index] = value
+
+    def get_at(self, index):
+        return self._data[index]
+
+    def filled(self):
+        for index in range(self.max_x * self.max_y):
+            value = self.get_at(index)
+            if value != Cell.EMPTY:
+                yield index, value
 
     def is_coord_correct(self, coord_x, coord_y):
         return (0 <= coord_x < self.max_x) and (0 <= coord_y < self.max_y)
@@ -93,37 +236,239 @@ class Matrix:
 
 
 class SeaField(Matrix):
+    EMPTY_VALUES = (Cell.EMPTY, Cell.PROBABLY_SHIP)
+    SHIP_VALUES = (Cell.SHIP, Cell.HIT)
+    _journal = None
+    _shared = False
+    _checkpoints = ()
+
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, data=None):
+        super().__init__(max_x, max_y, data)
+        self.geometry = Geometry.of(max_x, max_y)
+        self._reset_ships()
+
+    def clear(self):
+        if self._shared:
+            self._unshare()
+        self._record_clear()
+        super().clear()
+        self._reset_ships()
+
+    def _record_clear(self):
+        if self._journal is not None:
+            self._journal.record_clear()
+        if self._checkpoints:
+            for index, old in list(self.filled()):
+                self._undo_indexes.append(index)
+                self._undo_values.append(old)
+
+    def _reset_ships(self):
+        self._alive = 0
+        self._ships = []
+        self._ship_health = []
+        self._ship_ids = {}
+        self._candidates = {}
+
+    def fork(self):
+        child = copy(self)
+        for name in ('_journal', '_checkpoints', '_undo_indexes', '_undo_values'):
+            vars(child).pop(name, None)
+        child._candidates = {}
+        self._shared = child._shared = True
+        return child
+
+    def _unshare(self):
+        self._copy_data()
+        self._ships = list(self._ships)
+        self._ship_health = list(self._ship_health)
+        self._ship_ids = dict(self._ship_ids)
+        self._shared = False
+
+    def checkpoint(self):
+        if not self._checkpoints:
+            self._checkpoints, self._undo_indexes, self._undo_values = [], array('l'), array('b')
+        self._checkpoints.append((len(self._undo_indexes), self._alive, list(self._ships), list(self._ship_health),
+                                  dict(self._ship_ids)))
+        return len(self._checkpoints)
+
+    def commit(self):
+        self._checkpoints.pop()
+        if not self._checkpoints:
+            self._checkpoints = ()
+            del self._undo_indexes, self._undo_values
+
+    def rollback(self):
+        if self._shared:
+            self._unshare()
+        mark, *ships = self._checkpoints[-1]
+        indexes, values = self._undo_indexes, self._undo_values
+        for position in range(len(indexes) - 1, mark - 1, -1):
+            self.set_at(indexes[position], values[position])
+        del indexes[mark:], values[mark:]
+        self._alive, self._ships, self._ship_health, self._ship_ids = ships
+        self.commit()
+
+    def set_at(self, index, value):
+        if self._shared:
+            self._unshare()
+        old = self.get_at(index)
+        if (old == Cell.SHIP) is not (value == Cell.SHIP):
+            change = 1 if value == Cell.SHIP else -1
+            self._alive += change
+            ship_id = self._ship_ids.get(index)
+            if ship_id is not None:
+                self._ship_health[ship_id] += change
+        super().set_at(index, value)
+        if self._candidates and (old in self.EMPTY_VALUES) is not (value in self.EMPTY_VALUES):
+            self._update_candidates(index, value in self.EMPTY_VALUES)
+        if self._journal is not None and old != value:
+            self._journal.record(index, old, value)
+        if self._checkpoints and old != value:
+            self._undo_indexes.append(index)
+            self._undo_values.append(old)
+
+    def suitable_cells(self, length):
+        candidates = [(index, not is_vertical)
+                      for is_vertical in (True, False) for index in self._get_candidates(length, is_vertical)]
+        return [(*self.coord(index), not is_horizontal) for index, is_horizontal in sorted(candidates)]
+
+    def random_suitable_cell(self, length, rng=None):
+        vertical, horizontal = self._get_candidates(length, True), self._get_candidates(length, False)
+        if not (vertical or horizontal):
+            return None
+        position = (rng.randrange if rng else randrange)(len(vertical) + len(horizontal))
+        if position < len(vertical):
+            return (*self.coord(vertical[position]), True)
+        return (*self.coord(horizontal[position - len(vertical)]), False)
+
+    def candidate_keys(self):
+        return list(self._candidates)
+
+    def reset_candidates(self, keep=()):
+        # indexes in keep stay, they are updated on every write; the rest are rebuilt on demand
+        self._candidates = {key: self._candidates[key] for key in keep if key in self._candidates}
+
+    def _get_candidates(self, length, is_vertical):
+        key = (length, is_vertical)
+        if key not in self._candidates:
+            self._candidates[key] = _IndexedSet(self._find_candidates(length, is_vertical))
+        return self._candidates[key]
+
+    def _find_candidates(self, length, is_vertical):
+        outer, inner = (self.max_x, self.max_y) if is_vertical else (self.max_y, self.max_x)
+        for line in range(outer):
+            run = 0
+            for position in range(inner):
+                coord_x, coord_y = (line, position) if is_vertical else (position, line)
+                run = run + 1 if self.is_cell_empty(coord_x, coord_y) else 0
+                if run >= length:
+                    yield self.index(*((line, position - length + 1) if is_vertical else (position - length + 1, line)))
+
+    def _update_candidates(self, index, is_empty):
+        coord_x, coord_y = self.coord(index)
+        for (length, is_vertical), candidates in self._candidates.items():
+            position, limit = (coord_y, self.max_y) if is_vertical else (coord_x, self.max_x)
+            for start in range(max(0, position - length + 1), min(position, limit - length) + 1):
+                cell = (coord_x, start) if is_vertical else (start, coord_y)
+                if not is_empty:
+                    candidates.discard(self.index(*cell))
+                elif self.is_cell_suitable(*cell, length, is_vertical):
+                    candidates.add(self.index(*cell))
+
+    def to_bytes(self):
+        area = self.max_x * self.max_y
+        header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, self.max_x, self.max_y, 0)
+        return header + _PackedCells.pack(map(self.get_at, range(area)))
+
+    @staticmethod
+    def snapshot_size(max_x, max_y):
+        return SNAPSHOT_HEADER.size + (max_x * max_y + 1) // 2
+
+    @classmethod
+    def from_buffer(cls, buffer, offset=0):
+        view = memoryview(buffer)
+        magic, version, _, max_x, max_y, _ = SNAPSHOT_HEADER.unpack_from(view, offset)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f'Unsupported snapshot {magic!r} version {version}')
+        start = offset + SNAPSHOT_HEADER.size
+        cells = view[start:offset + cls.snapshot_size(max_x, max_y)]
+        if len(cells) < cls.snapshot_size(max_x, max_y) - SNAPSHOT_HEADER.size:
+            raise ValueError(f'Snapshot of Field({max_x}:{max_y}) is truncated')
+        cells = _PackedCells(cells)
+        field = cls(max_x, max_y, cells)
+        field._alive = cells.count(Cell.SHIP)
+        return field
+
+    @classmethod
+    def from_bytes(cls, data):
+        packed = cls.from_buffer(data)
+        field = cls(packed.max_x, packed.max_y)
+        for index in range(field.max_x * field.max_y):
+            field.set_at(index, packed.get_at(index))
+        return field
+
+    def ship_id_at(self, coord_x, coord_y):
+        return self._ship_ids.get(self.index(coord_x, coord_y))
+
+    def ship_cells(self, ship_id):
+        return [self.coord(index) for index in self._ships[ship_id]]
+
+    def ship_health(self, ship_id):
+        return self._ship_health[ship_id]
+
+    def ships(self):
+        return [self.find_ship_vector([self.coord(index) for index in indexes]) for indexes in self._ships]
 
     def is_cell_ship(self, coord_x, coord_y):
-        return self.get(coord_x, coord_y) in (Cell.SHIP, Cell.HIT)
+        return self.get(coord_x, coord_y) in self.SHIP_VALUES
 
     def is_cell_empty(self, coord_x, coord_y):
-        return self.get(coord_x, coord_y) in (Cell.EMPTY, Cell.PROBABLY_SHIP)
+        return self.get(coord_x, coord_y) in self.EMPTY_VALUES
 
     def set_ship(self, coord_x, coord_y, length, is_vertical=False):
-        [self.set(value=Cell.SHIP, *cell) for cell in self.next_cell(coord_x, coord_y, is_vertical, length)]
+        indexes = self.geometry.line(self.index(coord_x, coord_y), length, is_vertical) \
+            if self.is_coord_correct(coord_x, coord_y) else None
+        if indexes is None:
+            raise IncorrectCoordinate(f'Ship ({coord_x}: {coord_y}) of {length} for Field({self.max_x}:{self.max_y})')
+        if self._shared:
+            self._unshare()
+        ship_id = len(self._ships)
+        self._ships.append(indexes)
+        self._ship_health.append(0)
+        for index in indexes:
+            self._ship_ids[index] = ship_id
+        [self.set_at(index, Cell.SHIP) for index in indexes]
 
     def set_border(self, coord_x, coord_y, length=None, is_vertical=False):
-        if length:
-            cells = self._find_border_cells(coord_x, coord_y, length, is_vertical)
+        if not self.is_coord_correct(coord_x, coord_y):
+            cells = self._find_border_cells(coord_x, coord_y, length, is_vertical) if length else \
+                self._find_cell_corners(coord_x, coord_y)
+            indexes = [self.index(*cell) for cell in cells]
+        elif length:
+            indexes = self.geometry.ring(self.index(coord_x, coord_y), length, is_vertical)
         else:
-            cells = self._find_cell_corners(coord_x, coord_y)
-        [self.set(value=Cell.BORDER, *cell) for cell in cells if self.is_cell_empty(*cell)]
+            indexes = self.geometry.corners(self.index(coord_x, coord_y))
+        get_at = self.get_at
+        [self.set_at(index, Cell.BORDER) for index in indexes if get_at(index) in self.EMPTY_VALUES]
 
     def is_cell_suitable(self, coord_x, coord_y, length, is_vertical=False):
-        check = lambda x, y: self.is_coord_correct(x, y) and self.is_cell_empty(x, y)
-        return all(starmap(check, self.next_cell(coord_x, coord_y, is_vertical, length)))
+        if not self.is_coord_correct(coord_x, coord_y):
+            return False
+        line = self.geometry.line(self.index(coord_x, coord_y), length, is_vertical)
+        get_at = self.get_at
+        return line is not None and all(get_at(index) in self.EMPTY_VALUES for index in line)
 
     def find_ship_by_cells(self, coord_x, coord_y):
-        out = []
-        for step, is_vertical in product([-1, 1], [True, False]):
-            out.extend(takewhile(
-                lambda cell: (self.is_coord_correct(*cell) and self.is_cell_ship(*cell)),
-                self.next_cell(coord_x, coord_y, is_vertical, None, step)))
-        return set(out)
+        if not (self.is_coord_correct(coord_x, coord_y) and self.is_cell_ship(coord_x, coord_y)):
+            return set()
+        index = self.index(coord_x, coord_y)
+        out = [index]
+        for ray in self.geometry.rays(index):
+            out.extend(takewhile(lambda cell: self.get_at(cell) in self.SHIP_VALUES, ray))
+        return set(map(self.coord, out))
 
     def has_any_alive_ship(self):
-        return any([cell for cell in self._cells if cell.value is Cell.SHIP])
+        return self._alive > 0
 
     @staticmethod
     def find_ship_vector(ship_cells):
@@ -132,22 +477,20 @@ class SeaField(Matrix):
         is_vertical = y1 + length == y2
         return x1, y1, length + 1, is_vertical
 
-    @filter_correct_coordinates
     def _find_border_cells(self, coord_x, coord_y, length, is_vertical=False):
-        v_length, h_length = (length, 1) if is_vertical else (1, length)
-        return (list(Matrix.next_cell(coord_x - 1, coord_y - 1, True, v_length + 2)) +
-                list(Matrix.next_cell(coord_x + h_length, coord_y - 1, True, v_length + 2)) +
-                list(Matrix.next_cell(coord_x, coord_y - 1, False, h_length)) +
-                list(Matrix.next_cell(coord_x, coord_y + v_length, False, h_length)))
+        if self.is_coord_correct(coord_x, coord_y):
+            return list(map(self.coord, self.geometry.ring(self.index(coord_x, coord_y), length, is_vertical)))
+        return self.geometry.border_cells(coord_x, coord_y, length, is_vertical)
 
-    @filter_correct_coordinates
     def _find_cell_corners(self, coord_x, coord_y):
-        return map(lambda c, d: (c[0] + d[0], c[1] + d[1]), [(coord_x, coord_y)] * 4, product((-1, 1), (-1, 1)))
+        if self.is_coord_correct(coord_x, coord_y):
+            return list(map(self.coord, self.geometry.corners(self.index(coord_x, coord_y))))
+        return self.geometry.shifted_cells(coord_x, coord_y, CORNER_SHIFTS)
 
-    @filter_correct_coordinates
     def _find_cell_ribs(self, coord_x, coord_y):
-        return map(lambda c, d: (c[0] + d[0], c[1] + d[1]), [(coord_x, coord_y)] * 4,
-                   ((-1, 0), (1, 0), (0, -1), (0, 1)))
+        if self.is_coord_correct(coord_x, coord_y):
+            return list(map(self.coord, self.geometry.ribs(self.index(coord_x, coord_y))))
+        return self.geometry.shifted_cells(coord_x, coord_y, RIB_SHIFTS)
 
 
 class _SeaPlaygroundShips:
@@ -163,36 +506,86 @@ class _SeaPlaygroundShips:
 
     @staticmethod
     def get_suitable_cells(field, length):
-        return [(x, y, is_vertical)
-                for (x, y), is_vertical in product(field.cells, (True, False))
-                if field.is_cell_suitable(x, y, length, is_vertical)]
+        return field.suitable_cells(length)
 
     @staticmethod
-    def _put_ship_random(field, length):
-        cells = _SeaPlaygroundShips.get_suitable_cells(field, length)
-        if not cells:
+    def _put_ship_random(field, length, rng=None):
+        cell = field.random_suitable_cell(length, rng)
+        if cell is None:
             raise NoSpaceLeft()
-        coord_x, coord_y, is_vertical = choice(cells)
+        coord_x, coord_y, is_vertical = cell
         field.set_ship(coord_x, coord_y, length, is_vertical)
         field.set_border(coord_x, coord_y, length, is_vertical)
 
     @staticmethod
-    def put_ships_random(field, fleet:list=None):
+    def put_ships_random(field, fleet:list=None, rng=None):
         fleet = fleet if fleet else STANDARD_SHIP_FLEET
-        for length in fleet:
-            _SeaPlaygroundShips._put_ship_random(field, length)
+        rng = as_random(rng)
+        keep = field.candidate_keys()
+        try:
+            for length in fleet:
+                _SeaPlaygroundShips._put_ship_random(field, length, rng)
+        finally:
+            field.reset_candidates(keep)
+
+    @staticmethod
+    def put_ships_random_bulk(count, fleet:list=None, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, **kwargs):
+        from .bulk import put_ships_random_bulk
+        return put_ships_random_bulk(count, fleet, max_x, max_y, **kwargs)
 
 
 class _SeaPlaygroundShoots:
 
     @staticmethod
-    @check_coordinates
-    def income_shoot_to(field, *coord):
-        signal, cell_mark = (SIGNALS.HITTING, Cell.HIT) if field.is_cell_ship(*coord) else (SIGNALS.MISS, Cell.MISSED)
-        field.set(*coord, cell_mark)
-        killed_cells = (signal is SIGNALS.HITTING) and list(_SeaPlaygroundShoots._get_killed_ship(field, *coord)) or []
-        signal = (SIGNALS.WIN if not field.has_any_alive_ship() else SIGNALS.KILLED) if killed_cells else signal
-        return dict(signal=signal, cells=(killed_cells or [coord]))
+    def income_shoot_to(field, coord_x, coord_y):
+        if not field.is_coord_correct(coord_x, coord_y):
+            raise IncorrectCoordinate(f'({coord_x}: {coord_y}) for Field({field.max_x}:{field.max_y})')
+        signal, killed = _SeaPlaygroundShoots._shoot_at(field, coord_y * field.max_x + coord_x)
+        return dict(signal=signal, cells=[field.coord(index) for index in killed] if killed else [(coord_x, coord_y)])
+
+    @staticmethod
+    def shoot_many(field, xs, ys, signals=None, offsets=None, cells=None):
+        # signals and offsets must hold count and count + 1 items; cells must support append
+        # or hold one cell per shot plus every ship cell, so nothing is shot unless the batch fits
+        count = len(xs)
+        if len(ys) != count:
+            raise ValueError(f'{count} x coordinates for {len(ys)} y coordinates')
+        xs, ys = list(map(as_int, xs)), list(map(as_int, ys))
+        if signals is not None and len(signals) < count or offsets is not None and len(offsets) < count + 1:
+            raise ValueError(f'Signal and offset buffers are too small for {count} shots')
+        if cells is not None and not hasattr(cells, 'append') and len(cells) < count + (
+                sum(map(len, field._ships)) if field._ships else field.max_x * field.max_y):
+            raise ValueError(f'Cell buffer of {len(cells)} items may overflow; pass one that supports append')
+        if count and not (0 <= min(xs) and max(xs) < field.max_x and 0 <= min(ys) and max(ys) < field.max_y):
+            coord_x, coord_y = next(coord for coord in zip(xs, ys) if not field.is_coord_correct(*coord))
+            raise IncorrectCoordinate(f'({coord_x}: {coord_y}) for Field({field.max_x}:{field.max_y})')
+        signals = array('b', bytes(count)) if signals is None else signals
+        offsets = array('l', bytes((count + 1) * array('l').itemsize)) if offsets is None else offsets
+        cells = array('l', bytes(count * array('l').itemsize)) if cells is None else cells
+        shoot_at, max_x = _SeaPlaygroundShoots._shoot_at, field.max_x
+        end = offsets[0] = 0
+        for shot in range(count):
+            index = ys[shot] * max_x + xs[shot]
+            signals[shot], killed = shoot_at(field, index)
+            for cell in killed or (index,):
+                if end < len(cells):
+                    cells[end] = cell
+                else:
+                    cells.append(cell)
+                end += 1
+            offsets[shot + 1] = end
+        return signals, offsets, cells
+
+    @staticmethod
+    def _shoot_at(field, index):
+        if field.get_at(index) not in field.SHIP_VALUES:
+            field.set_at(index, Cell.MISSED)
+            return SIGNALS.MISS, ()
+        field.set_at(index, Cell.HIT)
+        killed = _SeaPlaygroundShoots._get_killed_indexes(field, index)
+        if not killed:
+            return SIGNALS.HITTING, ()
+        return (SIGNALS.KILLED if field.has_any_alive_ship() else SIGNALS.WIN), killed
 
     @staticmethod
     def handle_shoot_answer(field, signal, cells):
@@ -213,8 +606,18 @@ class _SeaPlaygroundShoots:
         elif signal == SIGNALS.HITTING:
             field.set_border(*cells[0])
 
+    @staticmethod
+    def _get_killed_indexes(field, index):
+        ship_id = field._ship_ids.get(index)
+        if ship_id is not None:
+            return field._ships[ship_id] if not field._ship_health[ship_id] else ()
+        return sorted(field.index(*cell) for cell in _SeaPlaygroundShoots._get_killed_ship(field, *field.coord(index)))
+
     @staticmethod
     def _get_killed_ship(field, coord_x, coord_y):
+        ship_id = field.ship_id_at(coord_x, coord_y)
+        if ship_id is not None:
+            return set(field.ship_cells(ship_id)) if not field.ship_health(ship_id) else []
         ship_cells = field.find_ship_by_cells(coord_x, coord_y)
         return ship_cells if all([field.get(*cell) == Cell.HIT for cell in ship_cells]) else []
 
@@ -230,10 +633,50 @@ class SeaPlayground(_SeaPlaygroundShips, _SeaPlaygroundShoots):
     pass
 
 
-class ComputerPlayer:
+class RandomTargeting:
 
-    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y):
-        self.target_field = SeaField(max_x, max_y)
+    def __init__(self, rng=None):
+        self.field = None
+        self.rng = as_random(rng)
+
+    def attach(self, field):
+        self.field = field
+
+    def handle_shoot_answer(self, signal, cells):
+        pass
+
+    def select_target(self):
+        cells = [cell for cell in self.field.cells if self.field.get(*cell) == Cell.PROBABLY_SHIP]
+        if not cells:
+            cells = [cell for cell in self.field.cells if self.field.is_cell_empty(*cell)]
+        return (self.rng.choice if self.rng else choice)(cells)
+
+
+class Player(ABC):
+
+    @abstractmethod
+    def select_target(self):
+        pass
+
+    @abstractmethod
+    def handle_shoot_answer(self, signal, cells):
+        pass
+
+
+class ComputerPlayer(Player):
+
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, strategy=None, target_field=None, rng=None):
+        self.target_field = SeaField(max_x, max_y) if target_field is None else target_field
+        self.strategy = strategy if strategy else RandomTargeting(rng)
+        self.strategy.attach(self.target_field)
+
+    def to_bytes(self):
+        return self.target_field.to_bytes()
+
+    @classmethod
+    def from_buffer(cls, buffer, offset=0, strategy=None, rng=None):
+        target_field = SeaField.from_buffer(buffer, offset)
+        return cls(target_field.max_x, target_field.max_y, strategy, target_field, rng)
 
     def handle_shoot_answer(self, signal, cells):
         SeaPlayground.handle_shoot_answer(self.target_field,  signal, cells)
@@ -242,9 +685,7 @@ class ComputerPlayer:
                 [self.target_field.set(value=Cell.PROBABLY_SHIP, *cl)
                  for cl in self.target_field._find_cell_ribs(*answer_cell)
                  if self.target_field.is_cell_empty(*cl)]
+        self.strategy.handle_shoot_answer(signal, cells)
 
     def select_target(self):
-        cells = [cell for cell in self.target_field.cells if self.target_field.get(*cell) == Cell.PROBABLY_SHIP]
-        if not cells:
-            cells = [cell for cell in self.target_field.cells if self.target_field.is_cell_empty(*cell)]
-        return choice(cells)
+        return self.strategy.select_target()
@@ -0,0 +1,306 @@
+import argparse
+import asyncio
+import json
+import random
+from collections import deque, defaultdict
+from itertools import count
+from time import monotonic, perf_counter
+
+from .randomness import as_random
+from .seaplayground import DEFAULT_MAX_X, DEFAULT_MAX_Y, SIGNALS, IncorrectCoordinate, NoSpaceLeft, SeaField, \
+    SeaPlayground, ComputerPlayer
+
+
+DEFAULT_IDLE_TIMEOUT = 300
+DEFAULT_POOL_SIZE = 1024
+DEFAULT_MAX_SIDE = 100
+LATENCY_WINDOW = 10000
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def percentile(values, percent):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, -(-len(ordered) * percent // 100) - 1))]
+
+
+def latency_summary(latencies):
+    return {op: dict(count=len(values), p50=percentile(values, 50), p99=percentile(values, 99))
+            for op, values in latencies.items()}
+
+
+class FieldPool:
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, field_class=SeaField):
+        self.size = size
+        self.field_class = field_class
+        self._free = defaultdict(list)
+        self.reused = 0
+
+    def get(self, max_x, max_y):
+        free = self._free[(max_x, max_y)]
+        if free:
+            self.reused += 1
+            return free.pop()
+        return self.field_class(max_x, max_y)
+
+    def release(self, field):
+        free = self._free[(field.max_x, field.max_y)]
+        if len(free) < self.size:
+            field.clear()
+            free.append(field)
+
+
+class GameSession:
+
+    def __init__(self, game_id, player_field, computer_field, comp):
+        self.game_id = game_id
+        self.player_field = player_field
+        self.computer_field = computer_field
+        self.comp = comp
+        self.lock = asyncio.Lock()
+        self.last_used = monotonic()
+        self.winner = None
+
+
+class GameServer:
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, pool_size=DEFAULT_POOL_SIZE, rng=None,
+                 max_side=DEFAULT_MAX_SIDE):
+        self.idle_timeout = idle_timeout
+        self.max_side = max_side
+        self.rng = as_random(rng) or random.Random()
+        self.pool = FieldPool(pool_size)
+        self.sessions = {}
+        self.latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+        self._ids = count(1)
+        self._server = None
+        self._evictor = None
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        if path:
+            self._server = await asyncio.start_unix_server(self.handle_client, path)
+        else:
+            self._server = await asyncio.start_server(self.handle_client, host, port)
+        self._evictor = asyncio.ensure_future(self._evict_forever())
+        return self._server
+
+    async def close(self):
+        if self._evictor:
+            self._evictor.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for game_id in list(self.sessions):
+            self.drop(game_id)
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(json.dumps(await self.dispatch(line)).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, line):
+        request = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ProtocolError(f'Request must be an object, not {type(request).__name__}')
+            op = request.get('op')
+            handler = getattr(self, f'op_{op}', None) if isinstance(op, str) else None
+            if handler is None:
+                raise ProtocolError(f'Unknown op {op!r}')
+            started = perf_counter()
+            response = await handler(request)
+            self.latencies[op].append(perf_counter() - started)
+            response['ok'] = True
+        except (ValueError, KeyError, TypeError, ProtocolError, IncorrectCoordinate, NoSpaceLeft) as error:
+            response = dict(ok=False, error=f'{type(error).__name__}: {error}')
+        except Exception as error:
+            response = dict(ok=False, error=f'InternalError: {type(error).__name__}')
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def session(self, request):
+        session = self.sessions.get(request['game'])
+        if session is None:
+            raise ProtocolError(f'Unknown game {request["game"]!r}')
+        session.last_used = monotonic()
+        return session
+
+    def drop(self, game_id):
+        session = self.sessions.pop(game_id, None)
+        if session is not None:
+            self.pool.release(session.player_field)
+            self.pool.release(session.computer_field)
+            self.pool.release(session.comp.target_field)
+
+    def evict_idle(self, now=None):
+        deadline = (monotonic() if now is None else now) - self.idle_timeout
+        expired = [game_id for game_id, session in self.sessions.items()
+                   if session.last_used < deadline and not session.lock.locked()]
+        for game_id in expired:
+            self.drop(game_id)
+        return len(expired)
+
+    async def _evict_forever(self):
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 4, 0.01))
+            self.evict_idle()
+
+    def board_params(self, request):
+        max_x, max_y, fleet = request.get('max_x', DEFAULT_MAX_X), request.get('max_y', DEFAULT_MAX_Y), \
+            request.get('fleet')
+        for side in (max_x, max_y):
+            if type(side) is not int or not 0 < side <= self.max_side:
+                raise ProtocolError(f'Board side must be an integer in 1..{self.max_side}, not {side!r}')
+        if fleet is not None:
+            if not isinstance(fleet, list) or \
+                    any(type(size) is not int or not 0 < size <= max(max_x, max_y) for size in fleet):
+                raise ProtocolError(f'Fleet must be a list of ship sizes in 1..{max(max_x, max_y)}')
+            if sum(fleet) > max_x * max_y:
+                raise ProtocolError(f'Fleet of {sum(fleet)} cells does not fit a {max_x}x{max_y} board')
+        return max_x, max_y, fleet
+
+    async def op_new(self, request):
+        max_x, max_y, fleet = self.board_params(request)
+        fields = [self.pool.get(max_x, max_y) for _ in range(3)]
+        try:
+            SeaPlayground.put_ships_random(fields[0], fleet, self.rng)
+            SeaPlayground.put_ships_random(fields[1], fleet, self.rng)
+            comp = ComputerPlayer(max_x, max_y, target_field=fields[2], rng=self.rng)
+        except Exception:
+            [self.pool.release(field) for field in fields]
+            raise
+        game_id = str(next(self._ids))
+        self.sessions[game_id] = GameSession(game_id, fields[0], fields[1], comp)
+        return dict(game=game_id, ships=fields[0].ships())
+
+    async def op_shoot(self, request):
+        session = self.session(request)
+        async with session.lock:
+            if session.winner:
+                raise ProtocolError(f'Game {session.game_id} is over')
+            answer = SeaPlayground.income_shoot_to(session.computer_field, int(request['x']), int(request['y']))
+            session.winner = 'player' if answer['signal'] == SIGNALS.WIN else None
+        return dict(answer=answer)
+
+    async def op_computer(self, request):
+        session = self.session(request)
+        async with session.lock:
+            if session.winner:
+                raise ProtocolError(f'Game {session.game_id} is over')
+            coord_x, coord_y = session.comp.select_target()
+            answer = SeaPlayground.income_shoot_to(session.player_field, coord_x, coord_y)
+            session.comp.handle_shoot_answer(**answer)
+            session.winner = 'computer' if answer['signal'] == SIGNALS.WIN else None
+        return dict(x=coord_x, y=coord_y, answer=answer)
+
+    async def op_close(self, request):
+        async with self.session(request).lock:
+            self.drop(request['game'])
+        return {}
+
+    async def op_stats(self, request):
+        return dict(sessions=len(self.sessions), pool_reused=self.pool.reused,
+                    latency=latency_summary(self.latencies))
+
+
+class GameClient:
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._ids = count(1)
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=None, path=None):
+        if path:
+            return cls(*await asyncio.open_unix_connection(path))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, op, **params):
+        self.writer.write(json.dumps(dict(params, op=op, id=next(self._ids))).encode() + b'\n')
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        if not response.pop('ok'):
+            raise ProtocolError(response['error'])
+        return response
+
+    async def close(self):
+        self.writer.close()
+
+
+async def play_remote_game(client, rng, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, latencies=None):
+    game = (await client.request('new', max_x=max_x, max_y=max_y))['game']
+    targets = [(x, y) for x in range(max_x) for y in range(max_y)]
+    rng.shuffle(targets)
+    for x, y in targets:
+        for op, params in (('shoot', dict(x=x, y=y)), ('computer', {})):
+            started = perf_counter()
+            answer = (await client.request(op, game=game, **params))['answer']
+            if latencies is not None:
+                latencies[op].append(perf_counter() - started)
+            if answer['signal'] == SIGNALS.WIN:
+                await client.request('close', game=game)
+                return op
+
+
+async def run_load(games, concurrency=64, host='127.0.0.1', port=None, path=None, seed=None):
+    latencies = defaultdict(list)
+    queue = deque(range(games))
+    rng = random.Random(seed)
+
+    async def worker():
+        client = await GameClient.connect(host, port, path)
+        try:
+            while queue:
+                queue.popleft()
+                await play_remote_game(client, rng, latencies=latencies)
+        finally:
+            await client.close()
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, games))))
+    elapsed = perf_counter() - started
+    return dict(games=games, seconds=elapsed, latency=latency_summary(latencies))
+
+
+async def serve(host, port, path, idle_timeout):
+    server = GameServer(idle_timeout)
+    listener = await server.start(host, port, path)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m seawar_skeleton.server')
+    parser.add_argument('command', choices=('serve', 'load'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='unix socket path instead of TCP')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        asyncio.run(serve(args.host, args.port, args.unix, args.idle_timeout))
+    else:
+        print(json.dumps(asyncio.run(run_load(args.games, args.concurrency, args.host, args.port, args.unix)),
+                         indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import random
+from collections import Counter
+from os import cpu_count
+
+from .randomness import as_random, derive_rng
+from .seaplayground import DEFAULT_MAX_X, DEFAULT_MAX_Y, SIGNALS, SeaField, SeaPlayground, ComputerPlayer
+
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+class ShotStats:
+
+    def __init__(self, histogram=None):
+        self.histogram = Counter(histogram or {})
+
+    def __repr__(self):
+        return f'<ShotStats (games={self.games}; mean={self.mean:.2f})>'
+
+    @property
+    def games(self):
+        return sum(self.histogram.values())
+
+    @property
+    def mean(self):
+        games = self.games
+        return sum(shots * count for shots, count in self.histogram.items()) / games if games else 0.0
+
+    def add(self, shots):
+        self.histogram[shots] += 1
+
+    def merge(self, other):
+        self.histogram.update(other.histogram if isinstance(other, ShotStats) else other)
+        return self
+
+    def percentile(self, percent):
+        games = self.games
+        if not games:
+            return None
+        rank = max(1, -(-games * percent // 100))
+        seen = 0
+        for shots in sorted(self.histogram):
+            seen += self.histogram[shots]
+            if seen >= rank:
+                return shots
+
+    def as_dict(self, percents=(50, 90, 99)):
+        return dict(games=self.games, mean=self.mean, min=min(self.histogram, default=None),
+                    max=max(self.histogram, default=None),
+                    percentiles={percent: self.percentile(percent) for percent in percents},
+                    histogram=dict(sorted(self.histogram.items())))
+
+
+def play_game(max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None, strategy=None, rng=None):
+    rng = as_random(rng)
+    enemy_field = SeaField(max_x, max_y)
+    SeaPlayground.put_ships_random(enemy_field, fleet, rng)
+    comp = ComputerPlayer(max_x, max_y, strategy(rng=rng) if strategy else None, rng=rng)
+    for shots in range(1, max_x * max_y + 1):
+        if SeaPlayground.make_shoot_by_computer(comp, enemy_field)['signal'] == SIGNALS.WIN:
+            return shots
+    raise RuntimeError(f'Game on Field({max_x}:{max_y}) was not finished in {max_x * max_y} shots')
+
+
+def play_chunk(seed, start, games, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None, strategy=None):
+    return Counter(play_game(max_x, max_y, fleet, strategy, derive_rng(seed, game))
+                   for game in range(start, start + games))
+
+
+def simulate(games, workers=None, seed=None, chunk_size=DEFAULT_CHUNK_SIZE, max_x=DEFAULT_MAX_X,
+             max_y=DEFAULT_MAX_Y, fleet=None, strategy=None):
+    seed = random.randrange(1 << 64) if seed is None else seed
+    tasks = ((seed, start, min(chunk_size, games - start), max_x, max_y, fleet, strategy)
+             for start in range(0, games, chunk_size))
+    stats = ShotStats()
+    if workers == 0:
+        for task in tasks:
+            stats.merge(play_chunk(*task))
+        return stats
+
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    workers = workers or cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        pending = set()
+        for task in tasks:
+            pending.add(executor.submit(play_chunk, *task))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                [stats.merge(future.result()) for future in done]
+        [stats.merge(future.result()) for future in pending]
+    return stats
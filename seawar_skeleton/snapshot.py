@@ -0,0 +1,90 @@
+import mmap
+import os
+from struct import Struct
+
+from .seaplayground import DEFAULT_MAX_X, DEFAULT_MAX_Y, SeaField
+
+
+ARCHIVE_MAGIC = b'SWAA'
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = Struct('<4sBxHHQ')
+MODES = {'r': 'rb', 'a': 'r+b', 'w': 'w+b'}
+
+
+class BoardArchive:
+
+    def __init__(self, path, mode='r', max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, field_class=SeaField):
+        if mode not in MODES:
+            raise ValueError(f'Unknown archive mode {mode!r}, expected one of {", ".join(MODES)}')
+        self.path = path
+        self.field_class = field_class
+        self._file = open(path, MODES[mode])
+        self._map = None
+        if mode == 'w':
+            self.max_x, self.max_y, self._count = max_x, max_y, 0
+            self._write_header()
+        else:
+            header = self._file.read(ARCHIVE_HEADER.size)
+            magic, version, self.max_x, self.max_y, self._count = ARCHIVE_HEADER.unpack(header)
+            if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+                self._file.close()
+                raise ValueError(f'{path} is not a board archive')
+        self.record_size = SeaField.snapshot_size(self.max_x, self.max_y)
+        if os.fstat(self._file.fileno()).st_size < ARCHIVE_HEADER.size + self._count * self.record_size:
+            self._file.close()
+            raise ValueError(f'{path} is shorter than its {self._count} boards')
+        self.writable = mode != 'r'
+
+    def __repr__(self):
+        return f'<BoardArchive {self.path!r} ({len(self)} boards of {self.max_x}x{self.max_y})>'
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        if self._map is None:
+            self._file.flush()
+            self._map = memoryview(mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ))
+        return self.field_class.from_buffer(self._map, ARCHIVE_HEADER.size + position * self.record_size)
+
+    def __iter__(self):
+        return (self[position] for position in range(self._count))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(self, field):
+        if not self.writable:
+            raise IOError(f'{self.path} is opened read-only')
+        if (field.max_x, field.max_y) != (self.max_x, self.max_y):
+            raise ValueError(f'Field({field.max_x}:{field.max_y}) in archive of {self.max_x}x{self.max_y} boards')
+        self._release_map()
+        self._file.seek(ARCHIVE_HEADER.size + self._count * self.record_size)
+        self._file.write(field.to_bytes())
+        self._count += 1
+
+    def extend(self, fields):
+        for field in fields:
+            self.append(field)
+
+    def close(self):
+        self._release_map()
+        if self.writable and not self._file.closed:
+            self._write_header()
+        self._file.close()
+
+    def _write_header(self):
+        self._file.seek(0)
+        self._file.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, self.max_x, self.max_y, self._count))
+        self._file.flush()
+
+    def _release_map(self):
+        # fields loaded earlier keep views into the old mapping, it is unmapped once they are gone
+        self._map = None
@@ -0,0 +1,123 @@
+from bisect import bisect_left, insort
+from random import randrange
+
+from .seaplayground import DEFAULT_MAX_X, DEFAULT_MAX_Y, Cell, SeaField
+
+
+REJECTION_ATTEMPTS = 64
+
+
+class SparseCells(dict):
+
+    def __missing__(self, index):
+        return Cell.EMPTY
+
+    def __setitem__(self, index, value):
+        if value == Cell.EMPTY:
+            self.pop(index, None)
+        else:
+            super().__setitem__(index, value)
+
+
+class SparseSeaField(SeaField):
+
+    def __init__(self, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, data=None):
+        self._rows = {}
+        self._columns = {}
+        super().__init__(max_x, max_y, SparseCells())
+        if data is not None:
+            for index in range(max_x * max_y):
+                self.set_at(index, data[index])
+
+    def __sizeof__(self):
+        return (super().__sizeof__() + self._rows.__sizeof__() + self._columns.__sizeof__() +
+                sum(line.__sizeof__() for lines in (self._rows, self._columns) for line in lines.values()))
+
+    def _copy_data(self):
+        super()._copy_data()
+        self._rows = {line: list(occupied) for line, occupied in self._rows.items()}
+        self._columns = {line: list(occupied) for line, occupied in self._columns.items()}
+
+    def clear(self):
+        if self._shared:
+            self._unshare()
+        self._record_clear()
+        self._data.clear()
+        self._rows.clear()
+        self._columns.clear()
+        self._reset_ships()
+
+    def set_at(self, index, value):
+        was_empty = self.get_at(index) in self.EMPTY_VALUES
+        super().set_at(index, value)
+        if was_empty is not (value in self.EMPTY_VALUES):
+            coord_x, coord_y = self.coord(index)
+            for lines, line, position in ((self._rows, coord_y, coord_x), (self._columns, coord_x, coord_y)):
+                if was_empty:
+                    insort(lines.setdefault(line, []), position)
+                else:
+                    occupied = lines[line]
+                    del occupied[bisect_left(occupied, position)]
+                    if not occupied:
+                        del lines[line]
+
+    def filled(self):
+        return sorted(self._data.items())
+
+    def occupied(self):
+        return len(self._data)
+
+    def is_cell_suitable(self, coord_x, coord_y, length, is_vertical=False):
+        start, limit = (coord_y, self.max_y) if is_vertical else (coord_x, self.max_x)
+        if not (self.is_coord_correct(coord_x, coord_y) and 0 < length and start + length <= limit):
+            return False
+        occupied = (self._columns if is_vertical else self._rows).get(coord_x if is_vertical else coord_y)
+        if not occupied:
+            return True
+        position = bisect_left(occupied, start)
+        return position == len(occupied) or occupied[position] >= start + length
+
+    def free_runs(self, is_vertical=False):
+        outer, inner = (self.max_x, self.max_y) if is_vertical else (self.max_y, self.max_x)
+        lines = self._columns if is_vertical else self._rows
+        for line in range(outer):
+            previous = -1
+            for occupied in lines.get(line, []) + [inner]:
+                if occupied - previous > 1:
+                    yield line, previous + 1, occupied
+                previous = occupied
+
+    def _placements(self, length):
+        for is_vertical in (True, False):
+            for line, start, end in self.free_runs(is_vertical):
+                if end - start >= length:
+                    yield is_vertical, line, start, end - start - length + 1
+
+    def suitable_cells(self, length):
+        cells = [(self.index(*((line, position) if is_vertical else (position, line))), not is_vertical)
+                 for is_vertical, line, start, count in self._placements(length)
+                 for position in range(start, start + count)]
+        return [(*self.coord(index), not is_horizontal) for index, is_horizontal in sorted(cells)]
+
+    def random_suitable_cell(self, length, rng=None):
+        random_index = rng.randrange if rng else randrange
+        vertical = max(self.max_y - length + 1, 0) * self.max_x
+        horizontal = max(self.max_x - length + 1, 0) * self.max_y
+        if length < 1 or not vertical + horizontal:
+            return None
+        for _ in range(REJECTION_ATTEMPTS):
+            position = random_index(vertical + horizontal)
+            if position < vertical:
+                cell = (position % self.max_x, position // self.max_x, True)
+            else:
+                position -= vertical
+                cell = (position % (self.max_x - length + 1), position // (self.max_x - length + 1), False)
+            if self.is_cell_suitable(cell[0], cell[1], length, cell[2]):
+                return cell
+        placements = list(self._placements(length))
+        position = random_index(sum(count for *_, count in placements)) if placements else None
+        for is_vertical, line, start, count in placements:
+            if position < count:
+                return (line, start + position, True) if is_vertical else (start + position, line, False)
+            position -= count
+        return None
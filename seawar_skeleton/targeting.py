@@ -0,0 +1,230 @@
+from collections import Counter
+from heapq import heapify, heappop, heappush
+from random import choice, randrange
+
+from .seaplayground import STANDARD_SHIP_FLEET, SIGNALS, Cell, RandomTargeting
+
+
+class DensityTargeting(RandomTargeting):
+    HIT_WEIGHT = 16
+
+    def __init__(self, fleet=None, rng=None):
+        super().__init__(rng)
+        self.fleet = list(fleet if fleet else STANDARD_SHIP_FLEET)
+        self.remaining = Counter()
+        self.density = []
+        self._placements = {}
+        self._probable = set()
+        self._hits = set()
+        self._open = set()
+        self._buckets = {}
+        self._levels = []
+
+    def attach(self, field):
+        super().attach(field)
+        sunk = self.sunk_ships(field)
+        self.remaining = Counter(self.fleet)
+        self.remaining.subtract(map(len, sunk))
+        self.remaining = +self.remaining
+        self.density = [0] * (field.max_x * field.max_y)
+        self._probable = {index for index in range(len(self.density)) if field.get_at(index) == Cell.PROBABLY_SHIP}
+        self._open = {index for index in range(len(self.density)) if field.get_at(index) in field.EMPTY_VALUES}
+        self._hits = {index for index in range(len(self.density)) if field.get_at(index) == Cell.HIT} - \
+            {field.index(*cell) for ship in sunk for cell in ship}
+        self._buckets, self._levels = {}, []
+        for index in self._open:
+            self._enter(index, 0)
+        self._placements = {}
+        for length in self.remaining:
+            self._placements[length] = {}
+            for index in range(len(self.density)):
+                for is_vertical in ((False,) if length == 1 else (True, False)):
+                    line = field.geometry.line(index, length, is_vertical)
+                    if line is not None and all(cell in self._open or cell in self._hits for cell in line):
+                        self._add_placement(length, (index, is_vertical), sum(cell in self._hits for cell in line))
+
+    @staticmethod
+    def sunk_ships(field):
+        seen, sunk = set(), []
+        for coord_x, coord_y in field.cells:
+            if (coord_x, coord_y) in seen or field.get(coord_x, coord_y) != Cell.HIT:
+                continue
+            ship = field.find_ship_by_cells(coord_x, coord_y)
+            seen |= ship
+            if all(field.get(*cell) == Cell.HIT for cell in ship) and not any(
+                    field.is_cell_empty(*rib) for cell in ship for rib in field._find_cell_ribs(*cell)):
+                sunk.append(ship)
+        return sunk
+
+    @classmethod
+    def killed_ships(cls, field):
+        return [len(ship) for ship in cls.sunk_ships(field)]
+
+    def handle_shoot_answer(self, signal, cells):
+        touched = {self.field.index(coord_x + shift_x, coord_y + shift_y)
+                   for coord_x, coord_y in cells for shift_x in (-1, 0, 1) for shift_y in (-1, 0, 1)
+                   if self.field.is_coord_correct(coord_x + shift_x, coord_y + shift_y)}
+        sunk = {self.field.index(*cell) for cell in cells} if signal in (SIGNALS.KILLED, SIGNALS.WIN) else set()
+        for index in sorted(touched):
+            value = self.field.get_at(index)
+            if value == Cell.PROBABLY_SHIP:
+                self._probable.add(index)
+            elif value == Cell.HIT and index not in sunk:
+                if index not in self._hits:
+                    self._close(index)
+                    self._hit(index)
+            elif value not in self.field.EMPTY_VALUES:
+                self._close(index)
+                self._block(index)
+        self._hits -= sunk
+        if sunk:
+            self._remove_ship(len(cells))
+
+    def select_target(self):
+        probable = [index for index in self._probable if self.field.get_at(index) == Cell.PROBABLY_SHIP]
+        self._probable = set(probable)
+        if probable:
+            best = max(self.density[index] for index in probable)
+            targets = sorted(index for index in probable if self.density[index] == best)
+        else:
+            best = self._best()
+            targets = sorted(self._buckets[best]) if best else []
+        if not targets:
+            return super().select_target()
+        return self.field.coord((self.rng.choice if self.rng else choice)(targets))
+
+    def placements_over(self, index, length):
+        coord_x, coord_y = self.field.coord(index)
+        for is_vertical in ((False,) if length == 1 else (True, False)):
+            position = coord_y if is_vertical else coord_x
+            step = self.field.max_x if is_vertical else 1
+            for shift in range(length):
+                if position - shift >= 0:
+                    yield index - shift * step, is_vertical
+
+    def _covered(self, length, placement):
+        start, is_vertical = placement
+        step = self.field.max_x if is_vertical else 1
+        return range(start, start + length * step, step)
+
+    def _weight(self, length, hits):
+        return self.remaining[length] * (1 + self.HIT_WEIGHT * hits)
+
+    def _add_placement(self, length, placement, hits=0):
+        self._placements[length][placement] = hits
+        self._shift(length, placement, self._weight(length, hits))
+
+    def _hit(self, index):
+        self._hits.add(index)
+        for length, placements in self._placements.items():
+            for placement in self.placements_over(index, length):
+                if placement in placements:
+                    placements[placement] += 1
+                    self._shift(length, placement, self.remaining[length] * self.HIT_WEIGHT)
+
+    def _block(self, index):
+        for length, placements in self._placements.items():
+            for placement in self.placements_over(index, length):
+                if placement in placements:
+                    self._shift(length, placement, -self._weight(length, placements.pop(placement)))
+
+    def _remove_ship(self, length):
+        if not self.remaining[length]:
+            return
+        for placement, hits in self._placements[length].items():
+            self._shift(length, placement, -1 - self.HIT_WEIGHT * hits)
+        self.remaining[length] -= 1
+        if not self.remaining[length]:
+            del self.remaining[length]
+            del self._placements[length]
+
+    # open cells are bucketed by density and the bucket values kept in a lazy max-heap,
+    # so select_target does not rescan the board
+    def _shift(self, length, placement, delta):
+        density, is_open = self.density, self._open
+        for index in self._covered(length, placement):
+            if index in is_open:
+                self._leave(index)
+                self._enter(index, density[index] + delta)
+            density[index] += delta
+
+    def _enter(self, index, value):
+        bucket = self._buckets.get(value)
+        if bucket is None:
+            bucket = self._buckets[value] = set()
+            heappush(self._levels, -value)
+        bucket.add(index)
+
+    def _leave(self, index):
+        value = self.density[index]
+        bucket = self._buckets[value]
+        bucket.discard(index)
+        if not bucket:
+            del self._buckets[value]
+
+    def _close(self, index):
+        if index in self._open:
+            self._open.remove(index)
+            self._leave(index)
+
+    def _best(self):
+        levels = self._levels
+        if len(levels) > 4 * len(self._buckets) + 64:
+            levels[:] = [-value for value in self._buckets]
+            heapify(levels)
+        while levels and -levels[0] not in self._buckets:
+            heappop(levels)
+        return -levels[0] if levels else 0
+
+
+class MonteCarloTargeting(RandomTargeting):
+
+    def __init__(self, fleet=None, rng=None, budget=None, max_samples=None, executor=None, workers=1):
+        from .sampler import DEFAULT_BUDGET
+        super().__init__(rng)
+        self.fleet = list(fleet if fleet else STANDARD_SHIP_FLEET)
+        self.budget = DEFAULT_BUDGET if budget is None else budget
+        self.max_samples = max_samples
+        self.executor = executor
+        self.workers = workers
+        self.samples = 0
+
+    def select_target(self):
+        from .sampler import posterior_heat
+        heat, self.samples = posterior_heat(self.field, self.fleet, self.budget, self.max_samples, self.rng,
+                                            self.executor, self.workers)
+        candidates = [index for index in range(len(heat)) if self.field.get_at(index) in self.field.EMPTY_VALUES]
+        best = max((heat[index] for index in candidates), default=0)
+        targets = [index for index in candidates if heat[index] == best] if best else []
+        if not targets:
+            return super().select_target()
+        return self.field.coord((self.rng.choice if self.rng else choice)(targets))
+
+
+class SparseTargeting(RandomTargeting):
+
+    def __init__(self, rng=None, attempts=None):
+        from .sparse import REJECTION_ATTEMPTS
+        super().__init__(rng)
+        self.attempts = REJECTION_ATTEMPTS if attempts is None else attempts
+        self._probable = set()
+
+    def attach(self, field):
+        super().attach(field)
+        self._probable = set()
+
+    def handle_shoot_answer(self, signal, cells):
+        if signal is SIGNALS.HITTING:
+            self._probable.update(self.field.index(*rib) for cell in cells for rib in self.field._find_cell_ribs(*cell)
+                                  if self.field.get(*rib) == Cell.PROBABLY_SHIP)
+
+    def select_target(self):
+        self._probable = {index for index in self._probable if self.field.get_at(index) == Cell.PROBABLY_SHIP}
+        if self._probable:
+            return self.field.coord((self.rng.choice if self.rng else choice)(sorted(self._probable)))
+        area = self.field.max_x * self.field.max_y
+        for _ in range(self.attempts):
+            index = (self.rng.randrange if self.rng else randrange)(area)
+            if self.field.get_at(index) in self.field.EMPTY_VALUES:
+                return self.field.coord(index)
+        return super().select_target()
@@ -0,0 +1,243 @@
+import inspect
+import math
+import random
+from itertools import combinations
+from os import cpu_count
+from statistics import NormalDist
+
+from .randomness import derive_seed
+from .seaplayground import DEFAULT_MAX_X, DEFAULT_MAX_Y, SIGNALS, SeaField, SeaPlayground, Player, ComputerPlayer
+
+
+DEFAULT_BATCH = 20
+DEFAULT_MIN_GAMES = 40
+DEFAULT_MAX_GAMES = 2000
+DEFAULT_CONFIDENCE = 0.99
+ELO_SCALE = 400 / math.log(10)
+
+
+def look_confidence(confidence, look):
+    return 1 - (1 - confidence) * 6 / (math.pi * look) ** 2
+
+
+def is_player_class(entry):
+    entry = getattr(entry, 'func', entry)
+    return isinstance(entry, type) and issubclass(entry, Player)
+
+
+def make_player(entry, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, rng=None, fleet=None):
+    if is_player_class(entry):
+        kwargs = dict(max_x=max_x, max_y=max_y, rng=rng)
+        parameters = inspect.signature(entry).parameters
+        if fleet is not None and ('fleet' in parameters or
+                                  any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters.values())):
+            kwargs['fleet'] = fleet
+        return entry(**kwargs)
+    made = entry(rng=rng) if entry else None
+    return made if isinstance(made, Player) else ComputerPlayer(max_x, max_y, made, rng=rng)
+
+
+def shots_to_win(player, enemy_field):
+    for shots in range(1, enemy_field.max_x * enemy_field.max_y + 1):
+        if SeaPlayground.make_shoot_by_computer(player, enemy_field)['signal'] == SIGNALS.WIN:
+            return shots
+    raise RuntimeError(f'{player!r} did not finish Field({enemy_field.max_x}:{enemy_field.max_y})')
+
+
+def play_layout(seed, game, name, entry, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None):
+    enemy_field = SeaField(max_x, max_y)
+    SeaPlayground.put_ships_random(enemy_field, fleet, random.Random(derive_seed(seed, 'layout', game)))
+    player = make_player(entry, max_x, max_y, random.Random(derive_seed(seed, 'player', name, game)), fleet)
+    return shots_to_win(player, enemy_field)
+
+
+def play_batch(seed, start, games, first, second, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None):
+    scores = []
+    for game in range(start, start + games):
+        first_shots, second_shots = (play_layout(seed, game, name, entry, max_x, max_y, fleet)
+                                     for name, entry in (first, second))
+        scores.append(1.0 if first_shots < second_shots else 0.5 if first_shots == second_shots else 0.0)
+    return scores
+
+
+class PairStats:
+
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.wins = self.draws = self.losses = 0
+        self.looks = 0
+        self.decided = False
+
+    def __repr__(self):
+        return f'<PairStats ({self.first} vs {self.second}; games={self.games}; score={self.score:.3f})>'
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self):
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    def add(self, score):
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def merge(self, scores):
+        [self.add(score) for score in scores]
+        return self
+
+    def interval(self, confidence=DEFAULT_CONFIDENCE):
+        if not self.games:
+            return 0.0, 1.0
+        variance = (self.wins + self.draws / 4) / self.games - self.score ** 2
+        margin = NormalDist().inv_cdf((1 + confidence) / 2) * math.sqrt(max(variance, 0) / self.games)
+        return max(self.score - margin, 0.0), min(self.score + margin, 1.0)
+
+    def is_significant(self, confidence=DEFAULT_CONFIDENCE, min_games=DEFAULT_MIN_GAMES):
+        low, high = self.interval(confidence)
+        return self.games >= min_games and (low > 0.5 or high < 0.5)
+
+    def check(self, confidence=DEFAULT_CONFIDENCE, min_games=DEFAULT_MIN_GAMES):
+        if self.games < min_games:
+            return False
+        self.looks += 1
+        decisive = self.wins + self.losses
+        z = abs(self.wins - self.losses) / math.sqrt(decisive) if decisive else 0.0
+        self.decided = z > NormalDist().inv_cdf((1 + look_confidence(confidence, self.looks)) / 2)
+        return self.decided
+
+    def as_dict(self, confidence=DEFAULT_CONFIDENCE):
+        return dict(first=self.first, second=self.second, games=self.games, wins=self.wins, draws=self.draws,
+                    losses=self.losses, score=self.score, interval=self.interval(confidence), looks=self.looks,
+                    decided=self.decided)
+
+
+def elo_ratings(pairs, confidence=DEFAULT_CONFIDENCE, iterations=500, prior=1):
+    names = sorted({name for pair in pairs for name in (pair.first, pair.second)})
+    points = {name: {} for name in names}
+    games = {name: {} for name in names}
+    for pair in pairs:
+        if not pair.games:
+            continue
+        score = pair.wins + pair.draws / 2
+        for one, other, won in ((pair.first, pair.second, score), (pair.second, pair.first, pair.games - score)):
+            points[one][other] = points[one].get(other, 0) + won + prior / 2
+            games[one][other] = games[one].get(other, 0) + pair.games + prior
+    strength = dict.fromkeys(names, 1.0)
+    for _ in range(iterations):
+        for name in names:
+            expected = sum(played / (strength[name] + strength[other]) for other, played in games[name].items())
+            if expected:
+                strength[name] = sum(points[name].values()) / expected
+        scale = math.exp(sum(map(math.log, strength.values())) / len(names)) if names else 1
+        strength = {name: value / scale for name, value in strength.items()}
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    ratings = {}
+    for name in names:
+        elo = ELO_SCALE * math.log(strength[name])
+        information = sum(played * strength[name] * strength[other] / (strength[name] + strength[other]) ** 2
+                          for other, played in games[name].items())
+        margin = z * ELO_SCALE / math.sqrt(information) if information else math.inf
+        ratings[name] = dict(elo=elo, low=elo - margin, high=elo + margin)
+    return ratings
+
+
+class Tournament:
+
+    def __init__(self, strategies=None, seed=None, max_x=DEFAULT_MAX_X, max_y=DEFAULT_MAX_Y, fleet=None,
+                 batch=DEFAULT_BATCH, min_games=DEFAULT_MIN_GAMES, max_games=DEFAULT_MAX_GAMES,
+                 confidence=DEFAULT_CONFIDENCE, workers=None):
+        self.strategies = dict(strategies or {})
+        self.seed = random.randrange(1 << 64) if seed is None else seed
+        self.max_x = max_x
+        self.max_y = max_y
+        self.fleet = fleet
+        self.batch = batch
+        self.min_games = min_games
+        self.max_games = max_games
+        self.confidence = confidence
+        self.workers = workers
+        self.pairs = {}
+
+    def register(self, name, entry=None):
+        self.strategies[name] = entry
+        return entry
+
+    def pair(self, first, second):
+        key = tuple(sorted((first, second)))
+        if key not in self.pairs:
+            self.pairs[key] = PairStats(*key)
+        return self.pairs[key]
+
+    def points(self, name):
+        return sum(pair.wins + pair.draws / 2 if pair.first == name else pair.losses + pair.draws / 2
+                   for pair in self.pairs.values() if name in (pair.first, pair.second))
+
+    def worker_count(self):
+        return 1 if self.workers == 0 else self.workers or cpu_count() or 1
+
+    def executor(self):
+        if self.workers == 0:
+            return None
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(self.worker_count())
+
+    def tasks(self, pair, parts=1):
+        games = min(self.batch, self.max_games - pair.games)
+        parts = max(min(parts, games), 1)
+        first, second = (pair.first, self.strategies[pair.first]), (pair.second, self.strategies[pair.second])
+        bounds = [pair.games + games * part // parts for part in range(parts + 1)]
+        return [(self.seed, start, stop - start, first, second, self.max_x, self.max_y, self.fleet)
+                for start, stop in zip(bounds, bounds[1:])]
+
+    def round_robin(self):
+        pairs = [self.pair(*names) for names in combinations(sorted(self.strategies), 2)]
+        executor = self.executor()
+        try:
+            while True:
+                active = [pair for pair in pairs if not pair.decided and pair.games < self.max_games]
+                if not active:
+                    return self.results()
+                self.play(active, executor)
+        finally:
+            if executor:
+                executor.shutdown()
+
+    def swiss(self, rounds):
+        executor = self.executor()
+        try:
+            for _ in range(rounds):
+                standings = sorted(self.strategies, key=lambda name: (-self.points(name), name))
+                pairings = []
+                while len(standings) > 1:
+                    first = standings.pop(0)
+                    second = next((name for name in standings if not self.pair(first, name).decided), standings[0])
+                    standings.remove(second)
+                    pairings.append(self.pair(first, second))
+                self.play([pair for pair in pairings if not pair.decided and pair.games < self.max_games], executor)
+        finally:
+            if executor:
+                executor.shutdown()
+        return self.results()
+
+    def play(self, pairs, executor=None):
+        parts = 1 if executor is None else self.worker_count()
+        tasks = [self.tasks(pair, parts) for pair in pairs]
+        if executor is None:
+            results = [[play_batch(*task) for task in pair_tasks] for pair_tasks in tasks]
+        else:
+            futures = [[executor.submit(play_batch, *task) for task in pair_tasks] for pair_tasks in tasks]
+            results = [[future.result() for future in pair_futures] for pair_futures in futures]
+        for pair, batches in zip(pairs, results):
+            [pair.merge(scores) for scores in batches]
+            pair.check(self.confidence, self.min_games)
+
+    def results(self):
+        return dict(seed=self.seed, pairs=[pair.as_dict(self.confidence) for pair in self.pairs.values()],
+                    ratings=elo_ratings(list(self.pairs.values()), self.confidence))
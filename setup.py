@@ -4,6 +4,12 @@ from os.path import join, dirname
 setup(
     name='seawar_skeleton',
     version='1.3.0',
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*', 'tests', 'tests.*')),
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': ['seawar = seawar_skeleton.cli:main'],
+    },
     long_description=open(join(dirname(__file__), 'README.md')).read(),
 )
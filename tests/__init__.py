@@ -1 +1,19 @@
-from .test_seafield import *
\ No newline at end of file
+from .test_seafield import *
+from .test_bulk import *
+from .test_simulation import *
+from .test_targeting import *
+from .test_bitboard import *
+from .test_benchmarks import *
+from .test_snapshot import *
+from .test_replay import *
+from .test_server import *
+from .test_randomness import *
+from .test_geometry import *
+from .test_instrumentation import *
+from .test_enumeration import *
+from .test_sampler import *
+from .test_sparse import *
+from .test_tournament import *
+from .test_cli import *
+from .test_journal import *
+from .test_fork import *
\ No newline at end of file
@@ -0,0 +1,18 @@
+import unittest
+
+from benchmarks.__main__ import run_case, compare
+from benchmarks.cases import CASES
+
+
+class BenchmarkSuiteTest(unittest.TestCase):
+
+    def test_cases_run(self):
+        for name in CASES:
+            result = run_case(name, rounds=1, scale=0.01)
+            assert result['name'] == name and result['min'] > 0
+
+    def test_compare(self):
+        baseline = dict(benchmarks=[dict(name='a', min=1.0), dict(name='b', min=1.0)])
+        results = dict(benchmarks=[dict(name='a', min=1.5), dict(name='b', min=1.1), dict(name='c', min=9.0)])
+        assert compare(results, baseline, 1.2) == ['a']
+        assert results['benchmarks'][1]['ratio'] == 1.1
@@ -0,0 +1,55 @@
+import random
+import unittest
+from itertools import product
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.seaplayground import SeaField, SeaPlayground, Cell, IncorrectCoordinate
+from tests import test_seafield
+
+
+class BitSeaFieldTest(test_seafield.SeaFieldTest):
+    field_class = BitSeaField
+
+
+class BitSeaPlaygroundTest(test_seafield.SeaPlaygroundTest):
+    field_class = BitSeaField
+
+
+class BitComputerPlayerTest(test_seafield.ComputerPlayerTest):
+    field_class = BitSeaField
+
+
+class BitSeaFieldCompatibilityTest(unittest.TestCase):
+
+    def test_same_as_seafield(self):
+        random.seed(11)
+        for _ in range(30):
+            max_x, max_y = random.randint(3, 9), random.randint(3, 9)
+            fields = SeaField(max_x, max_y), BitSeaField(max_x, max_y)
+            for _ in range(25):
+                coord_x, coord_y = random.randrange(max_x), random.randrange(max_y)
+                length, is_vertical = random.randint(1, 4), random.random() < 0.5
+                value = random.choice([None, None, None, Cell.MISSED, Cell.HIT, Cell.PROBABLY_SHIP])
+                for field in fields:
+                    if value is not None:
+                        field.set(coord_x, coord_y, value)
+                    try:
+                        SeaPlayground.put_ship(field, coord_x, coord_y, length, is_vertical)
+                    except IncorrectCoordinate:
+                        pass
+                field, bit_field = fields
+                assert list(field.cells) == list(bit_field.cells)
+                assert [field.get(*cell) for cell in field.cells] == [bit_field.get(*cell) for cell in field.cells]
+                for length in (1, 2, 3, 5):
+                    assert field.suitable_cells(length) == bit_field.suitable_cells(length)
+                for cell in field.cells:
+                    assert field.find_ship_by_cells(*cell) == bit_field.find_ship_by_cells(*cell)
+                    assert set(field._find_cell_ribs(*cell)) == set(bit_field._find_cell_ribs(*cell))
+                for (coord_x, coord_y), length, is_vertical in product(field.cells, (1, 3), (True, False)):
+                    assert (set(field._find_border_cells(coord_x, coord_y, length, is_vertical)) ==
+                            set(bit_field._find_border_cells(coord_x, coord_y, length, is_vertical)))
+                assert field.has_any_alive_ship() == bit_field.has_any_alive_ship()
+
+    def test_rejects_unknown_values(self):
+        with self.assertRaises(ValueError):
+            BitSeaField().set(0, 0, 7)
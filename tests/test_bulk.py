@@ -0,0 +1,88 @@
+import random
+import unittest
+from collections import Counter
+
+from seawar_skeleton.randomness import GeneratorRandom
+from seawar_skeleton.seaplayground import SeaPlayground, SeaField, Cell, NoSpaceLeft, STANDARD_SHIP_FLEET
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def board_ships(board):
+    field = SeaField(board.shape[1], board.shape[0])
+    ships = []
+    for (coord_y, coord_x), value in numpy.ndenumerate(board):
+        field.set(coord_x, coord_y, int(value))
+    for coord_x, coord_y in field.cells:
+        if field.get(coord_x, coord_y) == Cell.SHIP and not any((coord_x, coord_y) in ship for ship in ships):
+            ships.append(field.find_ship_by_cells(coord_x, coord_y))
+    return ships
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class BulkFleetTest(unittest.TestCase):
+
+    def check_board(self, board, fleet):
+        ships = board_ships(board)
+        assert Counter(map(len, ships)) == Counter(fleet)
+        for ship in ships:
+            x, y, length, is_vertical = SeaField.find_ship_vector(ship)
+            assert length == len(ship)
+            field = SeaField(board.shape[1], board.shape[0])
+            field.set_border(x, y, length, is_vertical)
+            for coord_x, coord_y in field.cells:
+                if field.get(coord_x, coord_y) == Cell.BORDER:
+                    assert board[coord_y, coord_x] == Cell.BORDER
+
+    def test_standard_fleet(self):
+        boards, failed = SeaPlayground.put_ships_random_bulk(200, rng=1)
+        assert boards.shape == (200, 10, 10) and boards.dtype == numpy.int8
+        assert not failed.any()
+        for board in boards:
+            self.check_board(board, STANDARD_SHIP_FLEET)
+
+    def test_custom_fleet_and_shape(self):
+        boards, _ = SeaPlayground.put_ships_random_bulk(50, [5, 2, 1], max_x=7, max_y=4, rng=2, chunk_size=16)
+        assert boards.shape == (50, 4, 7)
+        for board in boards:
+            self.check_board(board, [5, 2, 1])
+
+    def test_reproducible(self):
+        first, _ = SeaPlayground.put_ships_random_bulk(10, rng=5)
+        second, _ = SeaPlayground.put_ships_random_bulk(10, rng=5)
+        assert (first == second).all()
+
+    def test_chunk_size_independent(self):
+        first, _ = SeaPlayground.put_ships_random_bulk(600, [3, 2, 1], 6, 6, rng=7, chunk_size=100)
+        second, _ = SeaPlayground.put_ships_random_bulk(600, [3, 2, 1], 6, 6, rng=7, chunk_size=1 << 16)
+        assert (first == second).all()
+
+    def test_generator_random(self):
+        rng = GeneratorRandom(numpy.random.default_rng(3))
+        rng.gauss(0, 1)
+        state = rng.getstate()
+        drawn = [rng.gauss(0, 1), rng.random()]
+        rng.setstate(state)
+        assert [rng.gauss(0, 1), rng.random()] == drawn
+        with self.assertRaises(NotImplementedError):
+            rng.seed(1)
+
+    def test_rng_inputs(self):
+        first, _ = SeaPlayground.put_ships_random_bulk(10, rng=random.Random(5))
+        second, _ = SeaPlayground.put_ships_random_bulk(10, rng=random.Random(5))
+        assert (first == second).all()
+        generated, _ = SeaPlayground.put_ships_random_bulk(10, rng=GeneratorRandom(numpy.random.default_rng(5)))
+        assert (generated == SeaPlayground.put_ships_random_bulk(10, rng=numpy.random.default_rng(5))[0]).all()
+        with self.assertRaises(TypeError):
+            SeaPlayground.put_ships_random_bulk(10, rng='seed')
+
+    def test_no_space_left(self):
+        with self.assertRaises(NoSpaceLeft):
+            SeaPlayground.put_ships_random_bulk(5, [3, 3, 3], 4, 4, rng=0)
+        _, failed = SeaPlayground.put_ships_random_bulk(5, [3, 3, 3], 4, 4, rng=0, strict=False)
+        assert failed.all()
+        _, failed = SeaPlayground.put_ships_random_bulk(50, [3, 2, 2], 4, 4, rng=0, strict=False)
+        assert failed.any() and not failed.all()
@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import seawar_skeleton
+from seawar_skeleton.cli import STARTUP_BUDGET, STRATEGIES, load_strategy, main, measure_startup
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_light_import(self):
+        code = ('import sys, seawar_skeleton; seawar_skeleton.SeaField; '
+                'print(" ".join(sorted(sys.modules)))')
+        modules = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True,
+                                 text=True).stdout.split()
+        for heavy in ('numpy', 'asyncio', 'multiprocessing', 'concurrent.futures', 'hashlib',
+                      'seawar_skeleton.server', 'seawar_skeleton.sampler', 'seawar_skeleton.bulk'):
+            assert heavy not in modules, heavy
+
+    def test_density_targeting_import(self):
+        code = ('import sys; from seawar_skeleton.targeting import DensityTargeting; '
+                'print(" ".join(sorted(sys.modules)))')
+        modules = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True,
+                                 text=True).stdout.split()
+        for heavy in ('seawar_skeleton.sampler', 'seawar_skeleton.enumeration', 'seawar_skeleton.sparse',
+                      'seawar_skeleton.bitboard'):
+            assert heavy not in modules, heavy
+
+    def test_exports(self):
+        from seawar_skeleton.seaplayground import SeaField
+        assert seawar_skeleton.SeaField is SeaField
+        assert 'SeaField' in vars(seawar_skeleton)
+        assert 'Tournament' in dir(seawar_skeleton)
+        for name in seawar_skeleton.__all__:
+            assert getattr(seawar_skeleton, name) is not None
+        assert 'put_ships_random_bulk' not in seawar_skeleton.__all__
+        exec('from seawar_skeleton import *', {})
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        if numpy is not None:
+            assert seawar_skeleton.put_ships_random_bulk is not None
+        with self.assertRaises(AttributeError):
+            seawar_skeleton.Missing
+
+
+class CliTest(unittest.TestCase):
+
+    def run_main(self, *argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            assert main(list(argv)) == 0
+        return output.getvalue()
+
+    def test_play(self):
+        output = self.run_main('play', '--seed', '3', '--strategy', 'density')
+        assert output == self.run_main('play', '--seed', '3', '--strategy', 'density')
+        assert output.startswith('shots: ') and 0 < int(output.split()[1]) <= 100
+
+    def test_simulate(self):
+        stats = json.loads(self.run_main('simulate', '-n', '5', '-j', '0', '--seed', '1'))
+        assert stats['games'] == 5 and stats['min'] <= stats['mean'] <= stats['max']
+
+    def test_strategies(self):
+        for name in STRATEGIES:
+            assert (load_strategy(name) is None) == (name == 'random')
+
+    def test_unknown_arguments(self):
+        with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit):
+            main(['play', '--bogus'])
+
+    @unittest.skipIf(os.environ.get('SEAWAR_SKIP_STARTUP_BUDGET'), 'startup budget disabled for slow CI')
+    def test_startup(self):
+        interpreter, startup = measure_startup(['play', '--seed', '0'], rounds=5)
+        assert interpreter > 0 and startup < STARTUP_BUDGET, f'{startup * 1e3:.2f} ms'
+
+    def test_bench_without_checkout(self):
+        with mock.patch.dict(sys.modules, {'benchmarks.__main__': None}), redirect_stderr(io.StringIO()):
+            assert main(['bench', '-k', 'none']) == 2
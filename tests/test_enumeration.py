@@ -0,0 +1,64 @@
+import unittest
+from collections import Counter
+
+from seawar_skeleton.enumeration import LayoutSpace, count_layouts, enumerate_layouts, occupancy_probabilities
+from seawar_skeleton.seaplayground import Cell, SeaField, SeaPlayground
+
+
+def brute_force(max_x, max_y, fleet, field=None, placed=()):
+    field = field or SeaField(max_x, max_y)
+    if not fleet:
+        return {tuple(sorted(placed))}
+    out = set()
+    for coord_x, coord_y, is_vertical in field.suitable_cells(fleet[0]):
+        if fleet[0] == 1 and not is_vertical:
+            continue
+        child = SeaField(max_x, max_y)
+        for ship in placed + ((coord_x, coord_y, fleet[0], is_vertical),):
+            SeaPlayground.put_ship(child, *ship)
+        out |= brute_force(max_x, max_y, fleet[1:], child, placed + ((coord_x, coord_y, fleet[0], is_vertical),))
+    return out
+
+
+class LayoutSpaceTest(unittest.TestCase):
+
+    def test_count_matches_brute_force(self):
+        for max_x, max_y, fleet in ((3, 3, [1]), (3, 3, [2]), (4, 4, [2, 1]), (4, 3, [3, 1, 1]), (5, 4, [3, 2, 1])):
+            assert count_layouts(max_x, max_y, fleet) == len(brute_force(max_x, max_y, fleet))
+        assert count_layouts(2, 2, [3]) == 0
+        assert count_layouts(5, 4, [3, 2, 1], max_count=100) == 100
+
+    def test_enumerate(self):
+        layouts = list(enumerate_layouts(4, 4, [2, 1]))
+        assert len(layouts) == len(set(map(tuple, layouts))) == 184
+        assert {tuple(layout) for layout in layouts} == {tuple(sorted((x, y, length, vertical or length == 1)
+                                                               for x, y, length, vertical in layout))
+                                                         for layout in brute_force(4, 4, [2, 1])}
+        assert len(list(enumerate_layouts(4, 4, [2, 1], max_count=10))) == 10
+        assert len(list(enumerate_layouts(7, 7, [4, 3, 2, 2, 1], max_count=3))) == 3
+
+    def test_occupancy(self):
+        space = LayoutSpace(5, 4, [3, 2, 1])
+        expected = Counter(y * 5 + x + shift * (not vertical) + shift * vertical * 5
+                           for layout in space.layouts() for x, y, length, vertical in layout for shift in range(length))
+        assert space.occupancy() == [expected[index] for index in range(20)]
+        assert space.total == 988
+
+    def test_observations(self):
+        field = SeaField(5, 4)
+        field.set(0, 0, Cell.MISSED)
+        field.set(2, 1, Cell.HIT)
+        field.set(4, 3, Cell.BORDER)
+        layouts = [layout for layout in enumerate_layouts(5, 4, [3, 2, 1])
+                   if not any(cell in ((0, 0), (4, 3)) for cell in self.cells(layout))
+                   and (2, 1) in self.cells(layout)]
+        assert count_layouts(5, 4, [3, 2, 1], field) == len(layouts)
+        probabilities = occupancy_probabilities(field, [3, 2, 1])
+        assert probabilities[field.index(2, 1)] == 1.0
+        assert probabilities[0] == probabilities[19] == 0.0
+        assert 0 < probabilities[field.index(2, 0)] < 1
+
+    @staticmethod
+    def cells(layout):
+        return {(x + shift * (not vertical), y + shift * vertical)
+                for x, y, length, vertical in layout for shift in range(length)}
@@ -0,0 +1,127 @@
+import random
+import unittest
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.journal import ChangeJournal
+from seawar_skeleton.seaplayground import SIGNALS, Cell, SeaField, SeaPlayground
+from seawar_skeleton.sparse import SparseSeaField
+
+
+class ForkTest(unittest.TestCase):
+    field_class = SeaField
+
+    def setUp(self):
+        self.field = self.field_class(8, 8)
+        SeaPlayground.put_ships_random(self.field, [3, 2, 1], random.Random(1))
+        self.snapshot = self.field.to_bytes()
+
+    def test_fork_shares_until_write(self):
+        child = self.field.fork()
+        assert child.to_bytes() == self.snapshot and child.ships() == self.field.ships()
+        for coord_x, coord_y in child.cells:
+            SeaPlayground.income_shoot_to(child, coord_x, coord_y)
+        assert not child.has_any_alive_ship() and self.field.has_any_alive_ship()
+        assert self.field.to_bytes() == self.snapshot
+        SeaPlayground.income_shoot_to(self.field, 0, 0)
+        assert child.get(0, 0) in (Cell.MISSED, Cell.HIT)
+
+    def test_parent_write_after_fork(self):
+        child = self.field.fork()
+        self.field.clear()
+        assert child.to_bytes() == self.snapshot and len(child.ships()) == 3
+        child.set_ship(0, 7, 1)
+        assert len(child.ships()) == 4 and not self.field.ships()
+
+    def test_nested_forks(self):
+        child = self.field.fork()
+        grandchild = child.fork()
+        grandchild.set(7, 7, Cell.MISSED)
+        sibling = child.fork()
+        sibling.set(6, 7, Cell.MISSED)
+        assert child.to_bytes() == self.field.to_bytes() == self.snapshot
+        assert grandchild.get(7, 7) == Cell.MISSED and sibling.get(7, 7) == child.get(7, 7)
+        assert sibling.get(6, 7) == Cell.MISSED and grandchild.get(6, 7) == child.get(6, 7)
+
+    def test_fork_placement(self):
+        child = self.field.fork()
+        SeaPlayground.put_ships_random(child, [2, 1], random.Random(2))
+        assert len(child.ships()) == 5 and self.field.to_bytes() == self.snapshot
+        assert child.suitable_cells(1) == self.field_class.from_bytes(child.to_bytes()).suitable_cells(1)
+
+    def test_rollback(self):
+        ships, alive = self.field.ships(), self.field.has_any_alive_ship()
+        assert self.field.checkpoint() == 1
+        for coord_x, coord_y in self.field.cells:
+            SeaPlayground.income_shoot_to(self.field, coord_x, coord_y)
+        shot = self.field.to_bytes()
+        assert self.field.checkpoint() == 2
+        self.field.clear()
+        self.field.set_ship(0, 0, 2)
+        self.field.rollback()
+        assert self.field.ships() == ships and not self.field.has_any_alive_ship()
+        assert self.field.to_bytes() == shot
+        self.field.rollback()
+        assert self.field.to_bytes() == self.snapshot and self.field.has_any_alive_ship() == alive
+        assert self.field.suitable_cells(3) == self.field_class.from_bytes(self.snapshot).suitable_cells(3)
+        with self.assertRaises(IndexError):
+            self.field.rollback()
+
+    def test_rollback_clear(self):
+        self.field.checkpoint()
+        self.field.clear()
+        assert not list(self.field.filled())
+        self.field.rollback()
+        assert self.field.to_bytes() == self.snapshot
+        signal = None
+        for coord_x, coord_y in self.field.cells:
+            if self.field.is_cell_ship(coord_x, coord_y):
+                signal = SeaPlayground.income_shoot_to(self.field, coord_x, coord_y)['signal']
+        assert signal == SIGNALS.WIN
+
+    def test_rollback_ship_state(self):
+        coord_x, coord_y, _ = self.field.suitable_cells(1)[0]
+        self.field.checkpoint()
+        self.field.set_ship(coord_x, coord_y, 1)
+        assert SeaPlayground.income_shoot_to(self.field, coord_x, coord_y)['signal'] == SIGNALS.KILLED
+        self.field.rollback()
+        assert self.field.ship_id_at(coord_x, coord_y) is None and len(self.field.ships()) == 3
+        ship_id = self.field.ship_id_at(*self.field.ship_cells(0)[0])
+        assert self.field.ship_health(ship_id) == len(self.field.ship_cells(ship_id))
+
+    def test_commit(self):
+        self.field.checkpoint()
+        self.field.checkpoint()
+        self.field.set(7, 7, Cell.BORDER)
+        self.field.commit()
+        self.field.rollback()
+        assert self.field.to_bytes() == self.snapshot
+        self.field.set(7, 7, Cell.BORDER)
+        assert not self.field._checkpoints
+
+    def test_fork_and_rollback(self):
+        self.field.checkpoint()
+        self.field.set(7, 7, Cell.BORDER)
+        child = self.field.fork()
+        child.checkpoint()
+        child.set(6, 6, Cell.BORDER)
+        self.field.rollback()
+        assert child.get(7, 7) == Cell.BORDER and self.field.get(7, 7) != Cell.BORDER
+        child.rollback()
+        assert child.get(6, 6) != Cell.BORDER and child.get(7, 7) == Cell.BORDER
+
+    def test_journal_not_inherited(self):
+        journal = ChangeJournal(self.field)
+        self.field.checkpoint()
+        self.field.set(7, 7, Cell.BORDER)
+        child = self.field.fork()
+        child.set(6, 6, Cell.BORDER)
+        self.field.rollback()
+        assert [index for index, *_ in journal] == [63, 63]
+
+
+class BitForkTest(ForkTest):
+    field_class = BitSeaField
+
+
+class SparseForkTest(ForkTest):
+    field_class = SparseSeaField
@@ -0,0 +1,51 @@
+import unittest
+
+from seawar_skeleton.geometry import MAX_INSTANCES, Geometry
+from seawar_skeleton.sampler import LayoutSampler
+from seawar_skeleton.seaplayground import SeaField
+
+
+class GeometryTest(unittest.TestCase):
+
+    def test_shared_per_dimension(self):
+        assert SeaField(4, 3).geometry is SeaField(4, 3).geometry is Geometry.of(4, 3)
+        assert Geometry.of(3, 4) is not Geometry.of(4, 3)
+
+    def test_bounded_caches(self):
+        recent = Geometry.of(4, 3)
+        for size in range(100, 100 + MAX_INSTANCES):
+            Geometry.of(size, 1)
+            LayoutSampler(size, 1, [1])
+            Geometry.of(4, 3)
+        assert len(Geometry._instances) == len(LayoutSampler._tables) == MAX_INSTANCES
+        assert Geometry.of(4, 3) is recent and (100, 1) not in Geometry._instances
+        huge = Geometry.of(1000, 1000)
+        assert not huge.cached and huge.line(5, 3) == (5, 6, 7) and huge.ribs(0) == (1, 1000)
+        assert not (huge._lines or huge._ribs)
+
+    def test_line(self):
+        geometry = Geometry.of(4, 3)
+        assert geometry.line(geometry.index(1, 0), 3) == (1, 2, 3)
+        assert geometry.line(geometry.index(1, 0), 3, True) == (1, 5, 9)
+        assert geometry.line(geometry.index(2, 0), 3) is None
+        assert geometry.line(geometry.index(1, 1), 3, True) is None
+
+    def test_ring(self):
+        geometry = Geometry.of(4, 4)
+        assert set(map(geometry.coord, geometry.ring(0, 2, True))) == {(1, 0), (1, 1), (0, 2), (1, 2)}
+        assert set(map(geometry.coord, geometry.ring(geometry.index(2, 3), 2))) == {(1, 2), (2, 2), (3, 2), (1, 3)}
+        assert geometry.ring(0, 2, True) is geometry.ring(0, 2, True)
+
+    def test_neighbours(self):
+        geometry = Geometry.of(3, 3)
+        assert set(geometry.corners(4)) == {0, 2, 6, 8}
+        assert set(geometry.ribs(0)) == {1, 3}
+        assert [list(ray) for ray in geometry.rays(4)] == [[3], [5], [1], [7]]
+        assert [list(ray) for ray in geometry.rays(0)] == [[], [1, 2], [], [3, 6]]
+
+    def test_off_board_fallback(self):
+        base = SeaField(4, 4)
+        assert set(base._find_border_cells(-1, 0, 2, True)) == {(0, 0), (0, 1), (0, 2)}
+        assert base._find_cell_corners(-1, -1) == [(0, 0)]
+        base.set_border(-1, -1)
+        assert base.get(0, 0) == 1
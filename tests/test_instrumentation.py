@@ -0,0 +1,90 @@
+import os
+import tempfile
+import threading
+import unittest
+from random import Random
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.instrumentation import Profiler
+from seawar_skeleton.seaplayground import SIGNALS, SeaField, SeaPlayground, ComputerPlayer
+
+
+def play(field_class=SeaField):
+    rng = Random(5)
+    field = field_class(6, 6)
+    SeaPlayground.put_ships_random(field, [3, 2, 1], rng)
+    comp = ComputerPlayer(6, 6, rng=rng)
+    while True:
+        answer = SeaPlayground.income_shoot_to(field, *comp.select_target())
+        comp.handle_shoot_answer(**answer)
+        if answer['signal'] == SIGNALS.WIN:
+            return field
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def test_disabled_restores_methods(self):
+        before = {cls: dict(vars(cls)) for cls in (SeaField, SeaPlayground, ComputerPlayer)}
+        with Profiler():
+            assert 'get' in vars(SeaField)
+        assert {cls: dict(vars(cls)) for cls in before} == before
+        assert 'get' not in vars(SeaField)
+
+    def test_nested_profilers(self):
+        before = {cls: dict(vars(cls)) for cls in (SeaField, SeaPlayground, ComputerPlayer)}
+        first, second = Profiler(), Profiler()
+        first.enable()
+        second.enable()
+        play()
+        first.disable()
+        play()
+        assert second.stats()['ComputerPlayer.select_target']['calls'] == \
+            2 * first.stats()['ComputerPlayer.select_target']['calls']
+        second.disable()
+        assert {cls: dict(vars(cls)) for cls in before} == before
+
+    def test_threads(self):
+        with Profiler() as profiler:
+            threads = [threading.Thread(target=play) for _ in range(4)]
+            [thread.start() for thread in threads]
+            [thread.join() for thread in threads]
+        assert profiler.stats()['SeaPlaygroundShips.put_ships_random']['calls'] == 4
+
+    def test_counts(self):
+        with Profiler() as profiler:
+            field = play()
+            SeaPlayground.get_suitable_cells(field, 2)
+        stats = profiler.stats()
+        assert stats['ComputerPlayer.select_target']['calls'] == stats['ComputerPlayer.handle_shoot_answer']['calls']
+        assert stats['SeaPlaygroundShoots.income_shoot_to']['calls'] == stats['ComputerPlayer.select_target']['calls']
+        assert stats['SeaField.has_any_alive_ship']['calls'] > 0
+        assert stats['SeaPlaygroundShips.get_suitable_cells']['calls'] == 1
+        assert stats['SeaPlaygroundShips.put_ships_random']['calls'] == 1
+        assert stats['SeaField.set_ship']['calls'] == 3 and stats['SeaField.set_border']['calls'] > 3
+        assert stats['SeaField.set_at']['calls'] >= stats['SeaPlaygroundShoots.income_shoot_to']['calls']
+        assert stats['SeaField.get_at']['calls'] > 0
+        for entry in stats.values():
+            assert 0 <= entry['self_seconds'] <= entry['total_seconds']
+
+    def test_inherited_methods_dispatch_by_class(self):
+        with Profiler() as profiler:
+            field = play(BitSeaField)
+        assert not field.has_any_alive_ship()
+        assert profiler.stats()['SeaField.get']['calls'] > 0
+
+    def test_exports(self):
+        with Profiler() as profiler:
+            play()
+        text = profiler.prometheus()
+        assert '# TYPE seawar_calls_total counter' in text
+        assert 'seawar_calls_total{function="ComputerPlayer.select_target"}' in text
+        assert any(line.startswith('ComputerPlayer.handle_shoot_answer;SeaPlaygroundShoots.handle_shoot_answer ')
+                   for line in profiler.collapsed().splitlines())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'stacks.txt')
+            profiler.write_collapsed(path)
+            for line in open(path):
+                stack, value = line.rsplit(' ', 1)
+                assert stack and int(value) > 0
+        profiler.reset()
+        assert profiler.stats() == {}
@@ -0,0 +1,95 @@
+import unittest
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.journal import ChangeJournal, apply_delta, decode_delta
+from seawar_skeleton.seaplayground import SIGNALS, Cell, SeaField, SeaPlayground
+from seawar_skeleton.sparse import SparseSeaField
+
+
+class ChangeJournalTest(unittest.TestCase):
+    field_class = SeaField
+
+    def setUp(self):
+        self.field = self.field_class(6, 6)
+        self.journal = ChangeJournal(self.field)
+
+    def test_records_multi_cell_writes(self):
+        self.field.set_ship(1, 1, 3)
+        assert list(self.journal) == [(index, Cell.EMPTY, Cell.SHIP) for index in (7, 8, 9)]
+        self.field.set_border(1, 1, 3)
+        assert len(self.journal) == 3 + 12
+        SeaPlayground.handle_shoot_answer(self.field, SIGNALS.HITTING, [(4, 4)])
+        assert (28, Cell.EMPTY, Cell.HIT) in self.journal.changes(15)
+        self.field.set_at(0, self.field.get_at(0))
+        assert self.journal.version == len(self.journal) == 20
+
+    def test_callbacks(self):
+        seen = []
+        callback = self.journal.subscribe(lambda *change: seen.append(change))
+        SeaPlayground.income_shoot_to(self.field, 2, 3)
+        assert seen == [(20, Cell.EMPTY, Cell.MISSED)]
+        self.journal.unsubscribe(callback)
+        self.field.set(0, 0, Cell.BORDER)
+        assert len(seen) == 1 and len(self.journal) == 2
+
+    def test_delta_sync(self):
+        mirror = self.field_class(6, 6)
+        self.field.set_ship(0, 0, 2)
+        version = apply_delta(mirror, self.journal.delta(), expected=0)
+        SeaPlayground.income_shoot_to(self.field, 0, 0)
+        self.field.set(5, 5, Cell.PROBABLY_SHIP)
+        self.field.set(5, 5, Cell.EMPTY)
+        delta = self.journal.delta(version)
+        assert decode_delta(delta) == (2, 5, [(0, Cell.HIT)])
+        assert len(delta) < len(self.field.to_bytes())
+        with self.assertRaises(ValueError):
+            apply_delta(mirror, delta, expected=version + 1)
+        assert apply_delta(mirror, delta, expected=version) == self.journal.version
+        assert mirror.to_bytes() == self.field.to_bytes()
+        with self.assertRaises(ValueError):
+            decode_delta(delta[:-1])
+
+    def test_clear(self):
+        self.field.set_ship(2, 2, 2)
+        self.field.clear()
+        assert list(self.journal.changes(2)) == [(14, Cell.SHIP, Cell.EMPTY), (15, Cell.SHIP, Cell.EMPTY)]
+        assert self.journal.net_changes() == []
+
+    def test_filled(self):
+        self.field.set_ship(2, 2, 2)
+        self.field.set(0, 5, Cell.MISSED)
+        assert list(self.field.filled()) == [(14, Cell.SHIP), (15, Cell.SHIP), (30, Cell.MISSED)]
+
+    def test_compaction(self):
+        self.journal.limit = 8
+        for index in range(10):
+            self.field.set_at(index, Cell.MISSED)
+        assert self.journal.base == 5 and self.journal.version == 10 and len(self.journal) == 5
+        with self.assertRaises(ValueError):
+            self.journal.delta(4)
+        assert self.journal.compact(8) == 3
+        assert list(self.journal) == [(8, Cell.EMPTY, Cell.MISSED), (9, Cell.EMPTY, Cell.MISSED)]
+        assert self.journal.compact() == 2 and not list(self.journal)
+
+    def test_detach(self):
+        with self.assertRaises(ValueError):
+            ChangeJournal(self.field)
+        self.journal.detach()
+        self.field.set_ship(0, 0, 1)
+        assert self.journal.version == 0
+        assert ChangeJournal(self.field).field is self.field
+
+
+class BitChangeJournalTest(ChangeJournalTest):
+    field_class = BitSeaField
+
+
+class SparseChangeJournalTest(ChangeJournalTest):
+    field_class = SparseSeaField
+
+    def test_clear_huge(self):
+        field = SparseSeaField(10000, 10000)
+        journal = ChangeJournal(field)
+        field.set(9999, 9999, Cell.MISSED)
+        field.clear()
+        assert list(journal) == [(10 ** 8 - 1, Cell.EMPTY, Cell.MISSED), (10 ** 8 - 1, Cell.MISSED, Cell.EMPTY)]
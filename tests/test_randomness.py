@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.randomness import GeneratorRandom, as_random, derive_seed
+from seawar_skeleton.seaplayground import SeaField, SeaPlayground, ComputerPlayer
+from seawar_skeleton.targeting import DensityTargeting
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def layout(field_class, rng):
+    field = field_class()
+    SeaPlayground.put_ships_random(field, rng=rng)
+    return field.ships()
+
+
+class RandomnessTest(unittest.TestCase):
+
+    def test_as_random(self):
+        rng = random.Random(1)
+        assert as_random(None) is None
+        assert as_random(rng) is rng
+        assert as_random(5).random() == random.Random(5).random()
+        with self.assertRaises(TypeError):
+            as_random('seed')
+
+    def test_derive_seed(self):
+        assert derive_seed(1, 2) == derive_seed(1, 2)
+        assert derive_seed(1, 2) != derive_seed(1, 3) != derive_seed(2, 2)
+
+    def test_placement_is_reproducible(self):
+        for field_class in (SeaField, BitSeaField):
+            random.seed(0)
+            first = layout(field_class, random.Random(42))
+            random.seed(1)
+            assert layout(field_class, 42) == first
+            assert layout(field_class, 43) != first
+
+    def test_targeting_is_reproducible(self):
+        for strategy in (lambda rng: None, lambda rng: DensityTargeting(rng=rng)):
+            targets = []
+            for _ in range(2):
+                rng = random.Random(9)
+                comp = ComputerPlayer(strategy=strategy(rng), rng=rng)
+                targets.append([comp.select_target() for _ in range(10)])
+            assert targets[0] == targets[1]
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy_generator(self):
+        rng = as_random(numpy.random.default_rng(3))
+        assert isinstance(rng, GeneratorRandom)
+        assert 0 <= rng.randrange(7) < 7 and 0 <= rng.random() < 1
+        assert layout(SeaField, numpy.random.default_rng(3)) == layout(SeaField, numpy.random.default_rng(3))
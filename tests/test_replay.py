@@ -0,0 +1,85 @@
+import io
+import random
+import unittest
+
+from seawar_skeleton.replay import ReplayWriter, GameRecord, read_games
+from seawar_skeleton.seaplayground import SIGNALS, Cell, SeaField, SeaPlayground, ComputerPlayer
+
+
+def cell_values(field):
+    return [field.get(*cell) for cell in field.cells]
+
+
+class ReplayTest(unittest.TestCase):
+
+    def record_games(self, games, keyframe_interval=8):
+        stream = io.BytesIO()
+        writer = ReplayWriter(stream, keyframe_interval)
+        played = []
+        for seed in range(games):
+            random.seed(seed)
+            enemy_field, comp = SeaField(), ComputerPlayer()
+            SeaPlayground.put_ships_random(enemy_field)
+            writer.begin_game(enemy_field)
+            history = []
+            while writer.play_shot_by_computer(comp, enemy_field)['signal'] != SIGNALS.WIN:
+                history.append(cell_values(comp.target_field))
+            history.append(cell_values(comp.target_field))
+            played.append((enemy_field, comp, history))
+        stream.seek(0)
+        return stream, played
+
+    def test_read_games(self):
+        stream, played = self.record_games(3)
+        games = list(read_games(stream))
+        assert len(games) == 3
+        for game, (enemy_field, comp, history) in zip(games, played):
+            assert len(game.shots) == len(history)
+            assert sorted(game.keyframes) == list(range(8, len(history) + 1, 8))
+            final = game.state_at(len(game.shots))
+            assert cell_values(final.enemy_field) == cell_values(enemy_field)
+            assert cell_values(final.comp.target_field) == cell_values(comp.target_field)
+            assert not final.enemy_field.has_any_alive_ship()
+
+    def test_seek_matches_replay_from_start(self):
+        stream, played = self.record_games(1)
+        game = next(read_games(stream))
+        history = played[0][2]
+        states = list(game.states())
+        for shot_number, state in enumerate(states):
+            assert state.shots == shot_number
+            if shot_number:
+                assert cell_values(state.comp.target_field) == history[shot_number - 1]
+        assert states[0].enemy_field.has_any_alive_ship() and not states[-1].enemy_field.has_any_alive_ship()
+        for shot_number in (0, 7, 8, 9, 17, len(history)):
+            state = game.state_at(shot_number)
+            replayed = GameRecord(game.max_x, game.max_y, game.ships)
+            replayed.shots = game.shots
+            assert cell_values(state.comp.target_field) == cell_values(replayed.state_at(shot_number).comp.target_field)
+        with self.assertRaises(IndexError):
+            game.state_at(len(history) + 1)
+
+    def test_compact(self):
+        stream, played = self.record_games(1, keyframe_interval=0)
+        assert len(stream.getvalue()) < 20 * len(played[0][2]) + 100
+
+    def test_header(self):
+        stream, _ = self.record_games(1)
+        data = stream.getvalue()
+        for bad in (b'XXXX' + data[4:], data[:4] + bytes([99]) + data[5:], b''):
+            with self.assertRaises((ValueError, EOFError)):
+                list(read_games(io.BytesIO(bad)))
+
+    def test_layout_from_cells(self):
+        field = SeaField(5, 5)
+        for index in (0, 1, 12, 22):
+            field.set_at(index, Cell.SHIP)
+        assert sorted(ReplayWriter.layout(field)) == [(0, 0, 2, False), (2, 2, 1, True), (2, 4, 1, True)]
+        field.set_at(2, Cell.MISSED)
+        with self.assertRaises(ValueError):
+            ReplayWriter(io.BytesIO()).begin_game(field)
+
+    def test_truncated(self):
+        stream, _ = self.record_games(1)
+        with self.assertRaises(EOFError):
+            list(read_games(io.BytesIO(stream.getvalue()[:-3])))
@@ -0,0 +1,91 @@
+import threading
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import count
+
+from seawar_skeleton.sampler import CHECK_EVERY, LayoutSampler, posterior_heat
+from seawar_skeleton.seaplayground import SeaField, SeaPlayground, ComputerPlayer, Cell, SIGNALS
+from seawar_skeleton.simulation import play_game
+from seawar_skeleton.targeting import MonteCarloTargeting
+
+
+def thread_ticks():
+    local = threading.local()
+
+    def clock():
+        local.now = getattr(local, 'now', -1) + 1
+        return local.now
+    return clock
+
+
+class LayoutSamplerTest(unittest.TestCase):
+
+    def observed(self):
+        enemy_field = SeaField()
+        SeaPlayground.put_ships_random(enemy_field, rng=4)
+        comp = ComputerPlayer(rng=4)
+        killed = 0
+        while killed < 2:
+            answer = SeaPlayground.make_shoot_by_computer(comp, enemy_field)
+            killed += answer['signal'] == SIGNALS.KILLED
+        SeaPlayground.make_shoot_by_computer(comp, enemy_field)
+        return comp.target_field
+
+    def test_samples_are_consistent(self):
+        field = self.observed()
+        sampler = LayoutSampler.from_field(field, rng=1)
+        assert len(sampler.fixed) == 2
+        layouts = list(sampler.layouts(50))
+        assert layouts
+        for layout in layouts:
+            assert sorted(length for _, _, length, _ in layout) == sorted([4, 3, 3, 2, 2, 2, 1, 1, 1, 1])
+            board = SeaField()
+            for ship in layout:
+                SeaPlayground.put_ship(board, *ship)
+            for cell in field.cells:
+                if field.get(*cell) == Cell.HIT:
+                    assert board.is_cell_ship(*cell)
+                elif field.get(*cell) in (Cell.MISSED, Cell.BORDER):
+                    assert not board.is_cell_ship(*cell)
+
+    def test_heat_map(self):
+        field = SeaField(5, 5)
+        heat, samples = LayoutSampler.from_field(field, [2], rng=2).heat_map(budget=10, max_samples=400)
+        assert samples == 400
+        assert sum(heat) == 800
+        assert heat[field.index(2, 2)] > heat[0]
+        assert LayoutSampler(2, 2, [3]).heat_map(max_samples=5) == ([0] * 4, 0)
+
+    def test_budget(self):
+        # the fake clock advances one unit per check, so a budget of 3 allows exactly 3 * CHECK_EVERY draws
+        heat, samples = posterior_heat(SeaField(), budget=3, rng=3, clock=partial(next, count()))
+        assert 0 < samples <= 3 * CHECK_EVERY
+        assert sum(heat) == samples * 20
+        assert LayoutSampler(5, 5, [2], rng=3).heat_map(budget=3, clock=partial(next, count()))[1] == 3 * CHECK_EVERY
+
+    def test_executor(self):
+        field = self.observed()
+        with ThreadPoolExecutor(2) as executor:
+            heat, samples = posterior_heat(field, max_samples=40, budget=10, rng=5, executor=executor, workers=2)
+        assert samples == 40
+        assert all(heat[index] == samples for index in range(100) if field.get_at(index) == Cell.HIT)
+
+    def test_executor_budget(self):
+        with ThreadPoolExecutor(1) as executor:
+            heat, samples = posterior_heat(SeaField(5, 5), [2], budget=3, rng=5, executor=executor, workers=2,
+                                           clock=thread_ticks())
+        assert samples == 2 * 3 * CHECK_EVERY
+        assert sum(heat) == samples * 2
+
+    def test_executor_drops_late_workers(self):
+        late = Future()
+        executor = type('StuckExecutor', (), dict(submit=lambda self, *args: late))()
+        assert posterior_heat(SeaField(5, 5), [2], budget=0.01, rng=5, executor=executor) == ([0] * 25, 0)
+        assert late.cancelled()
+
+    def test_targeting(self):
+        comp = ComputerPlayer(5, 5, MonteCarloTargeting([2], rng=1, max_samples=200, budget=10))
+        comp.handle_shoot_answer(SIGNALS.HITTING, [(0, 2)])
+        assert comp.select_target() in {(0, 1), (1, 2), (0, 3)}
+        assert play_game(6, 6, [3, 2, 1], partial(MonteCarloTargeting, [3, 2, 1], max_samples=30, budget=10), 7) <= 36
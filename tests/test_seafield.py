@@ -1,4 +1,6 @@
+import random
 import unittest
+from array import array
 from itertools import chain, starmap
 
 from seawar_skeleton.seaplayground import SeaPlayground, Cell, IncorrectShipPosition, NoSpaceLeft, SeaField, \
@@ -6,9 +8,10 @@ from seawar_skeleton.seaplayground import SeaPlayground, Cell, IncorrectShipPosi
 
 
 class SeaFieldTest(unittest.TestCase):
+    field_class = SeaField
 
     def test_has_any_alive_ship(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set_ship(1, 1, 2)
         assert base.has_any_alive_ship() is True
         base.set(0, 1, Cell.HIT)
@@ -18,15 +21,45 @@ class SeaFieldTest(unittest.TestCase):
         base.set(2, 1, Cell.HIT)
         assert base.has_any_alive_ship() is False
 
+    def test_ship_health(self):
+        base = self.field_class(5, 5)
+        base.set_ship(1, 1, 3)
+        ship_id = base.ship_id_at(2, 1)
+        assert base.ship_id_at(0, 0) is None
+        assert base.ship_cells(ship_id) == [(1, 1), (2, 1), (3, 1)]
+        assert base.ship_health(ship_id) == 3
+        base.set(2, 1, Cell.HIT)
+        base.set(2, 1, Cell.HIT)
+        assert base.ship_health(ship_id) == 2
+        base.set(0, 4, Cell.SHIP)
+        base.set(1, 1, Cell.HIT)
+        base.set(3, 1, Cell.HIT)
+        assert base.ship_health(ship_id) == 0
+        assert base.has_any_alive_ship() is True
+        base.set(0, 4, Cell.HIT)
+        assert base.has_any_alive_ship() is False
+
+    def test_cells_views(self):
+        base = self.field_class(3, 2)
+        base.set(2, 1, Cell.HIT)
+        assert len(base.cells) == len(base._cells) == 6
+        assert list(base.cells) == [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1)]
+        assert base.cells[5] == (2, 1)
+        assert base._cells[5].value is Cell.HIT
+        assert base.get_at(base.index(2, 1)) == Cell.HIT
+        with self.assertRaises(IndexError):
+            base.cells[6]
+
 
 class SeaPlaygroundTest(unittest.TestCase):
+    field_class = SeaField
 
     def test_create(self):
-        base = SeaField()
+        base = self.field_class()
         assert len(base._cells) == 100
 
     def test_set_ship(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set_ship(1, 1, 3)
         ship = [(1, 1), (2, 1), (3, 1)]
         for cell in base._cells:
@@ -35,8 +68,15 @@ class SeaPlaygroundTest(unittest.TestCase):
             else:
                 assert cell.value == Cell.EMPTY
 
+    def test_set_ship_off_board(self):
+        base = self.field_class(10, 10)
+        for ship in ((9, 0, 2, False), (0, 9, 2, True), (-1, 0, 1, False), (10, 10, 1, False)):
+            with self.assertRaises(IncorrectCoordinate):
+                base.set_ship(*ship)
+        assert not base.ships() and not base.has_any_alive_ship()
+
     def test_set_border(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set_border(1, 1, 3)
         border = [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0),
                   (0, 1), (4, 1),
@@ -48,7 +88,7 @@ class SeaPlaygroundTest(unittest.TestCase):
                 assert cell.value == Cell.EMPTY
 
     def test_set_border_edge(self):
-        base = SeaField(4, 4)
+        base = self.field_class(4, 4)
         base.set_border(0, 0, 2, True)
         base.set_border(2, 3, 2)
         border = [(1, 0), (1, 1), (0, 2), (1, 2),
@@ -60,7 +100,7 @@ class SeaPlaygroundTest(unittest.TestCase):
                 assert cell.value == Cell.EMPTY
 
     def test_put_ship(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         SeaPlayground.put_ship(base, 2, 1, 3, True)
         ship = [(2, 1), (2, 2), (2, 3)]
         border = [(1, 0), (1, 1), (1, 2), (1, 3), (1, 4),
@@ -76,7 +116,7 @@ class SeaPlaygroundTest(unittest.TestCase):
                 assert cell.value == Cell.EMPTY
 
     def test_suitable_cell(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         assert base.is_cell_suitable(1, 1, 1)
         assert base.is_cell_suitable(1, 1, 3)
         assert base.is_cell_suitable(1, 1, 3, True)
@@ -91,7 +131,7 @@ class SeaPlaygroundTest(unittest.TestCase):
         assert not base.is_cell_suitable(0, 2, 2, True)
 
     def test_incorrect_placement(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         SeaPlayground.put_ship(base, 1, 1, 3)
         with self.assertRaises(IncorrectCoordinate):
             SeaPlayground.put_ship(base, -1, 2, 2, True)
@@ -99,7 +139,7 @@ class SeaPlaygroundTest(unittest.TestCase):
             SeaPlayground.put_ship(base, 0, 2, 2, True)
 
     def test_get_suitable_cells(self):
-        base = SeaField(3, 3)
+        base = self.field_class(3, 3)
         SeaPlayground.put_ship(base, 0, 0, 1)
         assert SeaPlayground.get_suitable_cells(base, 3) == [(2, 0, True), (0, 2, False)]
         assert SeaPlayground.get_suitable_cells(base, 2) == [(2, 0, True), (2, 1, True), (0, 2, False), (1, 2, False)]
@@ -108,20 +148,45 @@ class SeaPlaygroundTest(unittest.TestCase):
                                                              (0, 2, True), (0, 2, False), (1, 2, True), (1, 2, False),
                                                              (2, 2, True), (2, 2, False)]
 
+    def test_suitable_cells_follow_changes(self):
+        base = self.field_class(3, 3)
+        assert len(SeaPlayground.get_suitable_cells(base, 3)) == 6
+        base.set(1, 1, Cell.MISSED)
+        assert SeaPlayground.get_suitable_cells(base, 3) == [(0, 0, True), (0, 0, False), (2, 0, True),
+                                                             (0, 2, False)]
+        base.set(1, 1, Cell.PROBABLY_SHIP)
+        assert len(SeaPlayground.get_suitable_cells(base, 3)) == 6
+        SeaPlayground.put_ship(base, 0, 0, 1)
+        assert SeaPlayground.get_suitable_cells(base, 3) == [(2, 0, True), (0, 2, False)]
+
     def test_put_random_ship(self):
-        base = SeaField(4, 4)
+        base = self.field_class(4, 4)
         SeaPlayground._put_ship_random(base, 3)
         with self.assertRaises(NoSpaceLeft):
             SeaPlayground._put_ship_random(base, 3)
             SeaPlayground._put_ship_random(base, 3)
 
     def test_put_random_many(self):
-        base = SeaField()
+        base = self.field_class()
         SeaPlayground.put_ships_random(base)
         assert len([cell for cell in base._cells if cell.value == Cell.SHIP]) == 20
+        assert not base._candidates
+        with self.assertRaises(NoSpaceLeft):
+            SeaPlayground.put_ships_random(base, [4] * 20)
+        assert not base._candidates
+
+    def test_put_random_keeps_candidate_index(self):
+        base = self.field_class(8, 8)
+        base.suitable_cells(2)
+        before = base.candidate_keys()
+        SeaPlayground.put_ships_random(base, [3, 2, 1], random.Random(1))
+        assert base.candidate_keys() == before
+        kept = base.suitable_cells(2)
+        base.reset_candidates()
+        assert not base.candidate_keys() and base.suitable_cells(2) == kept
 
     def test_income_shoot(self):
-        base = SeaField()
+        base = self.field_class()
         SeaPlayground.put_ship(base, 2, 2, 3)
         assert SeaPlayground.income_shoot_to(base, 3, 0) == dict(signal=SIGNALS.MISS, cells=[(3, 0)])
         assert SeaPlayground.income_shoot_to(base, 3, 1) == dict(signal=SIGNALS.MISS, cells=[(3, 1)])
@@ -130,14 +195,35 @@ class SeaPlaygroundTest(unittest.TestCase):
         assert SeaPlayground.income_shoot_to(base, 3, 4) == dict(signal=SIGNALS.MISS, cells=[(3, 4)])
 
     def test_incorrect_income_shoot(self):
-        base = SeaField()
+        base = self.field_class()
         with self.assertRaises(IncorrectCoordinate):
             SeaPlayground.income_shoot_to(base, -3, 0)
         with self.assertRaises(IncorrectCoordinate):
             SeaPlayground.income_shoot_to(base, 11, 0)
 
+    def test_shoot_many(self):
+        base = self.field_class(5, 5)
+        SeaPlayground.put_ship(base, 1, 1, 2)
+        SeaPlayground.put_ship(base, 4, 2, 2, True)
+        signals, offsets, cells = SeaPlayground.shoot_many(base, [0, 1, 2, 4, 4], [0, 1, 1, 2, 3])
+        assert list(signals) == [SIGNALS.MISS, SIGNALS.HITTING, SIGNALS.KILLED, SIGNALS.HITTING, SIGNALS.WIN]
+        assert list(offsets) == [0, 1, 2, 4, 5, 7]
+        assert [base.coord(index) for index in cells[offsets[2]:offsets[3]]] == [(1, 1), (2, 1)]
+        assert [base.coord(index) for index in cells[offsets[4]:offsets[5]]] == [(4, 2), (4, 3)]
+        base = self.field_class(5, 5)
+        with self.assertRaises(IncorrectCoordinate):
+            SeaPlayground.shoot_many(base, [0, 5], [0, 0])
+        with self.assertRaises(TypeError):
+            SeaPlayground.shoot_many(base, [0, 1.5], [0, 0])
+        with self.assertRaises(ValueError):
+            SeaPlayground.shoot_many(base, [0, 1], [0, 0], signals=array('b', [0]))
+        with self.assertRaises(ValueError):
+            SeaPlayground.shoot_many(base, [0, 1], [0, 0], cells=memoryview(bytearray(16)).cast('l'))
+        assert base.get(0, 0) == Cell.EMPTY
+        assert list(SeaPlayground.shoot_many(base, [0, 1], [0, 0], cells=[])[2]) == [0, 1]
+
     def test_target_anwer_mark_cell(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         SeaPlayground._shoot_answer_mark_cell(base, SIGNALS.MISS, [(1, 1)])
         SeaPlayground._shoot_answer_mark_cell(base, SIGNALS.HITTING, [(2, 2)])
         SeaPlayground._shoot_answer_mark_cell(base, SIGNALS.MISS, [(3, 3)])
@@ -150,28 +236,28 @@ class SeaPlaygroundTest(unittest.TestCase):
                 assert cell.value == Cell.EMPTY
 
     def test_find_ship(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         SeaPlayground.put_ship(base, 1, 1, 3)
         assert base.find_ship_by_cells(2, 1) == {(1, 1), (2, 1), (3, 1)}
 
     def test_find_ship_vertical(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         SeaPlayground.put_ship(base, 1, 1, 3, True)
         assert base.find_ship_by_cells(1, 2) == {(1, 1), (1, 2), (1, 3)}
 
     def test_find_abcent(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         assert base.find_ship_by_cells(1, 2) == set()
 
     def test_is_killed_ship_alive(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set(1, 2, Cell.SHIP)
         base.set(1, 3, Cell.SHIP)
         base.set(1, 4, Cell.SHIP)
         assert SeaPlayground._get_killed_ship(base, 1, 3) == []
 
     def test_is_killed_ship_injured(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set(1, 2, Cell.HIT)
         base.set(1, 3, Cell.HIT)
         base.set(1, 4, Cell.SHIP)
@@ -183,7 +269,7 @@ class SeaPlaygroundTest(unittest.TestCase):
         assert SeaPlayground._get_killed_ship(base, 1, 3) == []
 
     def test_is_killed_ship_killed(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set(1, 2, Cell.HIT)
         base.set(1, 3, Cell.HIT)
         base.set(1, 4, Cell.HIT)
@@ -194,7 +280,7 @@ class SeaPlaygroundTest(unittest.TestCase):
         assert SeaField.find_ship_vector([(1, 0), (1, 1), (1, 2), (1, 3)]) == (1, 0, 4, True)
 
     def test_answer_target_mark_border(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         base.set(2, 2, Cell.MISSED)
         SeaPlayground._shoot_answer_mark_border(base, SIGNALS.KILLED, [(0, 0)])
         SeaPlayground._shoot_answer_mark_border(base, SIGNALS.HITTING, [(3, 3)])
@@ -210,7 +296,7 @@ class SeaPlaygroundTest(unittest.TestCase):
                 assert cell.value == Cell.EMPTY
 
     def test_answer_target_incorrect_cell(self):
-        base = SeaField(4, 4)
+        base = self.field_class(4, 4)
         with self.assertRaises(IncorrectCoordinate):
             SeaPlayground.handle_shoot_answer(base, SIGNALS.HITTING, [(-1, 0)])
         with self.assertRaises(IncorrectCoordinate):
@@ -219,7 +305,7 @@ class SeaPlaygroundTest(unittest.TestCase):
             SeaPlayground.handle_shoot_answer(base, SIGNALS.HITTING, [(i, i) for i in range(10)])
 
     def test_answet_target(self):
-        base = SeaField(4, 4)
+        base = self.field_class(4, 4)
         SeaPlayground.handle_shoot_answer(base, SIGNALS.HITTING, [(0, 1)])
         SeaPlayground.handle_shoot_answer(base, SIGNALS.MISS, [(1, 1)])
         SeaPlayground.handle_shoot_answer(base, SIGNALS.MISS, [(2, 1)])
@@ -235,12 +321,13 @@ class SeaPlaygroundTest(unittest.TestCase):
                 assert cell.value == Cell.EMPTY
 
     def test_find_corners(self):
-        base = SeaField(5, 5)
+        base = self.field_class(5, 5)
         assert set(base._find_cell_corners(3, 3)) == {(2, 2), (4, 2), (2, 4), (4, 4)}
         assert set(base._find_cell_corners(0, 0)) == {(1, 1)}
 
 
 class ComputerPlayerTest(unittest.TestCase):
+    field_class = SeaField
 
     def test_find_target(self):
         comp = ComputerPlayer(2, 2)
@@ -283,7 +370,7 @@ class ComputerPlayerTest(unittest.TestCase):
         assert set(probably_cells()) == set()
 
     def test_make_shoots(self):
-        enemy_field = SeaField()
+        enemy_field = self.field_class()
         comp = ComputerPlayer()
 
         SeaPlayground.put_ship(enemy_field, 1, 3, 3)
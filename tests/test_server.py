@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+
+from seawar_skeleton.seaplayground import SIGNALS, Cell, SeaField
+from seawar_skeleton.server import FieldPool, GameServer, GameClient, ProtocolError, run_load
+
+
+class FieldPoolTest(unittest.TestCase):
+
+    def test_reuse_cleared_fields(self):
+        pool = FieldPool(size=1)
+        field = pool.get(5, 5)
+        field.set_ship(0, 0, 2)
+        pool.release(field)
+        pool.release(SeaField(5, 5))
+        reused = pool.get(5, 5)
+        assert reused is field and pool.reused == 1
+        assert not reused.has_any_alive_ship() and reused.get(0, 0) == Cell.EMPTY and reused.ships() == []
+        assert pool.get(5, 5) is not field
+
+
+class GameServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = GameServer(idle_timeout=60)
+        listener = await self.server.start(port=0)
+        self.port = listener.sockets[0].getsockname()[1]
+        self.client = await GameClient.connect(port=self.port)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_game(self):
+        game = (await self.client.request('new', max_x=4, max_y=4, fleet=[1]))['game']
+        session = self.server.sessions[game]
+        (x, y, _, _), = session.computer_field.ships()
+        miss = next(cell for cell in session.computer_field.cells if cell != (x, y))
+        assert (await self.client.request('shoot', game=game, x=miss[0], y=miss[1]))['answer']['signal'] == \
+            SIGNALS.MISS
+        answer = (await self.client.request('computer', game=game))['answer']
+        assert answer['signal'] in (SIGNALS.MISS, SIGNALS.WIN)
+        if answer['signal'] == SIGNALS.MISS:
+            assert (await self.client.request('shoot', game=game, x=x, y=y))['answer'] == \
+                dict(signal=SIGNALS.WIN, cells=[[x, y]])
+        with self.assertRaises(ProtocolError):
+            await self.client.request('shoot', game=game, x=x, y=y)
+        await self.client.request('close', game=game)
+        assert game not in self.server.sessions
+
+    async def test_errors(self):
+        game = (await self.client.request('new'))['game']
+        for op, params in (('shoot', dict(game=game, x=10, y=0)), ('shoot', dict(game='nope', x=0, y=0)),
+                           ('fly', {}), ('new', dict(max_x=2, max_y=2))):
+            with self.assertRaises(ProtocolError):
+                await self.client.request(op, **params)
+        for line in (b'not json\n', b'[1, 2]\n', b'"x"\n'):
+            self.client.writer.write(line)
+            assert b'"ok": false' in await self.client.reader.readline()
+        assert (await self.client.request('new'))['game']
+
+    async def test_new_limits(self):
+        free = sum(len(fields) for fields in self.server.pool._free.values())
+        for params in (dict(max_x=1e10), dict(max_x=10 ** 10), dict(max_y=0), dict(max_x='5'), dict(fleet=[0]),
+                       dict(fleet=3), dict(fleet=[11]), dict(max_x=2, max_y=2, fleet=[2, 2, 1])):
+            with self.assertRaises(ProtocolError):
+                await self.client.request('new', **params)
+        with self.assertRaises(ProtocolError):
+            await self.client.request('new', max_x=3, max_y=3, fleet=[3, 3, 3])
+        assert not self.server.sessions
+        assert sum(len(fields) for fields in self.server.pool._free.values()) == free + 3
+
+    async def test_internal_error(self):
+        async def broken(request):
+            raise RuntimeError('boom')
+        self.server.op_broken = broken
+        with self.assertRaisesRegex(ProtocolError, 'InternalError'):
+            await self.client.request('broken')
+        assert (await self.client.request('stats'))['sessions'] == 0
+
+    async def test_evict_idle(self):
+        game = (await self.client.request('new'))['game']
+        assert self.server.evict_idle() == 0
+        assert self.server.evict_idle(now=asyncio.get_running_loop().time() + 10 ** 6) == 1
+        assert game not in self.server.sessions
+        await self.client.request('new')
+        assert self.server.pool.reused == 3
+
+    async def test_load(self):
+        report = await run_load(6, concurrency=3, port=self.port, seed=1)
+        assert report['games'] == 6
+        assert report['latency']['shoot']['p99'] >= report['latency']['shoot']['p50'] > 0
+        stats = await self.client.request('stats')
+        assert stats['sessions'] == 0 and stats['latency']['computer']['count'] > 0
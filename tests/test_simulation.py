@@ -0,0 +1,28 @@
+import unittest
+from random import Random
+
+from seawar_skeleton.simulation import ShotStats, play_game, simulate
+
+
+class SimulationTest(unittest.TestCase):
+
+    def test_play_game(self):
+        shots = play_game(4, 4, [2, 1])
+        assert 3 <= shots <= 16
+        assert play_game(rng=Random(3)) == play_game(rng=Random(3))
+
+    def test_shot_stats(self):
+        stats = ShotStats()
+        [stats.add(shots) for shots in (10, 20, 20, 30)]
+        stats.merge(ShotStats({40: 1}))
+        assert stats.games == 5
+        assert stats.mean == 24
+        assert stats.percentile(50) == 20
+        assert stats.percentile(100) == 40
+        assert stats.as_dict()['histogram'] == {10: 1, 20: 2, 30: 1, 40: 1}
+
+    def test_simulate_is_reproducible(self):
+        serial = simulate(30, workers=0, seed=7, chunk_size=4, max_x=5, max_y=5, fleet=[3, 1])
+        parallel = simulate(30, workers=2, seed=7, chunk_size=7, max_x=5, max_y=5, fleet=[3, 1])
+        assert serial.games == 30
+        assert serial.histogram == parallel.histogram
@@ -0,0 +1,104 @@
+import os
+import random
+import tempfile
+import unittest
+
+from seawar_skeleton.bitboard import BitSeaField
+from seawar_skeleton.seaplayground import SNAPSHOT_HEADER, SeaField, SeaPlayground, ComputerPlayer, Cell, SIGNALS
+from seawar_skeleton.snapshot import BoardArchive
+
+
+def placed_field(seed, max_x=10, max_y=10):
+    random.seed(seed)
+    field = SeaField(max_x, max_y)
+    SeaPlayground.put_ships_random(field, [3, 2, 1])
+    field.set(0, 0, Cell.MISSED)
+    field.set(max_x - 1, max_y - 1, Cell.PROBABLY_SHIP)
+    return field
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def test_roundtrip(self):
+        field = placed_field(1, 7, 5)
+        data = field.to_bytes()
+        assert len(data) == SeaField.snapshot_size(7, 5) == 14 + 18
+        for loaded in (SeaField.from_buffer(data), SeaField.from_bytes(data), BitSeaField.from_buffer(data)):
+            assert (loaded.max_x, loaded.max_y) == (7, 5)
+            assert [loaded.get(*cell) for cell in loaded.cells] == [field.get(*cell) for cell in field.cells]
+            assert loaded.has_any_alive_ship()
+
+    def test_from_buffer_is_zero_copy(self):
+        buffer = bytearray(b'..' + placed_field(2).to_bytes())
+        field = SeaField.from_buffer(memoryview(buffer), 2)
+        field.set(5, 5, Cell.HIT)
+        assert SeaField.from_buffer(buffer, 2).get(5, 5) == Cell.HIT
+
+    def test_readonly_buffer_copies_on_write(self):
+        data = placed_field(3).to_bytes()
+        field = SeaField.from_buffer(data)
+        field.set(0, 0, Cell.HIT)
+        assert field.get(0, 0) == Cell.HIT
+        assert SeaField.from_buffer(data).get(0, 0) == Cell.MISSED
+
+    def test_shoot_restored_field(self):
+        field = SeaField(5, 5)
+        SeaPlayground.put_ship(field, 1, 1, 2)
+        restored = SeaField.from_buffer(bytearray(field.to_bytes()))
+        assert SeaPlayground.income_shoot_to(restored, 1, 1)['signal'] == SIGNALS.HITTING
+        assert SeaPlayground.income_shoot_to(restored, 2, 1) == dict(signal=SIGNALS.WIN, cells=[(1, 1), (2, 1)])
+
+    def test_reload_changed_buffer(self):
+        field = SeaField(5, 5)
+        SeaPlayground.put_ship(field, 0, 0, 1)
+        SeaPlayground.put_ship(field, 3, 3, 2)
+        buffer = bytearray(field.to_bytes())
+        assert SeaPlayground.income_shoot_to(SeaField.from_buffer(buffer), 0, 0)['signal'] == SIGNALS.KILLED
+        restored = SeaField.from_buffer(buffer)
+        assert SeaPlayground.income_shoot_to(restored, 3, 3)['signal'] == SIGNALS.HITTING
+        assert SeaPlayground.income_shoot_to(restored, 4, 3)['signal'] == SIGNALS.WIN
+
+    def test_bad_header(self):
+        with self.assertRaises(ValueError):
+            SeaField.from_buffer(b'XXXX' + SeaField().to_bytes()[4:])
+        with self.assertRaises(ValueError):
+            SeaField.from_buffer(SeaField().to_bytes()[:-1])
+        field = placed_field(4)
+        assert field.to_bytes()[4:] == SeaField.from_bytes(field.to_bytes()).to_bytes()[4:]
+        assert SNAPSHOT_HEADER.unpack_from(field.to_bytes())[-1] == 0
+
+    def test_computer_player(self):
+        comp = ComputerPlayer(5, 5)
+        comp.handle_shoot_answer(SIGNALS.HITTING, [(2, 2)])
+        restored = ComputerPlayer.from_buffer(comp.to_bytes())
+        assert restored.target_field.get(2, 2) == Cell.HIT
+        assert restored.select_target() in {(2, 1), (1, 2), (3, 2), (2, 3)}
+
+
+class BoardArchiveTest(unittest.TestCase):
+
+    def test_archive(self):
+        fields = [placed_field(seed, 6, 4) for seed in range(5)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'boards.swa')
+            with BoardArchive(path, 'w', 6, 4) as archive:
+                archive.extend(fields[:3])
+                assert archive[1].get(0, 0) == Cell.MISSED
+                archive.extend(fields[3:])
+            with BoardArchive(path, 'a') as archive:
+                archive.append(fields[0])
+            with BoardArchive(path) as archive:
+                assert len(archive) == 6
+                for field, loaded in zip(fields + fields[:1], archive):
+                    assert [loaded.get(*cell) for cell in loaded.cells] == [field.get(*cell) for cell in field.cells]
+                assert archive[-1].get(5, 3) == Cell.PROBABLY_SHIP
+                with self.assertRaises(IndexError):
+                    archive[6]
+                with self.assertRaises(IOError):
+                    archive.append(fields[0])
+            with self.assertRaises(ValueError):
+                BoardArchive(path, 'x')
+            with open(path, 'r+b') as output:
+                output.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(ValueError):
+                BoardArchive(path)
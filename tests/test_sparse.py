@@ -0,0 +1,75 @@
+import random
+import unittest
+from unittest import mock
+from time import perf_counter
+
+from seawar_skeleton.seaplayground import SeaField, SeaPlayground, ComputerPlayer, Cell, SIGNALS, \
+    IncorrectCoordinate, IncorrectShipPosition
+from seawar_skeleton.sparse import SparseSeaField
+from seawar_skeleton.targeting import SparseTargeting
+from tests import test_seafield
+
+
+class SparseSeaFieldTest(test_seafield.SeaFieldTest):
+    field_class = SparseSeaField
+
+
+class SparseSeaPlaygroundTest(test_seafield.SeaPlaygroundTest):
+    field_class = SparseSeaField
+
+
+class SparseComputerPlayerTest(test_seafield.ComputerPlayerTest):
+    field_class = SparseSeaField
+
+
+class SparseSeaFieldCompatibilityTest(unittest.TestCase):
+
+    def test_same_as_seafield(self):
+        random.seed(17)
+        for _ in range(30):
+            max_x, max_y = random.randint(3, 9), random.randint(3, 9)
+            fields = SeaField(max_x, max_y), SparseSeaField(max_x, max_y)
+            for _ in range(25):
+                coord_x, coord_y = random.randrange(max_x), random.randrange(max_y)
+                length, is_vertical = random.randint(1, 4), random.random() < 0.5
+                value = random.choice([None, None, None, Cell.MISSED, Cell.HIT, Cell.PROBABLY_SHIP, Cell.EMPTY])
+                for field in fields:
+                    if value is not None:
+                        field.set(coord_x, coord_y, value)
+                    try:
+                        SeaPlayground.put_ship(field, coord_x, coord_y, length, is_vertical)
+                    except (IncorrectCoordinate, IncorrectShipPosition):
+                        pass
+                field, sparse_field = fields
+                assert [field.get(*cell) for cell in field.cells] == [sparse_field.get(*cell) for cell in field.cells]
+                assert sparse_field.occupied() == sum(field.get(*cell) != Cell.EMPTY for cell in field.cells)
+                for length in (1, 2, 3, 5, 10):
+                    assert field.suitable_cells(length) == sparse_field.suitable_cells(length)
+                    cell = sparse_field.random_suitable_cell(length, random)
+                    assert (cell is None) is not bool(field.suitable_cells(length))
+                    assert cell is None or sparse_field.is_cell_suitable(*cell[:2], length, cell[2])
+
+    def test_dense_fallback(self):
+        field = SparseSeaField(6, 6)
+        with mock.patch('seawar_skeleton.sparse.REJECTION_ATTEMPTS', 0):
+            SeaPlayground.put_ships_random(field, [3, 2, 2, 1, 1, 1], rng=2)
+        assert sorted(length for *_, length, _ in field.ships()) == [1, 1, 1, 2, 2, 3]
+        field.clear()
+        assert field.occupied() == 0 and field.suitable_cells(6)
+
+    def test_armada(self):
+        started = perf_counter()
+        field = SparseSeaField(10000, 10000)
+        SeaPlayground.put_ships_random(field, [4, 3, 3, 2, 2, 2, 1, 1, 1, 1] * 100, rng=5)
+        assert len(field.ships()) == 1000
+        assert field.occupied() < 20000
+        comp = ComputerPlayer(10000, 10000, SparseTargeting(rng=5), SparseSeaField(10000, 10000))
+        for _ in range(500):
+            SeaPlayground.make_shoot_by_computer(comp, field)
+        assert comp.target_field.occupied() >= 500
+        assert perf_counter() - started < 5
+
+    def test_targeting_finishes_off_hits(self):
+        comp = ComputerPlayer(5, 5, SparseTargeting(rng=1), SparseSeaField(5, 5))
+        comp.handle_shoot_answer(SIGNALS.HITTING, [(0, 2)])
+        assert comp.select_target() in {(0, 1), (1, 2), (0, 3)}
@@ -0,0 +1,64 @@
+import random
+import unittest
+from functools import partial
+
+from seawar_skeleton.seaplayground import SeaField, SeaPlayground, ComputerPlayer, Cell, SIGNALS
+from seawar_skeleton.simulation import simulate
+from seawar_skeleton.targeting import DensityTargeting
+
+
+class DensityTargetingTest(unittest.TestCase):
+
+    def test_initial_density(self):
+        comp = ComputerPlayer(3, 3, DensityTargeting([2, 1]))
+        assert comp.strategy.density == [3, 4, 3,
+                                         4, 5, 4,
+                                         3, 4, 3]
+        assert comp.select_target() == (1, 1)
+
+    def test_incremental_matches_recount(self):
+        random.seed(3)
+        enemy_field = SeaField()
+        SeaPlayground.put_ships_random(enemy_field)
+        comp = ComputerPlayer(strategy=DensityTargeting())
+        for _ in range(40):
+            answer = SeaPlayground.make_shoot_by_computer(comp, enemy_field)
+            recount = DensityTargeting()
+            recount.attach(comp.target_field)
+            assert comp.strategy.density == recount.density
+            assert comp.strategy.remaining == recount.remaining
+            field = comp.target_field
+            assert comp.strategy._best() == max(value for index, value in enumerate(recount.density)
+                                                if field.get_at(index) in field.EMPTY_VALUES)
+            if answer['signal'] == SIGNALS.WIN:
+                break
+
+    def test_prefers_probable_cells(self):
+        comp = ComputerPlayer(5, 5, DensityTargeting([2]))
+        comp.handle_shoot_answer(SIGNALS.HITTING, [(0, 2)])
+        assert comp.select_target() in {(0, 1), (1, 2), (0, 3)}
+        assert comp.target_field.get(*comp.select_target()) == Cell.PROBABLY_SHIP
+
+    def test_weights_placements_over_hits(self):
+        comp = ComputerPlayer(6, 6, DensityTargeting([3]))
+        before = list(comp.strategy.density)
+        comp.handle_shoot_answer(SIGNALS.HITTING, [(2, 2)])
+        comp.handle_shoot_answer(SIGNALS.MISS, [(2, 1)])
+        density = comp.strategy.density
+        assert density[comp.target_field.index(2, 3)] > before[comp.target_field.index(2, 3)]
+        assert density[comp.target_field.index(2, 4)] > density[comp.target_field.index(4, 4)]
+        assert comp.select_target() in {(2, 3), (1, 2), (3, 2)}
+
+    def test_restored_player(self):
+        comp = ComputerPlayer(6, 6, DensityTargeting([3, 1]))
+        comp.handle_shoot_answer(SIGNALS.KILLED, [(0, 0)])
+        comp.handle_shoot_answer(SIGNALS.HITTING, [(3, 3)])
+        restored = ComputerPlayer.from_buffer(comp.to_bytes(), strategy=DensityTargeting([3, 1]))
+        assert restored.strategy.remaining == comp.strategy.remaining == {3: 1}
+        assert restored.strategy.density == comp.strategy.density
+        assert restored.target_field.get(*restored.select_target()) == Cell.PROBABLY_SHIP
+
+    def test_fewer_shots_than_random(self):
+        random_stats = simulate(40, workers=0, seed=1, chunk_size=10)
+        density_stats = simulate(40, workers=0, seed=1, chunk_size=10, strategy=partial(DensityTargeting))
+        assert density_stats.mean < random_stats.mean
@@ -0,0 +1,105 @@
+import random
+import unittest
+from functools import partial
+
+from seawar_skeleton.seaplayground import Player, ComputerPlayer
+from seawar_skeleton.targeting import DensityTargeting
+from seawar_skeleton.tournament import DEFAULT_BATCH, DEFAULT_MAX_GAMES, PairStats, Tournament, elo_ratings, make_player, play_batch
+
+
+class SweepPlayer(Player):
+
+    def __init__(self, rng=None, max_x=6, max_y=6):
+        self.targets = iter([(x, y) for y in range(max_y) for x in range(max_x)])
+
+    def select_target(self):
+        return next(self.targets)
+
+    def handle_shoot_answer(self, signal, cells):
+        pass
+
+
+class FleetPlayer(SweepPlayer):
+
+    def __init__(self, rng=None, max_x=6, max_y=6, fleet=None):
+        super().__init__(rng, max_x, max_y)
+        self.fleet = fleet
+
+
+FLEET = [3, 2, 1]
+STRATEGIES = dict(density=partial(DensityTargeting, FLEET), random=None, sweep=SweepPlayer)
+
+
+class TournamentTest(unittest.TestCase):
+
+    def test_players(self):
+        with self.assertRaises(TypeError):
+            type('HalfPlayer', (Player,), dict(select_target=lambda self: (0, 0)))()
+        assert isinstance(make_player(None), ComputerPlayer)
+        assert isinstance(make_player(SweepPlayer), SweepPlayer)
+        assert isinstance(make_player(DensityTargeting).strategy, DensityTargeting)
+        with self.assertRaises(TypeError):
+            Player()
+
+    def test_player_classes_get_board(self):
+        field = make_player(ComputerPlayer, 6, 4).target_field
+        assert (field.max_x, field.max_y) == (6, 4)
+        assert make_player(FleetPlayer, 6, 6, fleet=FLEET).fleet == FLEET
+        results = Tournament(dict(computer=ComputerPlayer, sweep=SweepPlayer, fleet=FleetPlayer), seed=1, max_x=6,
+                             max_y=6, fleet=FLEET, workers=0, max_games=20).round_robin()
+        assert all(pair['games'] == 20 for pair in results['pairs'])
+
+    def test_shared_layouts(self):
+        scores = play_batch(3, 0, 10, ('random', None), ('random', None), 6, 6, FLEET)
+        assert scores == [0.5] * 10
+        assert play_batch(3, 0, 10, ('a', None), ('b', None), 6, 6, FLEET) == \
+            play_batch(3, 0, 10, ('a', None), ('b', None), 6, 6, FLEET)
+
+    def test_pair_stats(self):
+        pair = PairStats('a', 'b').merge([1.0] * 30 + [0.5] * 10)
+        assert pair.score == 0.875
+        assert pair.is_significant(min_games=40)
+        assert not pair.is_significant(min_games=41)
+        assert not PairStats('a', 'b').merge([1.0, 0.0] * 50).is_significant()
+
+    def test_sequential_error_rate(self):
+        rng, stopped, peeked = random.Random(2), 0, 0
+        for _ in range(500):
+            pair, naive = PairStats('a', 'b'), PairStats('a', 'b')
+            while pair.games < DEFAULT_MAX_GAMES and not pair.decided:
+                scores = [float(rng.random() < 0.5) for _ in range(DEFAULT_BATCH)]
+                pair.merge(scores).check(0.9)
+                naive.decided = naive.decided or naive.merge(scores).is_significant(0.9)
+            stopped += pair.decided
+            peeked += naive.decided
+        assert stopped / 500 < 0.1 < 0.3 < peeked / 500
+
+    def test_elo(self):
+        ratings = elo_ratings([PairStats('a', 'b').merge([1.0] * 75 + [0.0] * 25),
+                               PairStats('b', 'c').merge([0.5] * 100)])
+        assert round(ratings['a']['elo'] - ratings['b']['elo']) == 189
+        assert abs(ratings['b']['elo'] - ratings['c']['elo']) < 1
+        assert ratings['a']['low'] < ratings['a']['elo'] < ratings['a']['high']
+
+    def test_round_robin_stops_early(self):
+        results = Tournament(STRATEGIES, seed=1, max_x=6, max_y=6, fleet=FLEET, workers=0).round_robin()
+        pairs = {(pair['first'], pair['second']): pair for pair in results['pairs']}
+        assert pairs[('density', 'sweep')]['decided']
+        assert pairs[('density', 'sweep')]['games'] < 2000
+        assert results['ratings']['density']['elo'] > results['ratings']['sweep']['elo']
+        parallel = Tournament(STRATEGIES, seed=1, max_x=6, max_y=6, fleet=FLEET, workers=2, max_games=60)
+        serial = Tournament(STRATEGIES, seed=1, max_x=6, max_y=6, fleet=FLEET, workers=0, max_games=60)
+        assert parallel.round_robin() == serial.round_robin()
+
+    def test_pair_split_across_workers(self):
+        tournament = Tournament(STRATEGIES, seed=1, max_x=6, max_y=6, fleet=FLEET, workers=4, batch=10)
+        tasks = tournament.tasks(tournament.pair('density', 'sweep'), 4)
+        assert [(start, games) for _, start, games, *_ in tasks] == [(0, 2), (2, 3), (5, 2), (7, 3)]
+        assert sum((play_batch(*task) for task in tasks), []) == \
+            play_batch(*tournament.tasks(tournament.pair('density', 'sweep'))[0])
+
+    def test_swiss(self):
+        tournament = Tournament(STRATEGIES, seed=2, max_x=6, max_y=6, fleet=FLEET, workers=0, batch=10)
+        results = tournament.swiss(3)
+        assert sum(pair['games'] for pair in results['pairs']) == 30
+        assert tournament.points('sweep') < tournament.points('density')